@@ -0,0 +1,114 @@
+"""Cold-start benchmark: runtime type analysis vs. ahead-of-time wiring.
+
+Generates an application module with N components (each depending on up to
+three earlier ones), then measures, in fresh interpreter processes, the time
+from importing Whiskey to having resolved every component once, and the
+part of that spent after imports (registration, wiring and resolution):
+
+    analysis   - today's behavior, every signature analyzed at first resolve
+    cached     - persistent analysis cache enabled and warm (hints from SQLite)
+    compiled   - load_compiled() with a warm wiring cache, no analysis
+
+Usage:
+    python benchmarks/cold_start.py [--components 500] [--runs 7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+RUNNER = textwrap.dedent(
+    """
+    import json, sys, time
+    start = time.perf_counter()
+    from whiskey import Container
+    from whiskey.core.analysis_cache import enable_analysis_cache
+    from whiskey.core.compiler import load_compiled
+    import bench_app
+
+    imported = time.perf_counter()
+    if sys.argv[1] == "cached":
+        enable_analysis_cache(sys.argv[2] + "/analysis.sqlite3")
+    container = Container()
+    for cls in bench_app.COMPONENTS:
+        container.singleton(cls)
+    if sys.argv[1] == "compiled":
+        load_compiled(container, cache_dir=sys.argv[2])
+    for cls in bench_app.COMPONENTS:
+        container.resolve_sync(cls)
+    end = time.perf_counter()
+    print(json.dumps([end - start, end - imported]))
+    """
+)
+
+
+def write_app(directory: Path, count: int) -> None:
+    """Write a module defining ``count`` interdependent component classes."""
+    lines = []
+    for i in range(count):
+        deps = [j for j in (i - 1, i // 2, i // 3) if 0 <= j < i]
+        deps = sorted(set(deps))
+        params = ", ".join(f"c{j}: C{j}" for j in deps)
+        body = "; ".join(f"self.c{j} = c{j}" for j in deps) or "pass"
+        lines.append(
+            f"class C{i}:\n    def __init__(self{', ' if params else ''}{params}):\n        {body}\n"
+        )
+    lines.append(f"COMPONENTS = [{', '.join(f'C{i}' for i in range(count))}]\n")
+    (directory / "bench_app.py").write_text("\n".join(lines))
+
+
+def run(mode: str, directory: Path, runs: int) -> list[list[float]]:
+    """Run the resolver in fresh processes and collect timings."""
+    env = {"PYTHONPATH": f"{SRC}:{directory}", "PATH": ""}
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", RUNNER, mode, str(directory / "cache")],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(json.loads(output))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_app(directory, args.components)
+        # Warm the wiring cache (and bytecode caches for both modes)
+        modes = ("analysis", "cached", "compiled")
+        for mode in modes:
+            run(mode, directory, 1)
+
+        results = {mode: run(mode, directory, args.runs) for mode in modes}
+
+    print(f"Cold start, {args.components} components, median of {args.runs} runs:")
+    print(f"  {'':<9} {'total':>10} {'after import':>14}")
+    medians = {}
+    for mode, timings in results.items():
+        medians[mode] = [statistics.median(column) for column in zip(*timings)]
+        total, wiring = medians[mode]
+        print(f"  {mode:<9} {total * 1000:8.1f}ms {wiring * 1000:12.1f}ms")
+    for mode in modes[1:]:
+        speedups = [a / c for a, c in zip(medians["analysis"], medians[mode])]
+        print(f"  {'vs ' + mode:<9} {speedups[0]:9.2f}x {speedups[1]:13.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""Core DI benchmark suite with regression gating.
+
+Measures the hot paths of the container in-process and stores the results as
+JSON, so that two runs (e.g. main vs. a branch) can be compared:
+
+    resolve.singleton   - resolve_sync() of a cached singleton
+    resolve.transient   - resolve_sync() of a transient with two dependencies
+    resolve.scoped      - resolve_sync() of a scoped component inside its scope
+    call.container      - Container.call_sync() of a function with two injections
+    call.inject         - calling an @inject-wrapped function
+    resolve.generic     - resolve_sync(Repository[User]) via a generic implementation
+    resolve.protocol    - resolve_sync() of a Protocol satisfied by one component
+    startup.N           - Whiskey.startup() with N generated components
+    memory.component    - bytes allocated per registered component
+
+Throughput benchmarks report operations per second (higher is better); the
+others report seconds or bytes (lower is better). Each value is the best of
+``--repeat`` rounds, which is the most stable statistic for microbenchmarks.
+
+Usage:
+    python benchmarks/core.py run [--output results.json] [--sizes 100,1000,10000]
+    python benchmarks/core.py compare baseline.json results.json [--threshold 10]
+
+``compare`` prints the change of every benchmark present in both files and
+exits with status 1 if any got worse by more than ``--threshold`` percent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Generic, Protocol, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from whiskey import Container, Whiskey
+
+T = TypeVar("T")
+
+
+# Components used by the resolution benchmarks
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class Cache:
+    pass
+
+
+class Handler:
+    def __init__(self, db: Database, cache: Cache):
+        self.db = db
+        self.cache = cache
+
+
+class RequestContext:
+    pass
+
+
+class User:
+    pass
+
+
+class Repository(Generic[T]):
+    pass
+
+
+class UserRepository(Repository[User]):
+    pass
+
+
+class Notifier(Protocol):
+    def notify(self, message: str) -> None: ...
+
+
+class EmailNotifier:
+    def notify(self, message: str) -> None:
+        pass
+
+
+def handle(db: Database, cache: Cache) -> None:
+    pass
+
+
+# Measurement helpers
+
+
+def best_rate(operation: Callable[[], Any], number: int, repeat: int) -> float:
+    """Best operations per second over ``repeat`` rounds of ``number`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                operation()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed)
+    return number / best
+
+
+def make_container() -> Container:
+    container = Container()
+    container.singleton(Config)
+    container.singleton(Database)
+    container.singleton(Cache)
+    container.register(Handler)
+    container.scoped(RequestContext, scope_name="request")
+    container.register_generic_implementation(Repository[User], UserRepository)
+    container.singleton(Repository[User], UserRepository)
+    container.singleton(EmailNotifier)
+    return container
+
+
+def generated_components(count: int) -> list[type]:
+    """Create ``count`` classes, each depending on up to three earlier ones."""
+    # A module name, so the classes are not mistaken for builtins
+    namespace: dict[str, Any] = {"__name__": f"components_{count}"}
+    lines = []
+    for i in range(count):
+        deps = sorted({j for j in (i - 1, i // 2, i // 3) if 0 <= j < i})
+        params = ", ".join(f"c{j}: C{j}" for j in deps)
+        body = "; ".join(f"self.c{j} = c{j}" for j in deps) or "pass"
+        lines.append(
+            f"class C{i}:\n    def __init__(self{', ' if params else ''}{params}):\n        {body}\n"
+        )
+    exec(compile("\n".join(lines), f"<components_{count}>", "exec"), namespace)
+    return [namespace[f"C{i}"] for i in range(count)]
+
+
+def startup_time(count: int, repeat: int) -> float:
+    """Best wall time of Whiskey.startup() with ``count`` singleton components."""
+    components = generated_components(count)
+    best = float("inf")
+    for _ in range(repeat):
+        app = Whiskey()
+        for cls in components:
+            app.container.singleton(cls)
+
+        async def cycle(app: Whiskey = app) -> float:
+            start = time.perf_counter()
+            await app.startup()
+            elapsed = time.perf_counter() - start
+            await app.shutdown()
+            return elapsed
+
+        best = min(best, asyncio.run(cycle()))
+    return best
+
+
+def memory_per_component(count: int = 2000) -> float:
+    """Bytes allocated by registering one component (averaged over ``count``)."""
+    components = generated_components(count)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        container = Container()
+        for cls in components:
+            container.singleton(cls)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del container
+    return (after - before) / count
+
+
+# Suite
+
+
+def run_suite(sizes: list[int], number: int, repeat: int) -> dict[str, dict[str, Any]]:
+    """Run every benchmark and return results keyed by benchmark name."""
+    results: dict[str, dict[str, Any]] = {}
+
+    def record(name: str, value: float, unit: str, higher_is_better: bool) -> None:
+        results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+        print(f"  {name:<20} {value:>14,.1f} {unit}", file=sys.stderr)
+
+    container = make_container()
+    container.resolve_sync(Handler)  # Warm plans and singletons
+
+    record(
+        "resolve.singleton",
+        best_rate(lambda: container.resolve_sync(Database), number, repeat),
+        "ops/s",
+        True,
+    )
+    record(
+        "resolve.transient",
+        best_rate(lambda: container.resolve_sync(Handler), number, repeat),
+        "ops/s",
+        True,
+    )
+    with container.scope("request"):
+        record(
+            "resolve.scoped",
+            best_rate(lambda: container.resolve_sync(RequestContext), number, repeat),
+            "ops/s",
+            True,
+        )
+    record(
+        "call.container",
+        best_rate(lambda: container.call_sync(handle), number, repeat),
+        "ops/s",
+        True,
+    )
+    injected = container.wrap_with_injection(handle)
+    record("call.inject", best_rate(injected, number, repeat), "ops/s", True)
+    record(
+        "resolve.generic",
+        best_rate(lambda: container.resolve_sync(Repository[User]), number, repeat),
+        "ops/s",
+        True,
+    )
+    record(
+        "resolve.protocol",
+        best_rate(lambda: container.resolve_sync(Notifier), number, repeat),
+        "ops/s",
+        True,
+    )
+
+    for size in sizes:
+        rounds = repeat if size <= 1000 else 1
+        record(f"startup.{size}", startup_time(size, rounds), "s", False)
+
+    record("memory.component", memory_per_component(), "bytes", False)
+    return results
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """Print the change of every shared benchmark and return the regressions."""
+    regressions = []
+    base_results = baseline["results"]
+    print(f"{'benchmark':<20} {'baseline':>14} {'current':>14} {'change':>9}")
+    for name, result in current["results"].items():
+        base = base_results.get(name)
+        if base is None or not base["value"]:
+            continue
+        change = (result["value"] - base["value"]) / base["value"] * 100
+        worse = -change if result["higher_is_better"] else change
+        flag = ""
+        if worse > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<20} {base['value']:>14,.1f} {result['value']:>14,.1f} {change:>+8.1f}%{flag}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite and write JSON results")
+    run.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    run.add_argument("--sizes", default="100,1000,10000", help="startup component counts")
+    run.add_argument("--number", type=int, default=20_000, help="calls per round")
+    run.add_argument("--repeat", type=int, default=5, help="rounds per benchmark")
+
+    check = commands.add_parser("compare", help="compare two result files")
+    check.add_argument("baseline", type=Path)
+    check.add_argument("current", type=Path)
+    check.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in %%")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        sizes = [int(size) for size in args.sizes.split(",") if size]
+        print("Running core benchmarks:", file=sys.stderr)
+        payload = {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "number": args.number,
+                "repeat": args.repeat,
+            },
+            "results": run_suite(sizes, args.number, args.repeat),
+        }
+        args.output.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(
+            f"\n{len(regressions)} regression(s) above {args.threshold:g}%: "
+            + ", ".join(regressions)
+        )
+        return 1
+    print(f"\nNo regressions above {args.threshold:g}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -49,40 +49,81 @@ https://github.com/yourusername/whiskey
 
 __version__ = "0.1.0"
 
-# Core exports
-from whiskey.core.application import Whiskey
-from whiskey.core.container import Container
-from whiskey.core.decorators import (
-    call,
-    call_sync,
-    component,
-    configure_app,
-    factory,
-    get_app,
-    inject,
-    invoke,
-    on_error,
-    on_shutdown,
-    on_startup,
-    provide,
-    resolve,
-    resolve_async,
-    scoped,
-    singleton,
-    when_debug,
-    when_env,
-    when_production,
-    wrap_function,
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# Core exports, imported on first access so `import whiskey` stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "whiskey.core.application": ("Whiskey",),
+        "whiskey.core.container": ("Container",),
+        "whiskey.core.decorators": (
+            "call",
+            "call_sync",
+            "component",
+            "configure_app",
+            "factory",
+            "get_app",
+            "inject",
+            "invoke",
+            "on_error",
+            "on_shutdown",
+            "on_startup",
+            "provide",
+            "resolve",
+            "resolve_async",
+            "scoped",
+            "singleton",
+            "when_debug",
+            "when_env",
+            "when_production",
+            "wrap_function",
+        ),
+        "whiskey.core.generic": ("GenericTypeResolver", "TypeParameterBinder"),
+        "whiskey.core.lazy": ("AsyncLazy", "Lazy", "lazy_inject"),
+        "whiskey.core.registry": ("Scope",),
+        "whiskey.core.scopes": ("ContextVarScope", "ScopeType"),
+        "whiskey.core.types": ("Disposable", "Initializable", "Inject"),
+    },
 )
-from whiskey.core.generic import GenericTypeResolver, TypeParameterBinder
-from whiskey.core.lazy import Lazy, lazy_inject
-from whiskey.core.registry import Scope
-from whiskey.core.scopes import ContextVarScope, ScopeType
-from whiskey.core.types import Disposable, Initializable, Inject
+
+if TYPE_CHECKING:
+    from whiskey.core.application import Whiskey
+    from whiskey.core.container import Container
+    from whiskey.core.decorators import (
+        call,
+        call_sync,
+        component,
+        configure_app,
+        factory,
+        get_app,
+        inject,
+        invoke,
+        on_error,
+        on_shutdown,
+        on_startup,
+        provide,
+        resolve,
+        resolve_async,
+        scoped,
+        singleton,
+        when_debug,
+        when_env,
+        when_production,
+        wrap_function,
+    )
+    from whiskey.core.generic import GenericTypeResolver, TypeParameterBinder
+    from whiskey.core.lazy import AsyncLazy, Lazy, lazy_inject
+    from whiskey.core.registry import Scope
+    from whiskey.core.scopes import ContextVarScope, ScopeType
+    from whiskey.core.types import Disposable, Initializable, Inject
 
 # Application class has been renamed to Whiskey
 
 __all__ = [
+    "AsyncLazy",
     # Core DI
     "Container",
     "ContextVarScope",
@@ -0,0 +1,7 @@
+"""Run the whiskey command-line tools: ``python -m whiskey``."""
+
+import sys
+
+from whiskey.cli import main
+
+sys.exit(main())
@@ -32,41 +32,90 @@ Usage Example:
 For more detailed examples, see the individual module documentation.
 """
 
-from whiskey.core.analyzer import InjectDecision, TypeAnalyzer
-from whiskey.core.application import Whiskey
-from whiskey.core.container import Container, get_current_container, set_current_container
-from whiskey.core.decorators import (
-    component,
-    configure_app,
-    factory,
-    get_app,
-    inject,
-    on_error,
-    on_shutdown,
-    on_startup,
-    provide,
-    resolve,
-    resolve_async,
-    scoped,
-    singleton,
-    when_debug,
-    when_env,
-    when_production,
-)
-from whiskey.core.errors import (
-    CircularDependencyError,
-    ConfigurationError,
-    InjectionError,
-    RegistrationError,
-    ResolutionError,
-    ScopeError,
-    TypeAnalysisError,
-    WhiskeyError,
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# Public names are imported on first access; see whiskey.core.exports
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "whiskey.core.analyzer": ("InjectDecision", "TypeAnalyzer"),
+        "whiskey.core.application": ("Whiskey",),
+        "whiskey.core.container": ("Container", "get_current_container", "set_current_container"),
+        "whiskey.core.decorators": (
+            "component",
+            "configure_app",
+            "factory",
+            "get_app",
+            "inject",
+            "on_error",
+            "on_shutdown",
+            "on_startup",
+            "provide",
+            "resolve",
+            "resolve_async",
+            "scoped",
+            "singleton",
+            "when_debug",
+            "when_env",
+            "when_production",
+        ),
+        "whiskey.core.errors": (
+            "CircularDependencyError",
+            "ConfigurationError",
+            "InjectionError",
+            "RegistrationError",
+            "ResolutionError",
+            "ScopeError",
+            "TypeAnalysisError",
+            "WhiskeyError",
+        ),
+        "whiskey.core.performance": ("PerformanceMetrics", "PerformanceMonitor"),
+        "whiskey.core.profiler": ("Profiler",),
+        "whiskey.core.registry": ("ComponentDescriptor", "ComponentRegistry", "Scope"),
+        "whiskey.core.scopes": ("ContextVarScope", "ScopeType"),
+        "whiskey.core.types": ("Disposable", "Initializable"),
+    },
 )
-from whiskey.core.performance import PerformanceMetrics, PerformanceMonitor
-from whiskey.core.registry import ComponentDescriptor, ComponentRegistry, Scope
-from whiskey.core.scopes import ContextVarScope, ScopeType
-from whiskey.core.types import Disposable, Initializable
+
+if TYPE_CHECKING:
+    from whiskey.core.analyzer import InjectDecision, TypeAnalyzer
+    from whiskey.core.application import Whiskey
+    from whiskey.core.container import Container, get_current_container, set_current_container
+    from whiskey.core.decorators import (
+        component,
+        configure_app,
+        factory,
+        get_app,
+        inject,
+        on_error,
+        on_shutdown,
+        on_startup,
+        provide,
+        resolve,
+        resolve_async,
+        scoped,
+        singleton,
+        when_debug,
+        when_env,
+        when_production,
+    )
+    from whiskey.core.errors import (
+        CircularDependencyError,
+        ConfigurationError,
+        InjectionError,
+        RegistrationError,
+        ResolutionError,
+        ScopeError,
+        TypeAnalysisError,
+        WhiskeyError,
+    )
+    from whiskey.core.performance import PerformanceMetrics, PerformanceMonitor
+    from whiskey.core.profiler import Profiler
+    from whiskey.core.registry import ComponentDescriptor, ComponentRegistry, Scope
+    from whiskey.core.scopes import ContextVarScope, ScopeType
+    from whiskey.core.types import Disposable, Initializable
 
 __all__ = [
     "CircularDependencyError",
@@ -86,6 +135,7 @@ __all__ = [
     "PerformanceMetrics",
     # Performance
     "PerformanceMonitor",
+    "Profiler",
     "RegistrationError",
     "ResolutionError",
     "Scope",
@@ -0,0 +1,405 @@
+"""Opt-in persistent cache for callable signature analysis.
+
+Every new process repeats the same work for each provider it analyzes:
+``inspect.signature`` plus ``get_type_hints`` with forward-reference
+resolution. This module stores the registry-independent outcome of that work
+(parameter names, kinds, default markers and resolved type hints) in a local
+SQLite file so that forked or restarted workers can skip it.
+
+Injection decisions themselves are never persisted: whether a parameter is
+injected depends on what is registered, so TypeAnalyzer re-applies its rules
+to the cached hints in every process.
+
+Entries are keyed by ``module:qualname`` and carry a fingerprint of the
+defining module's source file (mtime and size). An entry whose fingerprint no
+longer matches is ignored and replaced. Hints that cannot be stored faithfully
+(e.g. ``Annotated`` metadata objects or ``Callable`` signatures) simply make the
+callable uncacheable; it is analyzed live as before.
+
+The file is read lazily, in one query, the first time a callable is looked
+up. New entries are buffered and written in batches, at ``flush()`` and at
+interpreter exit. Connections are opened per operation, so the cache is safe
+to use in processes forked after it was enabled.
+
+Classes:
+    AnalysisCache: SQLite-backed store for analyzed signatures
+
+Functions:
+    enable_analysis_cache: Turn the persistent cache on for all analyzers
+    disable_analysis_cache: Turn it off again
+    get_analysis_cache: The active cache, if any
+
+Example:
+    >>> from whiskey.core.analysis_cache import enable_analysis_cache
+    >>> cache = enable_analysis_cache()      # ~/.cache/whiskey/analysis.sqlite3
+    >>> app.resolve(UserService)             # first process: analyzed and stored
+    >>> cache.stats()
+    {'hits': 0, 'misses': 12, 'stale': 0, 'entries': 12}
+
+    Setting ``WHISKEY_ANALYSIS_CACHE=1`` (or to a file path) enables the cache
+    at import time without code changes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import threading
+import types
+from functools import reduce
+from operator import or_
+from pathlib import Path
+from typing import Any, Callable, Union, get_args, get_origin
+
+# Bump when the payload layout changes; older rows are then ignored
+FORMAT_VERSION = 2
+
+# Number of buffered entries that triggers a write
+FLUSH_THRESHOLD = 64
+
+# ``X | Y`` unions (Python 3.10+)
+_UNION_TYPE = getattr(types, "UnionType", None)
+
+# Stand-in for defaults other than None; analysis only checks for their presence
+_NON_NONE_DEFAULT = object()
+
+
+class _UnsupportedHintError(Exception):
+    """Raised when a type hint cannot be stored and restored faithfully."""
+
+
+def _encode_hint(hint: Any) -> Any:
+    """Encode a type hint as JSON-compatible data."""
+    if hint is inspect.Parameter.empty:
+        return {"e": 1}
+    if hint is None:
+        return {"none": 1}
+    if hint is type(None):
+        return {"nonetype": 1}
+    if isinstance(hint, str):
+        return {"s": hint}
+
+    origin = get_origin(hint)
+    if origin is not None:
+        if origin is Union:
+            origin_data = "union"
+        elif _UNION_TYPE is not None and origin is _UNION_TYPE:
+            origin_data = "pipe"
+        else:
+            origin_data = _encode_hint(origin)
+        return {"o": origin_data, "a": [_encode_hint(arg) for arg in get_args(hint)]}
+
+    module_name = getattr(hint, "__module__", None)
+    qualname = getattr(hint, "__qualname__", None)
+    if not module_name or not isinstance(qualname, str) or "<" in qualname:
+        raise _UnsupportedHintError(hint)
+    return {"t": f"{module_name}:{qualname}"}
+
+
+def _decode_hint(data: Any) -> Any:
+    """Rebuild a type hint from its encoded form."""
+    if "t" in data:
+        module_name, qualname = data["t"].split(":", 1)
+        target = sys.modules.get(module_name) or importlib.import_module(module_name)
+        for part in qualname.split("."):
+            target = getattr(target, part)
+        return target
+    if "s" in data:
+        return data["s"]
+    if "o" in data:
+        args = tuple(_decode_hint(arg) for arg in data["a"])
+        if data["o"] == "union":
+            return Union[args]
+        if data["o"] == "pipe":
+            return reduce(or_, args)
+        origin = _decode_hint(data["o"])
+        return origin[args if len(args) != 1 else args[0]]
+    if "e" in data:
+        return inspect.Parameter.empty
+    if "nonetype" in data:
+        return type(None)
+    return None
+
+
+def _cache_key(func: Callable) -> str | None:
+    """Stable key for a callable, or None if it has no importable name."""
+    module_name = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if not module_name or not isinstance(qualname, str) or "<" in qualname:
+        return None
+    return f"{module_name}:{qualname}"
+
+
+def _fingerprint(module_name: str) -> str | None:
+    """Fingerprint of a module's source file (mtime and size)."""
+    filename = getattr(sys.modules.get(module_name), "__file__", None)
+    if not filename:
+        return None
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return f"{FORMAT_VERSION}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class AnalysisCache:
+    """SQLite-backed store for analyzed callable signatures.
+
+    Attributes:
+        path: Location of the SQLite file
+        hits: Lookups served from the cache
+        misses: Lookups with no usable entry
+        stale: Entries found but invalidated by a changed source file
+    """
+
+    def __init__(self, path: str | Path):
+        """Create a cache backed by the file at ``path`` (created on first write).
+
+        Args:
+            path: SQLite file to read from and write to
+        """
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._entries: dict[str, tuple[str, str]] | None = None
+        self._pending: dict[str, tuple[str, str]] = {}
+        # Source files are stat'ed once per module per process
+        self._fingerprints: dict[str, str | None] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection and make sure the table exists."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS analysis ("
+            "key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, payload TEXT NOT NULL)"
+        )
+        return connection
+
+    def _fingerprint(self, func: Callable) -> str | None:
+        """Fingerprint of the source file defining a callable."""
+        module_name = func.__module__
+        try:
+            return self._fingerprints[module_name]
+        except KeyError:
+            fingerprint = self._fingerprints[module_name] = _fingerprint(module_name)
+            return fingerprint
+
+    def _load(self) -> dict[str, tuple[str, str]]:
+        """Read all entries into memory on first use."""
+        with self._lock:
+            if self._entries is None:
+                entries = {}
+                if self.path.exists():
+                    try:
+                        connection = self._connect()
+                        try:
+                            rows = connection.execute(
+                                "SELECT key, fingerprint, payload FROM analysis"
+                            ).fetchall()
+                        finally:
+                            connection.close()
+                        entries = {
+                            key: (fingerprint, payload) for key, fingerprint, payload in rows
+                        }
+                    except sqlite3.Error:
+                        entries = {}
+                self._entries = entries
+            return self._entries
+
+    def get(self, func: Callable) -> list[tuple[inspect.Parameter, Any]] | None:
+        """Look up the analyzed parameters of a callable.
+
+        Args:
+            func: The callable being analyzed
+
+        Returns:
+            (parameter, type hint) pairs as produced by live analysis, or None
+            if there is no valid entry
+        """
+        key = _cache_key(func)
+        if key is None:
+            return None
+
+        entry = self._load().get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        fingerprint, payload = entry
+        if fingerprint != self._fingerprint(func):
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        try:
+            parameters = []
+            for name, kind, default, hint in json.loads(payload):
+                if default == 0:
+                    default_value = inspect.Parameter.empty
+                elif default == 1:
+                    default_value = None
+                else:
+                    default_value = _NON_NONE_DEFAULT
+                parameter = inspect.Parameter(
+                    name, getattr(inspect.Parameter, kind), default=default_value
+                )
+                parameters.append((parameter, _decode_hint(hint)))
+        except (ImportError, AttributeError, TypeError, ValueError):
+            # A referenced type moved or was renamed - analyze live
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return parameters
+
+    def put(self, func: Callable, parameters: list[tuple[inspect.Parameter, Any]]) -> None:
+        """Store the analyzed parameters of a callable.
+
+        Callables without an importable name or a source file, and hints that
+        cannot be restored faithfully, are silently not cached.
+
+        Args:
+            func: The callable that was analyzed
+            parameters: (parameter, type hint) pairs from live analysis
+        """
+        key = _cache_key(func)
+        if key is None:
+            return
+        fingerprint = self._fingerprint(func)
+        if fingerprint is None:
+            return
+
+        try:
+            payload = []
+            for parameter, hint in parameters:
+                encoded = _encode_hint(hint)
+                if _decode_hint(encoded) != hint:
+                    raise _UnsupportedHintError(hint)
+                if parameter.default is inspect.Parameter.empty:
+                    default = 0
+                elif parameter.default is None:
+                    default = 1
+                else:
+                    default = 2
+                payload.append([parameter.name, parameter.kind.name, default, encoded])
+        except (_UnsupportedHintError, ImportError, AttributeError, TypeError, ValueError):
+            return
+
+        entry = (fingerprint, json.dumps(payload, separators=(",", ":")))
+        entries = self._load()
+        with self._lock:
+            entries[key] = entry
+            self._pending[key] = entry
+            should_flush = len(self._pending) >= FLUSH_THRESHOLD
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered entries to disk."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO analysis (key, fingerprint, payload) "
+                        "VALUES (?, ?, ?)",
+                        [
+                            (key, fingerprint, payload)
+                            for key, (fingerprint, payload) in pending.items()
+                        ],
+                    )
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            # The cache is an optimization; never fail analysis because of it
+            pass
+
+    def clear(self) -> None:
+        """Remove all entries, in memory and on disk."""
+        with self._lock:
+            self._entries = {}
+            self._pending = {}
+            self._fingerprints = {}
+        if self.path.exists():
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute("DELETE FROM analysis")
+            finally:
+                connection.close()
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and staleness counters plus the number of known entries."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "entries": len(self._entries or {}),
+        }
+
+
+_active_cache: AnalysisCache | None = None
+
+
+def get_analysis_cache() -> AnalysisCache | None:
+    """Return the active persistent cache, or None if it is disabled."""
+    return _active_cache
+
+
+def enable_analysis_cache(path: str | Path | None = None) -> AnalysisCache:
+    """Enable the persistent analysis cache for every TypeAnalyzer.
+
+    Args:
+        path: SQLite file to use (defaults to ``analysis.sqlite3`` in
+            ``whiskey.core.compiler.default_cache_dir()``)
+
+    Returns:
+        The active AnalysisCache
+    """
+    global _active_cache
+    if path is None:
+        from .compiler import default_cache_dir
+
+        path = default_cache_dir() / "analysis.sqlite3"
+
+    if _active_cache is not None:
+        if _active_cache.path == Path(path):
+            return _active_cache
+        _active_cache.flush()
+
+    _active_cache = AnalysisCache(path)
+    return _active_cache
+
+
+def disable_analysis_cache() -> None:
+    """Flush and disable the persistent analysis cache."""
+    global _active_cache
+    if _active_cache is not None:
+        _active_cache.flush()
+    _active_cache = None
+
+
+def _flush_at_exit() -> None:
+    if _active_cache is not None:
+        _active_cache.flush()
+
+
+atexit.register(_flush_at_exit)
+
+_configured = os.environ.get("WHISKEY_ANALYSIS_CACHE")
+if _configured and _configured.lower() not in ("0", "false", "no"):
+    enable_analysis_cache(None if _configured.lower() in ("1", "true", "yes") else _configured)
@@ -47,6 +47,11 @@ Example:
     >>> # results['db'] = InjectResult(YES, Database, "registered component")
     >>> # results['cache'] = InjectResult(OPTIONAL, Cache, "optional type")
 
+Persistent Cache:
+    When ``whiskey.core.analysis_cache`` is enabled, signatures and resolved
+    type hints are loaded from an on-disk cache shared between processes;
+    injection decisions are still made live against the current registry.
+
 See Also:
     - whiskey.core.container: Uses analyzer for injection decisions
     - whiskey.core.registry: Component registration state
@@ -58,8 +63,10 @@ import inspect
 from enum import Enum
 from typing import Any, Callable, ClassVar, Union, get_args, get_origin
 
+from .analysis_cache import get_analysis_cache
 from .errors import TypeAnalysisError
 from .generic import GenericTypeResolver
+from .performance import LRUCache
 
 # Handle Python version differences
 try:
@@ -240,10 +247,11 @@ class TypeAnalyzer:
             registry: Optional ComponentRegistry for checking registrations
         """
         self.registry = registry
-        self._analysis_cache: dict[Any, InjectResult] = {}
-        self._callable_cache: dict[
-            Any, dict[str, InjectResult]
-        ] = {}  # Cache for entire callable analysis
+        # Per-registration analysis is reused for the whole startup pass, so
+        # these grow with the registry instead of evicting at a fixed size
+        self._analysis_cache: LRUCache = LRUCache("analyzer.type_hints", None)
+        # Cache for entire callable analysis; keys are the callables themselves
+        self._callable_cache: LRUCache = LRUCache("analyzer.callables", None, weak_keys=True)
         self._generic_resolver = GenericTypeResolver(registry)
 
     def should_inject(self, param: inspect.Parameter, type_hint: Any = None) -> InjectResult:
@@ -276,13 +284,14 @@ class TypeAnalyzer:
         # Create efficient cache key - only type hint matters for analysis
         # Use id() for better performance with complex types
         cache_key = self._create_cache_key(type_hint)
-        if cache_key in self._analysis_cache:
-            return self._analysis_cache[cache_key]
+        result = self._analysis_cache.get(cache_key)
+        if result is not None:
+            return result
 
         # Analyze the type hint
         result = self._analyze_type_hint(type_hint)
 
-        # Cache the result with size limit to prevent unbounded growth
+        # Cache the result for the next parameter with the same hint
         self._cache_result(cache_key, result)
 
         return result
@@ -298,8 +307,9 @@ class TypeAnalyzer:
         """
         # Check if we've already analyzed this exact type hint
         type_cache_key = self._create_cache_key(type_hint)
-        if type_cache_key in self._analysis_cache:
-            return self._analysis_cache[type_cache_key]
+        result = self._analysis_cache.get(type_cache_key)
+        if result is not None:
+            return result
 
         # Perform the actual analysis
         result = self._analyze_type_hint_uncached(type_hint)
@@ -343,6 +353,25 @@ class TypeAnalyzer:
         if self.registry and self.registry.has(type_hint):
             return InjectResult(InjectDecision.YES, type_hint, "Registered user type")
 
+        # Rule 9: Interfaces (base classes, ABCs, Protocols) with registered
+        # implementations, looked up in the registry's interface index
+        if self.registry and inspect.isclass(type_hint):
+            implementations = self.registry.get_all(type_hint)
+            if len(implementations) == 1:
+                return InjectResult(
+                    InjectDecision.YES,
+                    type_hint,
+                    f"Single registered implementation found: {implementations[0].key}",
+                )
+            if len(implementations) > 1:
+                candidates = [descriptor.component_type for descriptor in implementations]
+                return InjectResult(
+                    InjectDecision.ERROR,
+                    type_hint,
+                    f"Multiple registered implementations found: {candidates}",
+                    candidates=candidates,
+                )
+
         # Check if it's a class we could potentially instantiate
         if inspect.isclass(type_hint):
             # For unregistered classes, be conservative and don't inject
@@ -589,11 +618,8 @@ class TypeAnalyzer:
 
         # Look for implementations that satisfy the protocol
         if self.registry:
-            # Find types that might implement this protocol
-            candidates = []
-            for descriptor in self.registry.list_all():
-                if self._implements_protocol(descriptor.component_type, type_hint):
-                    candidates.append(descriptor.component_type)
+            # Served from the registry's interface index, no scan
+            candidates = [descriptor.component_type for descriptor in self.registry.get_all(origin)]
 
             if len(candidates) == 1:
                 return InjectResult(
@@ -756,68 +782,82 @@ class TypeAnalyzer:
         """
         # Check callable cache first
         func_cache_key = self._create_callable_cache_key(func)
-        if func_cache_key in self._callable_cache:
-            return self._callable_cache[func_cache_key].copy()  # Return copy to prevent mutation
+        cached = self._callable_cache.get(func_cache_key)
+        if cached is not None:
+            return cached.copy()  # Return copy to prevent mutation
+
+        # Signatures and resolved hints don't depend on the registry, so they
+        # may come from the persistent cache; decisions are always made here
+        persistent_cache = get_analysis_cache()
+        parameters = persistent_cache.get(func) if persistent_cache is not None else None
+        if parameters is None:
+            parameters = self._inspect_parameters(func)
+            if persistent_cache is not None:
+                persistent_cache.put(func, parameters)
+
+        results = {}
+        for param, type_hint in parameters:
+            results[param.name] = self.should_inject(param, type_hint)
+
+        # Cache the results
+        self._cache_callable_result(func_cache_key, results)
+        return results
 
+    def _inspect_parameters(self, func: callable) -> list[tuple[inspect.Parameter, Any]]:
+        """Get a callable's injectable parameters with their resolved type hints.
+
+        Args:
+            func: The callable to inspect
+
+        Returns:
+            List of (parameter, type hint) pairs, excluding 'self' and 'cls'
+        """
         try:
             sig = inspect.signature(func)
         except (TypeError, ValueError) as e:
             raise TypeAnalysisError(f"Cannot analyze non-callable object: {e}") from e
 
-        results = {}
-
         # Get type hints for better forward reference resolution
         try:
             type_hints = get_type_hints_safe(func)
         except Exception:
             type_hints = {}
 
+        parameters = []
         for param_name, param in sig.parameters.items():
             # Skip 'self' and 'cls' parameters
             if param_name in ("self", "cls"):
                 continue
 
             # Use type hint if available, otherwise use annotation
-            type_hint = type_hints.get(param_name, param.annotation)
+            parameters.append((param, type_hints.get(param_name, param.annotation)))
 
-            result = self.should_inject(param, type_hint)
-            results[param_name] = result
+        return parameters
 
-        # Cache the results
-        self._cache_callable_result(func_cache_key, results)
-        return results
-
-    def _create_callable_cache_key(self, func: callable) -> tuple:
+    def _create_callable_cache_key(self, func: callable) -> Any:
         """Create a cache key for callable analysis.
 
         Args:
             func: The callable to create a key for
 
         Returns:
-            Tuple that can be used as a cache key
+            The callable itself (weakly referenced by the cache) if hashable,
+            else a tuple of its id and qualname
         """
         try:
-            # Use the function object directly if possible
-            return (func,)
+            hash(func)
+            return func
         except TypeError:
             # If not hashable, use id and qualname
             return (id(func), getattr(func, "__qualname__", str(func)))
 
-    def _cache_callable_result(self, cache_key: tuple, results: dict[str, InjectResult]) -> None:
-        """Cache callable analysis results with size management.
+    def _cache_callable_result(self, cache_key: Any, results: dict[str, InjectResult]) -> None:
+        """Cache callable analysis results (the LRU cache enforces its size limit).
 
         Args:
             cache_key: The cache key
             results: The analysis results to cache
         """
-        max_callable_cache_size = 500  # Reasonable limit for callable cache
-
-        if len(self._callable_cache) >= max_callable_cache_size:
-            # Remove oldest entries (simple FIFO for performance)
-            oldest_keys = list(self._callable_cache.keys())[:50]  # Remove 10% of entries
-            for old_key in oldest_keys:
-                del self._callable_cache[old_key]
-
         self._callable_cache[cache_key] = results
 
     def can_auto_create(self, cls: type) -> bool:
@@ -1028,22 +1068,12 @@ class TypeAnalyzer:
             return (id(type_hint), repr(type_hint))
 
     def _cache_result(self, cache_key: tuple, result: InjectResult) -> None:
-        """Cache an analysis result with size management.
+        """Cache an analysis result.
 
         Args:
             cache_key: The cache key
             result: The analysis result to cache
         """
-        # Implement LRU-like behavior with size limit
-        max_cache_size = 1000  # Reasonable limit for type analysis cache
-
-        if len(self._analysis_cache) >= max_cache_size:
-            # Remove oldest entries (simple FIFO for performance)
-            # In a production system, you might want a proper LRU cache
-            oldest_keys = list(self._analysis_cache.keys())[:100]  # Remove 10% of entries
-            for old_key in oldest_keys:
-                del self._analysis_cache[old_key]
-
         self._analysis_cache[cache_key] = result
 
     def clear_cache(self) -> None:
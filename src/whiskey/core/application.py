@@ -7,7 +7,7 @@ entry point for building full-featured dependency injection applications.
 
 Key Features:
     - Complete application lifecycle (startup, ready, shutdown)
-    - Event-driven architecture with wildcard patterns
+    - Event-driven architecture with glob patterns and background dispatch
     - Component decorators (@app.component, @app.singleton)
     - Background task management (@app.task)
     - Error handling (@app.on_error)
@@ -55,12 +55,15 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import inspect
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, Callable, TypeVar
 
 from .container import Container
 from .errors import ConfigurationError
+from .events import EventDispatcher
+from .lifecycle import ShutdownReport, StartupReport, start_components
 from .registry import Scope
+from .scheduler import TaskScheduler
 
 T = TypeVar("T")
 
@@ -95,15 +98,38 @@ class Whiskey:
         ...     pass
     """
 
-    def __init__(self, container: Container = None, name: str | None = None):
+    def __init__(
+        self,
+        container: Container = None,
+        name: str | None = None,
+        *,
+        startup_concurrency: int | None = None,
+        startup_timeout: float | None = None,
+        shutdown_timeout: float | None = None,
+        concurrent_events: bool = False,
+        event_queue_size: int | None = None,
+    ):
         """Initialize a new Application.
 
         Args:
             container: Optional Container instance (creates new one if None)
             name: Optional name for the application (defaults to "Whiskey")
+            startup_concurrency: Maximum number of components initializing at
+                once during startup (unlimited if None)
+            startup_timeout: Per-component startup limit in seconds (no limit if None)
+            shutdown_timeout: Per-component dispose() limit in seconds (no limit if None)
+            concurrent_events: Await the async handlers of an event together
+                instead of one after another
+            event_queue_size: Capacity of the post() queue; events posted while
+                it is full are dropped (unbounded if None)
         """
         self.container = container if container is not None else Container()
         self.name = name if name is not None else "Whiskey"
+        self.startup_concurrency = startup_concurrency
+        self.startup_timeout = startup_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.startup_report: StartupReport | None = None
+        self.shutdown_report: ShutdownReport | None = None
 
         # Initialize callbacks - if container has them, use them; otherwise create new
         if hasattr(self.container, "_startup_callbacks"):
@@ -128,6 +154,12 @@ class Whiskey:
             "after_shutdown": self._shutdown_callbacks,
             "tasks": [],
         }
+        self._events = EventDispatcher(
+            concurrent=concurrent_events,
+            queue_size=event_queue_size,
+            on_error=self._emit_error,
+        )
+        self._scheduler = TaskScheduler(on_error=self._emit_error)
 
     # Builder pattern removed - use Whiskey() or Whiskey.create() directly
 
@@ -404,13 +436,48 @@ class Whiskey:
 
     @property
     def task(self):
-        """Decorator to register background tasks."""
+        """Decorator to register periodic background tasks.
+
+        Tasks with an interval run from startup to shutdown on the
+        application's TaskScheduler; see whiskey.core.scheduler for the
+        ``mode``, ``overrun``, ``jitter`` and ``max_pending`` options. Each
+        run is called through the container, so parameters are injected.
+        Errors raised by a run are emitted as "error" events and do not
+        stop the schedule.
+
+        Usage:
+            @app.task(interval=30, jitter=3)
+            async def refresh(cache: Cache): ...
+        """
+
+        def decorator(
+            interval: float | None = None,
+            *,
+            name: str | None = None,
+            mode: str = "fixed_rate",
+            overrun: str = "skip",
+            jitter: float = 0.0,
+            max_pending: int = 1,
+            **kwargs,
+        ):
+            if callable(interval):
+                # Used bare as @app.task: registered, but not periodic
+                return decorator()(interval)
 
-        def decorator(interval: float | None = None, **kwargs):
             def inner(func: Callable) -> Callable:
                 # Store task metadata
                 func._task_interval = interval
                 func._task_kwargs = kwargs
+                if interval:
+                    self._scheduler.add(
+                        partial(self.container.call_async, func),
+                        interval,
+                        name=name or func.__name__,
+                        mode=mode,
+                        overrun=overrun,
+                        jitter=jitter,
+                        max_pending=max_pending,
+                    )
                 self._hooks.setdefault("tasks", []).append(func)
                 return func
 
@@ -418,6 +485,10 @@ class Whiskey:
 
         return decorator
 
+    def task_stats(self) -> dict[str, dict[str, Any]]:
+        """Runs, failures, skipped runs, lateness and duration per periodic task."""
+        return self._scheduler.stats()
+
     # Conditional decorators
 
     def when_env(self, var_name: str, expected_value: str | None = None):
@@ -471,13 +542,13 @@ class Whiskey:
         try:
             self._is_running = True
 
-            # Initialize all components that implement Initializable
-            for descriptor in self.container.registry.list_all():
-                # Get or create instance
-                instance = await self.container.resolve(descriptor.component_type)
-                # Initialize if it implements Initializable
-                if hasattr(instance, "initialize") and callable(instance.initialize):
-                    await instance.initialize()
+            # Resolve and initialize components level by level in dependency
+            # order; independent components start concurrently
+            self.startup_report = await start_components(
+                self.container,
+                max_concurrency=self.startup_concurrency,
+                timeout=self.startup_timeout,
+            )
 
             # Run startup callbacks
             for callback in self._startup_callbacks:
@@ -486,20 +557,8 @@ class Whiskey:
                 else:
                     callback()
 
-            # Start background tasks
-            if "tasks" in self._hooks:
-                for task_func in self._hooks["tasks"]:
-                    if hasattr(task_func, "_task_interval"):
-                        interval = task_func._task_interval
-                        if interval:
-                            # Create a periodic task
-                            async def run_periodic(func=task_func, sleep_interval=interval):
-                                while self._is_running:
-                                    await func()
-                                    await asyncio.sleep(sleep_interval)
-
-                            task = asyncio.create_task(run_periodic())
-                            self._hooks.setdefault("running_tasks", []).append(task)
+            # Start periodic background tasks
+            self._scheduler.start()
         except Exception:
             # If startup fails, reset running state
             self._is_running = False
@@ -512,13 +571,11 @@ class Whiskey:
 
         self._is_running = False
 
-        # Cancel running tasks
-        if "running_tasks" in self._hooks:
-            for task in self._hooks["running_tasks"]:
-                task.cancel()
-            # Wait for tasks to finish cancellation
-            await asyncio.gather(*self._hooks["running_tasks"], return_exceptions=True)
-            self._hooks["running_tasks"].clear()
+        # Stop periodic tasks, cancelling runs in progress
+        await self._scheduler.stop()
+
+        # Deliver events still waiting in the background queue
+        await self._events.close()
 
         # Run shutdown callbacks
         for callback in reversed(self._shutdown_callbacks):
@@ -531,23 +588,11 @@ class Whiskey:
                 # Log error but don't stop shutdown process
                 print(f"Error in shutdown callback: {e}")
 
-        # Dispose all components that implement Disposable
-        disposed_instances = set()
-        for descriptor in self.container.registry.list_all():
-            if descriptor.scope == Scope.SINGLETON:
-                try:
-                    # Get singleton instance if it exists
-                    instance = self.container.resolve_sync(descriptor.component_type)
-                    if (
-                        instance not in disposed_instances
-                        and hasattr(instance, "dispose")
-                        and callable(instance.dispose)
-                    ):
-                        await instance.dispose()
-                        disposed_instances.add(instance)
-                except Exception:
-                    # Continue disposal even if one fails
-                    pass
+        # Dispose the singletons that were actually created, dependents first;
+        # errors and timeouts are collected in the report
+        self.shutdown_report = await self.container.clear_singletons_async(
+            timeout=self.shutdown_timeout
+        )
 
         # Clear container caches
         self.container.clear_caches()
@@ -727,7 +772,7 @@ class Whiskey:
         setattr(self, f"run_{name}", runner)
 
     async def emit(self, event: str, *args, **kwargs) -> None:
-        """Emit an event to all registered handlers."""
+        """Emit an event to all registered handlers and wait for them."""
         # Handle error events specially
         if event == "error" and args:
             error = args[0]
@@ -744,21 +789,26 @@ class Whiskey:
                 else:
                     handler(error)
 
-        # Handle regular events
-        if event in self._hooks:
-            for handler in self._hooks[event]:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(*args, **kwargs)
-                else:
-                    handler(*args, **kwargs)
+        await self._events.dispatch(event, *args, **kwargs)
 
-        # Handle wildcard handlers
-        if "*" in self._hooks:
-            for handler in self._hooks["*"]:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event, *args, **kwargs)
-                else:
-                    handler(event, *args, **kwargs)
+    def post(self, event: str, *args, **kwargs) -> bool:
+        """Emit an event in the background without waiting for its handlers.
+
+        Posted events are dispatched in order by a background task. Errors
+        raised by their handlers are emitted as "error" events. Must be
+        called from the event loop's thread.
+
+        Returns:
+            False if the event queue was full and the event was dropped
+        """
+        return self._events.post(event, *args, **kwargs)
+
+    def event_stats(self) -> dict[str, int | None]:
+        """Counters of the background event queue (see EventDispatcher.stats)."""
+        return self._events.stats()
+
+    async def _emit_error(self, error: Exception) -> None:
+        await self.emit("error", error)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -922,17 +972,22 @@ class Whiskey:
             app.on("event", handler)
             @app.on("event")
             def handler(): ...
+
+        ``event`` may be a glob pattern such as ``"user.*"``. Handlers of the
+        ``"*"`` pattern receive the event name before the event's arguments.
         """
         if handler is None:
             # Used as decorator
             def decorator(func: Callable) -> Callable:
                 self._hooks.setdefault(event, []).append(func)
+                self._events.add(event, func)
                 return func
 
             return decorator
         else:
             # Used as method
             self._hooks.setdefault(event, []).append(handler)
+            self._events.add(event, handler)
             return self
 
     @property
@@ -942,6 +997,7 @@ class Whiskey:
         def decorator(name: str):
             def inner(func: Callable) -> Callable:
                 self._hooks.setdefault(name, []).append(func)
+                self._events.add(name, func)
                 return func
 
             return inner
@@ -0,0 +1,302 @@
+"""Ahead-of-time compilation of container wiring to generated Python source.
+
+Most of a container's cold-start cost is type-hint analysis: every provider
+signature is inspected the first time its component is resolved. This module
+runs that analysis once, writes the result out as a plain Python module and,
+on later runs, imports the module instead of analyzing anything.
+
+The generated module references providers and dependency types directly
+(``import myapp.services as _m0`` ... ``_m0.UserService``) and lists, per
+component, the dependencies to inject. It is cached on disk under a file name
+derived from a hash of the source files of the registered providers' modules;
+editing any of those files produces a new hash and therefore a recompile.
+Each generated module also records digests of every module it references and
+is discarded if any of them changed.
+
+Components that cannot be referenced by import path (classes defined inside
+functions, lambdas, instances) or whose dependencies cannot be (e.g.
+parameterized generics) are left out and analyzed at runtime as usual.
+
+Functions:
+    default_cache_dir: Directory used when no cache_dir is given
+    source_hash: Hash of the source modules backing a container
+    generate_source: Render the wiring module for a container
+    compile_container: Generate (or reuse) the cached wiring module
+    load_compiled: Install cached wiring into a container, compiling if needed
+
+Example:
+    >>> app = create_app()                     # registers components as usual
+    >>> load_compiled(app)                     # first run compiles, later runs import
+    500
+    >>> service = app.resolve(UserService)     # no signature analysis
+
+See Also:
+    - whiskey.core.resolver: UnifiedResolver.install_precompiled
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import py_compile
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .errors import ResolutionError
+
+if TYPE_CHECKING:
+    from .container import Container
+    from .resolver import ResolutionPlan
+
+# Bump when the layout of generated modules changes
+FORMAT_VERSION = 1
+
+
+class _NotReferenceableError(Exception):
+    """Raised when an object cannot be emitted as an import-path reference."""
+
+
+def default_cache_dir() -> Path:
+    """Directory for generated wiring (``$WHISKEY_CACHE_DIR`` or ``~/.cache/whiskey``)."""
+    configured = os.environ.get("WHISKEY_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "whiskey"
+
+
+def _container_of(app: Any) -> Container:
+    """Accept either a Whiskey application or a Container."""
+    return getattr(app, "container", app)
+
+
+def _module_digest(module_name: str) -> str | None:
+    """SHA-256 of a module's source file, or None if it has no file."""
+    module = sys.modules.get(module_name)
+    filename = getattr(module, "__file__", None)
+    if not filename:
+        return None
+    try:
+        with open(filename, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def source_hash(app: Any) -> str:
+    """Hash the registered keys and the source of every provider's module.
+
+    This is the cache key for generated wiring; it is cheap to compute
+    because it reads files rather than analyzing signatures.
+    """
+    container = _container_of(app)
+    modules = set()
+    keys = []
+    for key, descriptor in container.registry.items():
+        keys.append(key)
+        module_name = getattr(descriptor.provider, "__module__", None)
+        if module_name:
+            modules.add(module_name)
+
+    digest = hashlib.sha256(f"whiskey-wiring-{FORMAT_VERSION}".encode())
+    for key in sorted(keys):
+        digest.update(key.encode())
+    for module_name in sorted(modules):
+        digest.update(module_name.encode())
+        digest.update((_module_digest(module_name) or "").encode())
+    return digest.hexdigest()
+
+
+class _SourceWriter:
+    """Collects module aliases while rendering object references."""
+
+    def __init__(self):
+        self.aliases: dict[str, str] = {}
+
+    def ref(self, obj: Any) -> str:
+        """Render an expression that evaluates to ``obj`` in the generated module."""
+        if obj is None or isinstance(obj, (str, bool)):
+            return repr(obj)
+
+        module_name = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None)
+        if not module_name or not isinstance(qualname, str) or "<" in qualname:
+            raise _NotReferenceableError(obj)
+
+        target = sys.modules.get(module_name)
+        for part in qualname.split("."):
+            target = getattr(target, part, None)
+        if target is not obj:
+            raise _NotReferenceableError(obj)
+
+        alias = self.aliases.setdefault(module_name, f"_m{len(self.aliases)}")
+        return f"{alias}.{qualname}"
+
+
+def _reachable_plans(container: Container) -> list[ResolutionPlan]:
+    """Compile every registered component and every dependency it pulls in."""
+    resolver = container.resolver
+    plans: dict[str, ResolutionPlan] = {}
+    pending = [resolver.compile_plan(descriptor) for descriptor in container.registry.values()]
+
+    while pending:
+        plan = pending.pop()
+        if plan.descriptor.key in plans:
+            continue
+        plans[plan.descriptor.key] = plan
+        for _param_name, dep_key, optional in plan.dependencies:
+            try:
+                pending.append(resolver.get_plan(dep_key, allow_auto_create=not optional))
+            except (ResolutionError, TypeError):
+                continue
+
+    return [plans[key] for key in sorted(plans)]
+
+
+def generate_source(app: Any) -> str:
+    """Render the wiring module for a container.
+
+    Args:
+        app: A Whiskey application or Container with components registered
+
+    Returns:
+        Python source defining ``SOURCE_HASH``, ``MODULE_DIGESTS`` and
+        ``COMPONENTS``
+    """
+    container = _container_of(app)
+    writer = _SourceWriter()
+    entries = []
+
+    for plan in _reachable_plans(container):
+        if not callable(plan.provider):
+            continue
+        try:
+            provider = writer.ref(plan.provider)
+            dependencies = "".join(
+                f"({param_name!r}, {writer.ref(dep_key)}, {optional!r}), "
+                for param_name, dep_key, optional in plan.dependencies
+            )
+        except _NotReferenceableError:
+            continue
+        param_names = "".join(f"{name!r}, " for name in sorted(plan.param_names))
+        entries.append(
+            f"    ({plan.descriptor.key!r}, {provider}, ({dependencies}), ({param_names})),"
+        )
+
+    lines = [
+        f'"""Wiring for {len(entries)} components, generated by whiskey.core.compiler.',
+        "",
+        "Do not edit: this file is regenerated whenever its source modules change.",
+        '"""',
+        "",
+    ]
+    lines.extend(f"import {module} as {alias}" for module, alias in writer.aliases.items())
+    lines.extend(
+        [
+            "",
+            f"FORMAT_VERSION = {FORMAT_VERSION}",
+            f"SOURCE_HASH = {source_hash(container)!r}",
+            "MODULE_DIGESTS = {",
+            *(f"    {module!r}: {_module_digest(module)!r}," for module in sorted(writer.aliases)),
+            "}",
+            "",
+            "# (key, provider, ((param_name, dependency, optional), ...), param_names)",
+            "COMPONENTS = (",
+            *entries,
+            ")",
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def _wiring_path(cache_dir: str | Path | None, digest: str) -> Path:
+    """Location of the cached wiring module for a source hash."""
+    return Path(cache_dir or default_cache_dir()) / f"whiskey_wiring_{digest[:24]}.py"
+
+
+def compile_container(app: Any, *, cache_dir: str | Path | None = None) -> Path:
+    """Generate the wiring module for a container, reusing a cached one.
+
+    Args:
+        app: A Whiskey application or Container with components registered
+        cache_dir: Where generated modules live (defaults to default_cache_dir())
+
+    Returns:
+        Path of the generated module
+    """
+    container = _container_of(app)
+    path = _wiring_path(cache_dir, source_hash(container))
+    if path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write atomically so concurrent processes never import a partial file
+    temp = path.with_suffix(f".{os.getpid()}.tmp")
+    temp.write_text(generate_source(container), encoding="utf-8")
+    os.replace(temp, path)
+    # Byte-compile up front so even processes that never write bytecode
+    # (PYTHONDONTWRITEBYTECODE) import the wiring without parsing it
+    py_compile.compile(str(path), cfile=importlib.util.cache_from_source(str(path)))
+    return path
+
+
+def _import_wiring(path: Path) -> Any:
+    """Import a generated wiring module from its path."""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _is_current(module: Any) -> bool:
+    """Check that a wiring module matches the sources it was generated from."""
+    if getattr(module, "FORMAT_VERSION", None) != FORMAT_VERSION:
+        return False
+    return all(
+        _module_digest(module_name) == digest
+        for module_name, digest in module.MODULE_DIGESTS.items()
+    )
+
+
+def load_compiled(
+    app: Any, *, cache_dir: str | Path | None = None, compile_missing: bool = True
+) -> int:
+    """Install cached wiring into a container so resolution skips type analysis.
+
+    Call this after all components are registered. Wiring is matched to
+    registrations by key and provider identity, so stale entries are ignored
+    rather than misapplied.
+
+    Args:
+        app: A Whiskey application or Container with components registered
+        cache_dir: Where generated modules live (defaults to default_cache_dir())
+        compile_missing: Generate the wiring if no current cached module exists
+
+    Returns:
+        Number of components whose analysis was loaded from the wiring
+    """
+    container = _container_of(app)
+    path = _wiring_path(cache_dir, source_hash(container))
+
+    module = None
+    if path.exists():
+        try:
+            module = _import_wiring(path)
+        except (ImportError, AttributeError, SyntaxError):
+            module = None
+        if module is not None and not _is_current(module):
+            module = None
+        if module is None:
+            path.unlink(missing_ok=True)
+
+    if module is None:
+        if not compile_missing:
+            return 0
+        module = _import_wiring(compile_container(container, cache_dir=cache_dir))
+
+    install = container.resolver.install_precompiled
+    for key, provider, dependencies, param_names in module.COMPONENTS:
+        install(key, provider, dependencies, frozenset(param_names))
+    return len(module.COMPONENTS)
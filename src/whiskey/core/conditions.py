@@ -2,11 +2,28 @@
 
 This module provides functionality for conditional component registration,
 allowing components to be registered based on runtime conditions.
+
+A plain callable condition is dynamic: it is evaluated on every lookup of
+its component, including every resolution. Conditions can instead be
+wrapped in a CachedCondition:
+
+    - ``static(condition)`` is evaluated the first time it is checked and
+      keeps that result until ``ComponentRegistry.refresh_conditions()``
+      (or ``Container.refresh_conditions()``) is called. Components with a
+      static condition resolve as fast as unconditional ones.
+    - ``dynamic(condition, ttl=5.0)`` is re-evaluated at most every ``ttl``
+      seconds, or on the next check after ``invalidate()``.
+
+The environment helpers (env_equals, env_exists, env_truthy) return static
+conditions, since the environment rarely changes after startup. The
+combinators (all_conditions, any_conditions, not_condition) are static when
+all their parts are, and refreshing or invalidating them reaches their parts.
 """
 
 from __future__ import annotations
 
 import os
+import time
 from typing import Callable
 
 # Type alias for condition functions
@@ -49,6 +66,109 @@ def evaluate_condition(condition: Condition | bool | None) -> bool:
     return False
 
 
+class CachedCondition:
+    """Condition whose result is cached.
+
+    Args:
+        condition: The condition to cache (anything evaluate_condition accepts)
+        ttl: Seconds a result stays valid; None keeps it until invalidate()
+        dynamic: Re-check the component on every lookup even without a ttl
+        parts: Conditions that ``condition`` combines; invalidated with it
+    """
+
+    __slots__ = ("_expires", "_value", "condition", "dynamic", "parts", "ttl")
+
+    def __init__(
+        self,
+        condition: Condition | bool | None,
+        ttl: float | None = None,
+        *,
+        dynamic: bool = False,
+        parts: tuple[Condition, ...] = (),
+    ):
+        if ttl is not None and ttl < 0:
+            raise ValueError(f"Condition ttl must not be negative, got {ttl!r}")
+        self.condition = condition
+        self.ttl = ttl
+        self.dynamic = dynamic
+        self.parts = parts
+        self._value: bool | None = None
+        self._expires = 0.0
+
+    @property
+    def static(self) -> bool:
+        """Whether the result is kept until the registry refreshes conditions."""
+        return self.ttl is None and not self.dynamic
+
+    def __call__(self) -> bool:
+        value = self._value
+        if value is None or (self.ttl is not None and time.monotonic() >= self._expires):
+            value = evaluate_condition(self.condition)
+            self._value = value
+            if self.ttl is not None:
+                self._expires = time.monotonic() + self.ttl
+        return value
+
+    def invalidate(self) -> None:
+        """Re-evaluate the condition, and the conditions it combines, on its next check."""
+        self._value = None
+        for part in self.parts:
+            if isinstance(part, CachedCondition):
+                part.invalidate()
+
+    def __repr__(self) -> str:
+        kind = "static" if self.static else f"ttl={self.ttl}"
+        return f"CachedCondition({self.condition!r}, {kind})"
+
+
+def static(condition: Condition | bool) -> CachedCondition:
+    """Evaluate a condition once, on its first check.
+
+    Example:
+        >>> @provide(condition=static(lambda: feature_flags.load()["search"]))
+        ... class SearchService:
+        ...     pass
+    """
+    return CachedCondition(condition)
+
+
+def dynamic(condition: Condition, ttl: float | None = None) -> CachedCondition:
+    """Cache a condition's result for ``ttl`` seconds.
+
+    With ``ttl=None`` the result is kept until ``invalidate()`` is called on
+    the returned condition. Either way the component is re-checked on every
+    lookup, so a changed result takes effect on the next resolution.
+
+    Example:
+        >>> maintenance = dynamic(lambda: redis.exists("maintenance"), ttl=10.0)
+        >>> @provide(condition=maintenance)
+        ... class MaintenancePage:
+        ...     pass
+    """
+    return CachedCondition(condition, ttl, dynamic=True)
+
+
+def _combine(check: Condition, conditions: tuple[Condition, ...]) -> CachedCondition:
+    """Wrap a composite check so invalidating it reaches the conditions it combines.
+
+    The composite is static if all its parts are; otherwise it is
+    re-evaluated on every check (its cached parts still apply their own
+    caching).
+    """
+    if all(is_static(c) for c in conditions):
+        return CachedCondition(check, parts=conditions)
+    return CachedCondition(check, 0.0, dynamic=True, parts=conditions)
+
+
+def is_static(condition: Condition | bool | None) -> bool:
+    """Whether a condition's result is settled until explicitly refreshed."""
+    return (
+        condition is None
+        or isinstance(condition, bool)
+        or (isinstance(condition, CachedCondition) and condition.static)
+    )
+
+
 class ConditionalRegistry:
     """Registry that tracks conditions for components.
 
@@ -92,14 +212,14 @@ def env_equals(var_name: str, expected_value: str) -> Condition:
         expected_value: Expected value
 
     Returns:
-        A condition function
+        A static condition
 
     Example:
         >>> @provide(condition=env_equals("ENV", "development"))
         ... class DevService:
         ...     pass
     """
-    return lambda: os.getenv(var_name) == expected_value
+    return static(lambda: os.getenv(var_name) == expected_value)
 
 
 def env_exists(var_name: str) -> Condition:
@@ -109,14 +229,14 @@ def env_exists(var_name: str) -> Condition:
         var_name: Environment variable name
 
     Returns:
-        A condition function
+        A static condition
 
     Example:
         >>> @provide(condition=env_exists("DEBUG"))
         ... class DebugService:
         ...     pass
     """
-    return lambda: os.getenv(var_name) is not None
+    return static(lambda: os.getenv(var_name) is not None)
 
 
 def env_truthy(var_name: str) -> Condition:
@@ -126,7 +246,7 @@ def env_truthy(var_name: str) -> Condition:
         var_name: Environment variable name
 
     Returns:
-        A condition function that returns True for "true", "1", "yes", "on"
+        A static condition that holds for "true", "1", "yes", "on"
 
     Example:
         >>> @provide(condition=env_truthy("ENABLE_FEATURE"))
@@ -138,7 +258,7 @@ def env_truthy(var_name: str) -> Condition:
         value = os.getenv(var_name, "").lower()
         return value in ("true", "1", "yes", "on")
 
-    return check
+    return static(check)
 
 
 def all_conditions(*conditions: Condition) -> Condition:
@@ -148,7 +268,7 @@ def all_conditions(*conditions: Condition) -> Condition:
         *conditions: Variable number of conditions
 
     Returns:
-        A condition function that ANDs all conditions
+        A condition function that ANDs all conditions (static if they all are)
 
     Example:
         >>> @provide(condition=all_conditions(
@@ -162,7 +282,7 @@ def all_conditions(*conditions: Condition) -> Condition:
     def check():
         return all(evaluate_condition(c) for c in conditions)
 
-    return check
+    return _combine(check, conditions)
 
 
 def any_conditions(*conditions: Condition) -> Condition:
@@ -172,7 +292,7 @@ def any_conditions(*conditions: Condition) -> Condition:
         *conditions: Variable number of conditions
 
     Returns:
-        A condition function that ORs all conditions
+        A condition function that ORs all conditions (static if they all are)
 
     Example:
         >>> @provide(condition=any_conditions(
@@ -186,7 +306,7 @@ def any_conditions(*conditions: Condition) -> Condition:
     def check():
         return any(evaluate_condition(c) for c in conditions)
 
-    return check
+    return _combine(check, conditions)
 
 
 def not_condition(condition: Condition) -> Condition:
@@ -196,11 +316,15 @@ def not_condition(condition: Condition) -> Condition:
         condition: The condition to negate
 
     Returns:
-        A condition function that returns the opposite
+        A condition function that returns the opposite (static if it is)
 
     Example:
         >>> @provide(condition=not_condition(env_equals("ENV", "production")))
         ... class NonProductionService:
         ...     pass
     """
-    return lambda: not evaluate_condition(condition)
+
+    def check():
+        return not evaluate_condition(condition)
+
+    return _combine(check, (condition,))
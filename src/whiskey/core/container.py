@@ -7,13 +7,15 @@ all resolution logic to the unified resolver system.
 from __future__ import annotations
 
 import asyncio
-import inspect
+import functools
 from contextvars import ContextVar
 from typing import Any, Callable, TypeVar
 
 from .errors import ResolutionError
+from .lifecycle import ShutdownReport, dispose_singletons
+from .pool import PoolCheckout
 from .registry import ComponentDescriptor, ComponentRegistry, Scope
-from .resolver import UnifiedResolver, create_resolver
+from .resolver import InjectionPlan, UnifiedResolver, create_resolver
 from .scopes import ScopeManager
 
 T = TypeVar("T")
@@ -32,15 +34,42 @@ class Container:
     complex resolution logic to the unified resolver system.
     """
     
-    def __init__(self, parent: Container | None = None):
+    def __init__(self, parent: Container | None = None, *, concurrent: bool | None = None):
         """Initialize a new container.
         
+        A child container starts with an empty registry overlaying the
+        parent's. Nothing is copied: keys it doesn't register itself resolve
+        through the parent's compiled plans and singletons.
+        
         Args:
             parent: Optional parent container for hierarchical resolution
+            concurrent: Resolve the injected parameters of async calls with
+                resolve_many() instead of one by one (default: the parent's
+                setting, else False)
         """
         self.parent = parent
-        self.registry = ComponentRegistry()
-        self.resolver = create_resolver(self.registry)
+        if concurrent is None:
+            concurrent = parent.concurrent if parent is not None else False
+        self.concurrent = concurrent
+        if parent is None:
+            self.registry = ComponentRegistry()
+            self.resolver = create_resolver(self.registry)
+        else:
+            self.registry = ComponentRegistry(parent=parent.registry)
+            self.resolver = parent.resolver.create_child(self.registry)
+    
+    def child(self) -> Container:
+        """Create a copy-on-write child container.
+        
+        Registrations made on the child (e.g. a tenant's database or
+        per-request settings) override the parent's for resolutions through
+        the child only. Components of the parent that depend on an overridden
+        key are rebuilt in the child, except singletons, which stay shared.
+        
+        Returns:
+            A new Container whose parent is this container
+        """
+        return Container(parent=self)
     
     # Dict-like interface for registration
     
@@ -100,6 +129,21 @@ class Container:
             key, name=name, scope_context=_active_scopes.get(), **context
         )
     
+    async def resolve_many(self, *keys: str | type) -> list[Any]:
+        """Resolve several components, awaiting independent ones concurrently.
+        
+        Keys whose dependency trees share no async factory are resolved in
+        parallel tasks, so three independent 50ms async factories take about
+        50ms rather than 150ms. Singletons are still created once and scoped
+        components still belong to the active scope.
+        
+        Returns:
+            The instances, in the order of ``keys``
+        """
+        return await self.resolver.resolve_many_async(
+            [(key, None, False) for key in keys], _active_scopes.get()
+        )
+    
     # Function calling with injection
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
@@ -109,64 +153,118 @@ class Container:
         else:
             return self._call_sync(func, *args, **kwargs)
     
-    def _call_sync(self, func: Callable, *args, **kwargs) -> Any:
-        """Synchronous function calling with injection."""
-        if asyncio.iscoroutinefunction(func):
-            raise RuntimeError(f"Cannot call async function '{func.__name__}' synchronously")
-        
-        # Get injection plan
-        analysis = self.resolver.type_resolver.analyze_callable(func)
+    def call_sync(self, func: Callable, *args, **kwargs) -> Any:
+        """Call a function with dependency injection, always synchronously."""
+        return self._call_sync(func, *args, **kwargs)
+    
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Call a sync or async function with dependency injection, always asynchronously."""
+        return await self._call_async(func, *args, **kwargs)
+    
+    async def invoke(self, func: Callable, **overrides) -> Any:
+        """Invoke a function with full dependency injection (asynchronous)."""
+        return await self._call_async(func, **overrides)
+    
+    def wrap_with_injection(self, func: Callable) -> Callable:
+        """Wrap a function so every call goes through dependency injection.
         
-        # Build final kwargs
-        sig = inspect.signature(func)
-        final_kwargs = {}
+        The injection plan is compiled here and bound to the wrapper, so calls
+        skip the plan cache lookup unless the registry has changed since.
+        """
+        resolver = self.resolver
+        registry = self.registry
+        plan = resolver.get_injection_plan(func)
         
-        for i, (param_name, _param) in enumerate(sig.parameters.items()):
-            if i < len(args):
-                continue  # Provided via args
+        if plan.is_async:
             
-            if param_name in kwargs:
-                final_kwargs[param_name] = kwargs[param_name]
-            elif param_name in analysis:
-                inject_result = analysis[param_name]
-                if inject_result.decision.value == "inject":
-                    final_kwargs[param_name] = self.resolve_sync(inject_result.type_hint)
-                elif inject_result.decision.value == "optional":
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                nonlocal plan
+                if plan.version != registry.version:
+                    plan = resolver.get_injection_plan(func)
+                return await self._call_plan_async(func, plan, args, kwargs)
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            nonlocal plan
+            if plan.version != registry.version:
+                plan = resolver.get_injection_plan(func)
+            return self._call_plan_sync(func, plan, args, kwargs)
+        
+        return sync_wrapper
+    
+    def _call_sync(self, func: Callable, *args, **kwargs) -> Any:
+        """Synchronous function calling with injection."""
+        plan = self.resolver.get_injection_plan(func)
+        if plan.is_async:
+            raise RuntimeError(f"Cannot call async function '{func.__name__}' synchronously")
+        return self._call_plan_sync(func, plan, args, kwargs)
+    
+    async def _call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Asynchronous function calling with injection."""
+        plan = self.resolver.get_injection_plan(func)
+        return await self._call_plan_async(func, plan, args, kwargs)
+    
+    def _call_plan_sync(
+        self, func: Callable, plan: InjectionPlan, args: tuple, kwargs: dict[str, Any]
+    ) -> Any:
+        """Call a function through its compiled injection plan (sync)."""
+        final_kwargs = plan.select_kwargs(len(args), kwargs)
+        if plan.injections:
+            num_args = len(args)
+            scope_context = _active_scopes.get()
+            resolve = self.resolver._resolve_sync
+            for position, param_name, dep_key, optional in plan.injections:
+                if position < num_args or param_name in final_kwargs:
+                    continue  # Provided by the caller
+                if optional:
                     try:
-                        final_kwargs[param_name] = self.resolve_sync(inject_result.inner_type)
+                        final_kwargs[param_name] = resolve(dep_key, scope_context=scope_context)
                     except ResolutionError:
                         final_kwargs[param_name] = None
+                else:
+                    final_kwargs[param_name] = resolve(dep_key, scope_context=scope_context)
         
         return func(*args, **final_kwargs)
     
-    async def _call_async(self, func: Callable, *args, **kwargs) -> Any:
-        """Asynchronous function calling with injection."""
-        # Get injection plan
-        analysis = self.resolver.type_resolver.analyze_callable(func)
-        
-        # Build final kwargs
-        sig = inspect.signature(func)
-        final_kwargs = {}
-        
-        for i, (param_name, _param) in enumerate(sig.parameters.items()):
-            if i < len(args):
-                continue  # Provided via args
-            
-            if param_name in kwargs:
-                final_kwargs[param_name] = kwargs[param_name]
-            elif param_name in analysis:
-                inject_result = analysis[param_name]
-                if inject_result.decision.value == "inject":
-                    final_kwargs[param_name] = await self.resolve_async(inject_result.type_hint)
-                elif inject_result.decision.value == "optional":
+    async def _call_plan_async(
+        self, func: Callable, plan: InjectionPlan, args: tuple, kwargs: dict[str, Any]
+    ) -> Any:
+        """Call a function through its compiled injection plan (async)."""
+        final_kwargs = plan.select_kwargs(len(args), kwargs)
+        if plan.injections and self.concurrent:
+            num_args = len(args)
+            pending = [
+                (param_name, dep_key, optional)
+                for position, param_name, dep_key, optional in plan.injections
+                if position >= num_args and param_name not in final_kwargs
+            ]
+            values = await self.resolver.resolve_many_async(
+                [(dep_key, None, optional) for _, dep_key, optional in pending],
+                _active_scopes.get(),
+            )
+            for (param_name, _, _), value in zip(pending, values):
+                final_kwargs[param_name] = value
+        elif plan.injections:
+            num_args = len(args)
+            scope_context = _active_scopes.get()
+            resolve = self.resolver._resolve_async
+            for position, param_name, dep_key, optional in plan.injections:
+                if position < num_args or param_name in final_kwargs:
+                    continue  # Provided by the caller
+                if optional:
                     try:
-                        final_kwargs[param_name] = await self.resolve_async(
-                            inject_result.inner_type
+                        final_kwargs[param_name] = await resolve(
+                            dep_key, scope_context=scope_context
                         )
                     except ResolutionError:
                         final_kwargs[param_name] = None
+                else:
+                    final_kwargs[param_name] = await resolve(dep_key, scope_context=scope_context)
         
-        if asyncio.iscoroutinefunction(func):
+        if plan.is_async:
             return await func(*args, **final_kwargs)
         else:
             return func(*args, **final_kwargs)
@@ -210,6 +308,38 @@ class Container:
         """Register a factory function."""
         return self.register(key, factory_func, **kwargs)
     
+    # Frozen mode
+    
+    def freeze(self) -> None:
+        """Validate all registrations and switch to precomputed, read-only lookups.
+        
+        Missing dependencies, circular dependencies and singletons depending
+        on scoped components are reported together. Conditions are evaluated
+        once; afterwards registering or removing components raises
+        RegistrationError and resolution no longer consults the registry.
+        
+        Raises:
+            ConfigurationError: If the dependency graph is invalid
+        """
+        self.resolver.freeze()
+    
+    def refresh_conditions(self) -> None:
+        """Re-evaluate static and cached registration conditions.
+        
+        Static conditions (see whiskey.core.conditions) are evaluated once;
+        call this after changing what they depend on, such as environment
+        variables. Compiled plans are rebuilt on next use.
+        
+        Raises:
+            RegistrationError: If the container is frozen
+        """
+        self.registry.refresh_conditions()
+    
+    @property
+    def frozen(self) -> bool:
+        """Whether freeze() has been called."""
+        return self.resolver.frozen
+    
     # Scope management
     
     def scope(self, scope_name: str) -> ScopeManager:
@@ -217,7 +347,11 @@ class Container:
         return ScopeManager(self, scope_name)
     
     def enter_scope(self, scope_name: str) -> None:
-        """Enter a named scope."""
+        """Enter a named scope.
+        
+        Each activation gets its own instance dict in the current context, so
+        concurrent tasks entering the same scope name stay isolated.
+        """
         active_scopes = _active_scopes.get() or {}
         active_scopes = active_scopes.copy()
         active_scopes[scope_name] = {}
@@ -225,16 +359,63 @@ class Container:
     
     def exit_scope(self, scope_name: str) -> None:
         """Exit a named scope."""
-        # Clear scope cache
-        self.resolver.scope_resolver.clear_scope(scope_name)
+        active_scopes = _active_scopes.get()
+        
+        # Clear only this activation's instances
+        self.resolver.scope_resolver.clear_scope(scope_name, active_scopes)
         
         # Update context
-        active_scopes = _active_scopes.get()
         if active_scopes and scope_name in active_scopes:
             active_scopes = active_scopes.copy()
             del active_scopes[scope_name]
             _active_scopes.set(active_scopes if active_scopes else None)
     
+    # Pooled components
+    
+    def checkout(self, key: str | type, *, name: str | None = None) -> PoolCheckout:
+        """Check out an instance that is returned to its pool when the block exits.
+        
+        Use ``with`` or ``async with``. For a component registered with
+        ``pooled=N`` an idle instance is reused if available; other components
+        resolve as usual.
+        """
+        return PoolCheckout(self.resolver, key, name, _active_scopes.get)
+    
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Created, reused, released, discarded, idle and in-use counts per pool."""
+        return self.resolver.pool_stats()
+    
+    # Cache management and disposal
+    
+    def clear_caches(self) -> None:
+        """Drop cached singletons and compiled plans without disposing anything."""
+        self.resolver.scope_resolver.forget_singletons()
+        self.resolver.invalidate_plans()
+        self.resolver._injection_plans.clear()
+    
+    def clear_singletons(self, *, timeout: float | None = None) -> ShutdownReport:
+        """Dispose created singletons, dependents first, and drop them from the cache.
+        
+        Must be called outside a running event loop; in async code use
+        ``await clear_singletons_async()``.
+        """
+        if asyncio._get_running_loop() is not None:
+            raise RuntimeError(
+                "Cannot use clear_singletons() in async context. "
+                "Use 'await clear_singletons_async()' instead."
+            )
+        return asyncio.run(self.clear_singletons_async(timeout=timeout))
+    
+    async def clear_singletons_async(
+        self, *, max_concurrency: int | None = None, timeout: float | None = None
+    ) -> ShutdownReport:
+        """Dispose created singletons concurrently in reverse dependency order.
+        
+        Only singletons that were actually created are disposed. dispose()
+        errors and timeouts are collected in the returned report.
+        """
+        return await dispose_singletons(self, max_concurrency=max_concurrency, timeout=timeout)
+    
     # Generic type support
     
     def register_generic_implementation(self, generic_type: Any, concrete_type: type) -> None:
@@ -57,7 +57,6 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from functools import wraps
 from typing import Any, Callable, TypeVar
 
 from .application import Whiskey, create_default_app
@@ -279,23 +278,8 @@ def inject(
 
     def decorator(func: Callable) -> Callable:
         target_app = app or _get_default_app()
-
-        if asyncio.iscoroutinefunction(func):
-
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                # Use container's call method with provided args/kwargs
-                return await target_app.container.call(func, *args, **kwargs)
-
-            return async_wrapper
-        else:
-
-            @wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                # Use container's call_sync method
-                return target_app.container.call_sync(func, *args, **kwargs)
-
-            return sync_wrapper
+        # Compiles the injection plan now and binds it to the wrapper
+        return target_app.container.wrap_with_injection(func)
 
     if func is None:
         return decorator
@@ -12,6 +12,7 @@ Classes:
 
 Functions:
     discover_components: Find components in modules/packages
+    scan_source: Statically find decorated classes in Python source
     is_component: Check if object has component markers
     get_component_metadata: Extract registration metadata
     auto_register: Register discovered components
@@ -21,6 +22,7 @@ Discovery Methods:
     2. Naming convention: Classes ending with Component, Repository, etc.
     3. Base class: Classes inheriting from specific interfaces
     4. Custom predicates: Any callable returning bool
+    5. Static: Parse source files for decorated classes without importing them
 
 Features:
     - Recursive package scanning with exclusion patterns
@@ -30,6 +32,21 @@ Features:
     - Discovery caching for performance
     - Detailed discovery reports
 
+Static Discovery:
+    ``ComponentDiscoverer.discover_package_static()`` never imports the
+    package's modules. It parses each source file with ``ast``, looks for
+    top-level classes decorated with ``@component``, ``@singleton``,
+    ``@scoped`` (or custom decorator names) and registers them with an
+    ImportRef provider, so a module is imported the first time one of its
+    components is resolved.
+
+    Scan results are cached in a JSON manifest keyed by each file's mtime
+    and size; unchanged files are never re-parsed. When many files need
+    parsing they are spread over a process pool. Decorators whose arguments
+    are not literals (e.g. ``condition=...``) cannot be described statically;
+    the modules defining them are imported at discovery time and their
+    classes registered with the options the decorators gave them.
+
 Example:
     >>> from whiskey import Whiskey
     >>> from whiskey.core.discovery import discover_components
@@ -75,15 +92,242 @@ Best Practices:
 
 from __future__ import annotations
 
+import ast
+import concurrent.futures
+import hashlib
 import importlib
+import importlib.util
 import inspect
+import json
+import os
 import pkgutil
+from pathlib import Path
 from typing import Any, Callable, TypeVar
 
 from whiskey.core.container import Container
+from whiskey.core.registry import ComponentDescriptor, ImportRef, Scope
 
 T = TypeVar("T")
 
+# Decorator names recognized by static discovery and the scope each implies
+STATIC_DECORATORS: dict[str, Scope] = {
+    "component": Scope.TRANSIENT,
+    "transient": Scope.TRANSIENT,
+    "singleton": Scope.SINGLETON,
+    "scoped": Scope.SCOPED,
+}
+
+# Bump when the manifest layout or the scanning rules change
+MANIFEST_VERSION = 2
+
+# Number of files to parse before a process pool is worth its startup cost
+PARALLEL_THRESHOLD = 64
+
+
+class _DynamicArgumentError(Exception):
+    """Raised when a decorator argument cannot be evaluated without importing."""
+
+
+def _static_key(node: ast.expr) -> str:
+    """Registration key from a ``key=`` argument (a name or string literal)."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    raise _DynamicArgumentError(ast.dump(node))
+
+
+def _static_registration(class_name: str, scope: str, call: ast.Call | None) -> dict[str, Any]:
+    """Evaluate a decorator's arguments the way the runtime decorators do."""
+    key = name = None
+    scope_name = "default"
+    tags: list[str] = []
+    lazy = False
+    metadata: dict[str, Any] = {}
+
+    if call is not None:
+        args = list(call.args)
+        if args and scope == Scope.SCOPED.value:
+            # Global @scoped("request") takes the scope name positionally
+            scope_name = ast.literal_eval(args.pop(0))
+        if args:
+            raise _DynamicArgumentError("positional arguments")
+
+        for keyword in call.keywords:
+            if keyword.arg == "app":
+                continue
+            if keyword.arg == "key":
+                key = _static_key(keyword.value)
+            elif keyword.arg == "scope":
+                value = keyword.value
+                if not (isinstance(value, ast.Attribute) and value.attr in Scope.__members__):
+                    raise _DynamicArgumentError("scope")
+                scope = Scope[value.attr].value
+            elif keyword.arg == "name":
+                name = ast.literal_eval(keyword.value)
+            elif keyword.arg == "scope_name":
+                scope_name = ast.literal_eval(keyword.value)
+            elif keyword.arg == "tags":
+                tags = sorted(ast.literal_eval(keyword.value) or ())
+            elif keyword.arg == "lazy":
+                lazy = bool(ast.literal_eval(keyword.value))
+            elif keyword.arg == "metadata":
+                metadata.update(ast.literal_eval(keyword.value) or {})
+            elif keyword.arg == "priority":
+                metadata["priority"] = ast.literal_eval(keyword.value)
+            else:
+                # condition=..., **options and anything unknown
+                raise _DynamicArgumentError(keyword.arg or "**")
+
+    if json.loads(json.dumps(metadata)) != metadata:
+        raise _DynamicArgumentError("metadata")
+
+    # Mirror Whiskey.component()/scoped(): a name replaces the key for
+    # components but qualifies it for scoped components
+    if scope == Scope.SCOPED.value:
+        key = key or class_name
+        metadata["scope_name"] = scope_name
+    elif name is not None:
+        key, name = name, None
+    else:
+        key = key or class_name
+
+    return {
+        "key": key,
+        "name": name,
+        "scope": scope,
+        "tags": tags,
+        "lazy": lazy,
+        "metadata": metadata,
+    }
+
+
+def scan_source(
+    source: str | bytes, module_name: str, decorators: dict[str, str] | None = None
+) -> list[dict[str, Any]]:
+    """Find decorated top-level classes in Python source without executing it.
+
+    Args:
+        source: Module source code
+        module_name: Fully qualified name the module is imported under
+        decorators: Decorator name -> scope value (defaults to STATIC_DECORATORS)
+
+    Returns:
+        One JSON-compatible entry per decorated class with its module,
+        qualname and registration options, or ``dynamic: True`` if the
+        options can only be known by importing the module
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    if decorators is None:
+        decorators = {name: scope.value for name, scope in STATIC_DECORATORS.items()}
+
+    entries = []
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            call = decorator if isinstance(decorator, ast.Call) else None
+            target = call.func if call is not None else decorator
+            if isinstance(target, ast.Name):
+                decorator_name = target.id
+            elif isinstance(target, ast.Attribute):
+                decorator_name = target.attr
+            else:
+                continue
+            scope = decorators.get(decorator_name)
+            if scope is None:
+                continue
+
+            entry: dict[str, Any] = {"module": module_name, "qualname": node.name}
+            try:
+                entry.update(_static_registration(node.name, scope, call))
+            except (_DynamicArgumentError, ValueError, TypeError, SyntaxError):
+                entry.update(dynamic=True, scope=scope)
+            entries.append(entry)
+            break
+
+    return entries
+
+
+def _scan_file(job: tuple[str, str, dict[str, str]]) -> list[dict[str, Any]]:
+    """Scan one file (module-level so it can run in a worker process)."""
+    path, module_name, decorators = job
+    try:
+        with open(path, "rb") as f:
+            return scan_source(f.read(), module_name, decorators)
+    except (OSError, SyntaxError, ValueError):
+        # Import-based discovery skips modules that fail to import, too
+        return []
+
+
+def _package_files(package: str, recursive: bool) -> list[tuple[str, str]]:
+    """Locate a package's source files and their module names without importing them."""
+    spec = importlib.util.find_spec(package)
+    if spec is None:
+        return []
+    if spec.submodule_search_locations is None:
+        return [(spec.origin, package)] if spec.origin and spec.origin.endswith(".py") else []
+
+    files = []
+    for root in spec.submodule_search_locations:
+        for dirpath, dirnames, filenames in os.walk(root):
+            relative = os.path.relpath(dirpath, root)
+            parts = [] if relative == os.curdir else relative.split(os.sep)
+            if parts and "__init__.py" not in filenames:
+                # Not a regular package; walk_packages skips these as well
+                dirnames[:] = []
+                continue
+            dirnames[:] = (
+                sorted(d for d in dirnames if d != "__pycache__" and d.isidentifier())
+                if recursive
+                else []
+            )
+
+            prefix = ".".join([package, *parts])
+            for filename in sorted(filenames):
+                if not filename.endswith(".py"):
+                    continue
+                stem = filename[:-3]
+                if stem == "__init__":
+                    files.append((os.path.join(dirpath, filename), prefix))
+                elif recursive and stem.isidentifier():
+                    files.append((os.path.join(dirpath, filename), f"{prefix}.{stem}"))
+    return files
+
+
+def _manifest_path(
+    cache_dir: str | Path | None, package: str, recursive: bool, decorators: dict[str, str]
+) -> Path:
+    """Location of the discovery manifest for a package and decorator set."""
+    from .compiler import default_cache_dir
+
+    spec = importlib.util.find_spec(package)
+    roots = sorted(spec.submodule_search_locations or [spec.origin]) if spec else []
+    digest = hashlib.sha256(
+        json.dumps(
+            [MANIFEST_VERSION, package, roots, recursive, sorted(decorators.items())]
+        ).encode()
+    ).hexdigest()
+    return Path(cache_dir or default_cache_dir()) / f"whiskey_discovery_{digest[:24]}.json"
+
+
+def _parse_files(
+    jobs: list[tuple[str, str, dict[str, str]]], processes: int | None
+) -> list[list[dict[str, Any]]]:
+    """Scan files, in a process pool when there are enough of them."""
+    if len(jobs) >= PARALLEL_THRESHOLD and processes != 1:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                return list(executor.map(_scan_file, jobs, chunksize=16))
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            # No usable worker processes here - parse inline instead
+            pass
+    return [_scan_file(job) for job in jobs]
+
 
 class ComponentDiscoverer:
     """Discovers and optionally registers components in modules and packages.
@@ -254,6 +498,153 @@ class ComponentDiscoverer:
 
         return discovered
 
+    def discover_package_static(
+        self,
+        package: str,
+        *,
+        recursive: bool = True,
+        decorators: dict[str, Scope] | None = None,
+        cache_dir: str | Path | None = None,
+        processes: int | None = None,
+    ) -> set[str]:
+        """Register a package's decorated classes without importing its modules.
+
+        Source files are parsed with ``ast``; results are cached in a
+        manifest under ``cache_dir`` and reused for files whose mtime and
+        size are unchanged. Each component is registered with an ImportRef
+        provider, so its module is imported on first resolution. Keys that
+        are already registered are left alone.
+
+        Args:
+            package: Fully qualified package (or module) name
+            recursive: Whether to scan subpackages
+            decorators: Extra decorator names and the scope they imply, on
+                top of STATIC_DECORATORS
+            cache_dir: Where the manifest lives (defaults to
+                ``whiskey.core.compiler.default_cache_dir()``)
+            processes: Worker processes for parsing (None for one per CPU,
+                1 to always parse in this process)
+
+        Returns:
+            Keys of the components registered by this call
+
+        Examples:
+            >>> discoverer.discover_package_static(
+            ...     "myapp",
+            ...     decorators={"repository": Scope.SINGLETON},
+            ... )
+            {'UserRepository', 'OrderService', ...}
+        """
+        decorator_scopes = {name: scope.value for name, scope in STATIC_DECORATORS.items()}
+        for name, scope in (decorators or {}).items():
+            decorator_scopes[name] = Scope(scope).value
+
+        files = _package_files(package, recursive)
+        manifest_path = _manifest_path(cache_dir, package, recursive, decorator_scopes)
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("version") != MANIFEST_VERSION:
+                manifest = {}
+        except (OSError, ValueError):
+            manifest = {}
+        cached = manifest.get("files", {})
+
+        entries: dict[str, list[Any]] = {}
+        jobs = []
+        for path, module_name in files:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            previous = cached.get(path)
+            if previous and previous[:3] == [stat.st_mtime_ns, stat.st_size, module_name]:
+                entries[path] = previous
+            else:
+                entries[path] = [stat.st_mtime_ns, stat.st_size, module_name, None]
+                jobs.append((path, module_name, decorator_scopes))
+
+        for (path, _, _), components in zip(jobs, _parse_files(jobs, processes)):
+            entries[path][3] = components
+
+        if jobs or set(cached) != set(entries):
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            temp.write_text(
+                json.dumps({"version": MANIFEST_VERSION, "files": entries}), encoding="utf-8"
+            )
+            os.replace(temp, manifest_path)
+
+        registry = self.container.registry
+        registered = set()
+        dynamic_components = []
+        for _, _, _, components in entries.values():
+            for component in components:
+                if component.get("dynamic"):
+                    dynamic_components.append(component)
+                    continue
+                if registry.has_local(component["key"], component["name"]):
+                    continue
+                descriptor = self.container.register(
+                    component["key"],
+                    ImportRef(component["module"], component["qualname"]),
+                    scope=Scope(component["scope"]),
+                    name=component["name"],
+                    tags=set(component["tags"]),
+                    lazy=component["lazy"],
+                    metadata=dict(component["metadata"]),
+                )
+                registered.add(descriptor.key)
+
+        # Options only known at runtime: import the classes so their decorators run
+        for component in dynamic_components:
+            try:
+                cls = ImportRef(component["module"], component["qualname"]).load()
+            except (ImportError, AttributeError):
+                continue
+            descriptor = self._register_imported(cls, Scope(component["scope"]))
+            if descriptor is not None:
+                registered.add(descriptor.key)
+
+        return registered
+
+    def _register_imported(self, cls: type, scope: Scope) -> ComponentDescriptor | None:
+        """Register a class found by static discovery whose module had to be imported.
+
+        Whiskey's global decorators register into the default application, so
+        the registration they made there is copied, condition included.
+        Classes registered elsewhere (or by custom decorators) are registered
+        with the scope their decorator implies.
+
+        Returns:
+            The new descriptor, or None if the class is already registered
+        """
+        from whiskey.core import decorators
+
+        default_app = decorators._default_app
+        source = None
+        if default_app is not None and default_app.container is not self.container:
+            source = next(
+                (d for d in default_app.container.registry.list_all() if d.provider is cls),
+                None,
+            )
+        if source is None:
+            if cls in self.container:
+                return None
+            return self.container.register(cls, cls, scope=scope)
+
+        if self.container.registry.has_local(source.key, source.name):
+            return None
+        return self.container.register(
+            source.component_type,
+            cls,
+            scope=source.scope,
+            name=source.name,
+            condition=source.condition,
+            tags=set(source.tags),
+            lazy=source.lazy,
+            metadata=dict(source.metadata),
+        )
+
     def auto_register(
         self,
         components: set[type],
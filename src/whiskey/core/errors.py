@@ -78,12 +78,13 @@ class CircularDependencyError(ResolutionError):
 
     def __init__(self, cycle: list[type]):
         self.cycle = cycle
-        cycle_names = [cls.__name__ for cls in cycle]
+        # Keys may be strings or other non-class objects
+        cycle_names = [getattr(cls, "__name__", str(cls)) for cls in cycle]
         cycle_str = " → ".join([*cycle_names, cycle_names[0]])
 
         super().__init__(
             f"Circular dependency detected: {cycle_str}",
-            service_key=cycle[0].__name__.lower() if cycle else None,
+            service_key=cycle_names[0].lower() if cycle else None,
         )
 
 
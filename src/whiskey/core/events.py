@@ -0,0 +1,238 @@
+"""Event dispatch for Whiskey applications.
+
+``Whiskey.emit`` delivers events through an EventDispatcher. Handlers are
+classified as sync or async once, when they are registered, and the handlers
+an event name reaches are compiled into a single tuple the first time it is
+emitted; later emits of the same name are one cache lookup. Registering a
+handler invalidates the compiled tuples.
+
+Handlers subscribe to an exact event name or to a glob pattern:
+    - ``"user.created"``: that event only
+    - ``"user.*"``, ``"*.failed"``, ``"job.[ab]"``: fnmatch-style patterns
+    - ``"*"``: every event; these handlers receive the event name as their
+      first argument
+
+Patterns are indexed by their first dot-separated segment, so compiling an
+event name only tests the patterns that could match it (plus those starting
+with a wildcard). Handlers run in registration order: exact handlers first,
+then pattern handlers.
+
+Dispatch is serial by default. With ``concurrent=True`` sync handlers run
+first and async handlers are then awaited together with ``asyncio.gather``.
+
+Fire-and-forget events (``post()``) go through a queue consumed by a single
+background task started on first use. A bounded queue applies backpressure
+by dropping events when full; ``stats()`` reports how many were queued,
+dispatched, dropped and failed, and the deepest the queue has been.
+
+Classes:
+    EventDispatcher: Registry and dispatcher of event handlers
+
+Example:
+    >>> events = EventDispatcher(concurrent=True, queue_size=10_000)
+    >>> events.add("ml.training.*", record_metrics)
+    >>> await events.dispatch("ml.training.metrics", {"loss": 0.1})
+    >>> events.post("ml.training.metrics", {"loss": 0.09})  # returns at once
+    >>> events.stats()
+    {'queued': 1, 'dispatched': 0, 'dropped': 0, 'failed': 0, 'depth': 1, ...}
+
+See Also:
+    - whiskey.core.application: Whiskey.on, Whiskey.emit and Whiskey.post
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fnmatch
+import re
+from collections.abc import Awaitable
+from typing import Any, Callable
+
+from .performance import LRUCache
+
+# Characters that make an event name a glob pattern
+_GLOB_CHARS = frozenset("*?[")
+
+# Index bucket for patterns whose first segment contains a wildcard
+_ANY_PREFIX = ""
+
+# (handler, is_async, receives_event_name)
+_Handler = tuple[Callable, bool, bool]
+
+
+def is_pattern(event: str) -> bool:
+    """Whether an event name is a glob pattern."""
+    return not _GLOB_CHARS.isdisjoint(event)
+
+
+def _prefix(pattern: str) -> str:
+    """Index bucket of a pattern: its first segment if that has no wildcard."""
+    head = pattern.partition(".")[0]
+    return head if head != pattern and not is_pattern(head) else _ANY_PREFIX
+
+
+class EventDispatcher:
+    """Registry and dispatcher of event handlers.
+
+    Args:
+        concurrent: Await the async handlers of one event together
+        queue_size: Capacity of the post() queue (None for unbounded)
+        on_error: Awaited with exceptions raised by handlers of posted events
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrent: bool = False,
+        queue_size: int | None = None,
+        on_error: Callable[[Exception], Awaitable[Any]] | None = None,
+    ):
+        if queue_size is not None and queue_size < 1:
+            raise ValueError(f"queue_size must be a positive integer, got {queue_size!r}")
+        self.concurrent = concurrent
+        self.queue_size = queue_size
+        self.on_error = on_error
+        self._exact: dict[str, list[_Handler]] = {}
+        # Prefix bucket -> [(order, matcher, handler)]
+        self._patterns: dict[str, list[tuple[int, Callable, _Handler]]] = {}
+        self._pattern_count = 0
+        self._compiled = LRUCache("events.dispatch", 1024)
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._queued = 0
+        self._dispatched = 0
+        self._dropped = 0
+        self._failed = 0
+        self._max_depth = 0
+
+    # Registration
+
+    def add(self, event: str, handler: Callable) -> None:
+        """Subscribe a handler to an event name or glob pattern."""
+        entry = (handler, asyncio.iscoroutinefunction(handler), event == "*")
+        if is_pattern(event):
+            matcher = re.compile(fnmatch.translate(event)).match
+            self._patterns.setdefault(_prefix(event), []).append(
+                (self._pattern_count, matcher, entry)
+            )
+            self._pattern_count += 1
+        else:
+            self._exact.setdefault(event, []).append(entry)
+        self._compiled.clear()
+
+    def handlers(self, event: str) -> tuple[_Handler, ...]:
+        """Compiled handlers an event name reaches, in dispatch order."""
+        compiled = self._compiled.get(event)
+        if compiled is None:
+            compiled = self._compile(event)
+            self._compiled[event] = compiled
+        return compiled
+
+    def _compile(self, event: str) -> tuple[_Handler, ...]:
+        candidates = self._patterns.get(_ANY_PREFIX, [])
+        head = event.partition(".")[0]
+        if head != event and head in self._patterns:
+            candidates = candidates + self._patterns[head]
+        matched = sorted((order, entry) for order, matcher, entry in candidates if matcher(event))
+        return (*self._exact.get(event, ()), *(entry for _, entry in matched))
+
+    # Dispatch
+
+    async def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """Call every handler of ``event`` and wait for them to finish."""
+        handlers = self.handlers(event)
+        if not handlers:
+            return
+        if self.concurrent and len(handlers) > 1:
+            await self._dispatch_concurrent(handlers, event, args, kwargs)
+            return
+        for handler, is_async, with_event in handlers:
+            call_args = (event, *args) if with_event else args
+            if is_async:
+                await handler(*call_args, **kwargs)
+            else:
+                handler(*call_args, **kwargs)
+
+    async def _dispatch_concurrent(
+        self, handlers: tuple[_Handler, ...], event: str, args: tuple, kwargs: dict
+    ) -> None:
+        pending = []
+        for handler, is_async, with_event in handlers:
+            call_args = (event, *args) if with_event else args
+            if is_async:
+                pending.append(handler(*call_args, **kwargs))
+            else:
+                handler(*call_args, **kwargs)
+        if pending:
+            await asyncio.gather(*pending)
+
+    # Background queue
+
+    def post(self, event: str, *args: Any, **kwargs: Any) -> bool:
+        """Queue an event for background dispatch without waiting for handlers.
+
+        Must be called from the event loop's thread. Events no handler
+        subscribes to are discarded without being queued.
+
+        Returns:
+            False if the queue was full and the event was dropped
+        """
+        if not self.handlers(event):
+            return True
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size or 0)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._consume(self._queue))
+        try:
+            self._queue.put_nowait((event, args, kwargs))
+        except asyncio.QueueFull:
+            self._dropped += 1
+            return False
+        self._queued += 1
+        self._max_depth = max(self._max_depth, self._queue.qsize())
+        return True
+
+    async def _consume(self, queue: asyncio.Queue) -> None:
+        while True:
+            event, args, kwargs = await queue.get()
+            try:
+                await self.dispatch(event, *args, **kwargs)
+                self._dispatched += 1
+            except Exception as error:
+                self._failed += 1
+                if self.on_error is not None:
+                    with contextlib.suppress(Exception):
+                        await self.on_error(error)
+            finally:
+                queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every posted event has been dispatched."""
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Drain the queue and stop the background task."""
+        await self.drain()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        self._queue = None
+
+    def stats(self) -> dict[str, int | None]:
+        """Counters of the post() queue.
+
+        Keys: queued, dispatched, dropped, failed, depth (events waiting now),
+        max_depth (deepest the queue has been) and maxsize.
+        """
+        return {
+            "queued": self._queued,
+            "dispatched": self._dispatched,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_depth": self._max_depth,
+            "maxsize": self.queue_size,
+        }
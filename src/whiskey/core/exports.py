@@ -0,0 +1,61 @@
+"""Lazy package exports.
+
+Package ``__init__`` modules use this to expose their public names without
+importing the modules that define them. A name's module is imported the first
+time the name is accessed (PEP 562 module ``__getattr__``), so ``import whiskey``
+or ``import whiskey_http`` stays cheap and optional backends such as ``httpx``
+or ``click`` load only when the feature that needs them is used.
+
+Functions:
+    lazy_exports: Build ``__getattr__`` and ``__dir__`` for a package
+
+Example:
+    >>> # mypackage/__init__.py
+    >>> __getattr__, __dir__ = lazy_exports(
+    ...     __name__,
+    ...     {
+    ...         ".client": ("Client", "connect"),
+    ...         ".errors": ("ClientError",),
+    ...     },
+    ... )
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, tuple[str, ...]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Once loaded, a name is stored in the package namespace so later accesses
+    are plain attribute lookups.
+
+    Args:
+        package: ``__name__`` of the exporting package
+        exports: Module (absolute, or relative to ``package``) -> names it
+            defines that the package exports
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package
+    """
+    namespace = sys.modules[package].__dict__
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def load(name: str) -> Any:
+        try:
+            module_name = modules[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def names() -> list[str]:
+        return sorted({*namespace, *modules})
+
+    return load, names
@@ -14,6 +14,15 @@ Features:
     - Generic constraint validation
     - Automatic concrete type discovery
     - Protocol and ABC generic support
+
+Indexed Lookup:
+    Discovery asks the registry's interface index for the registered
+    subclasses of a generic origin instead of scanning every component, and
+    each resolved ``Repository[User]``-style type is memoized. A memoized
+    result stays valid until an implementation of the same origin is
+    registered or removed (``ComponentRegistry.interface_version``) or
+    ``register_concrete()`` is called for that origin; unrelated
+    registrations leave it alone. Condition changes are not tracked.
 """
 
 from __future__ import annotations
@@ -23,6 +32,7 @@ from collections import defaultdict
 from typing import Any, TypeVar, get_args, get_origin, get_type_hints
 
 from .errors import TypeAnalysisError
+from .performance import LRUCache
 
 
 class GenericTypeResolver:
@@ -48,8 +58,12 @@ class GenericTypeResolver:
         """
         self.registry = registry
         self._generic_mappings: dict[Any, list[type]] = defaultdict(list)
-        self._type_parameter_cache: dict[tuple, dict] = {}
-        self._variance_cache: dict[type, dict] = {}
+        self._type_parameter_cache: LRUCache = LRUCache("generic.type_parameters")
+        self._variance_cache: LRUCache = LRUCache("generic.variance", weak_keys=True)
+        # Parameterized type -> (validity stamp, resolved implementation or None)
+        self._resolution_cache: LRUCache = LRUCache("generic.resolutions")
+        # Bumped by register_concrete() per generic origin
+        self._mapping_versions: dict[Any, int] = defaultdict(int)
 
     def register_concrete(self, generic_type: Any, concrete_type: type) -> None:
         """Register a concrete implementation for a generic type.
@@ -70,6 +84,7 @@ class GenericTypeResolver:
 
         # Also register by origin for fallback
         self._generic_mappings[origin].append(concrete_type)
+        self._mapping_versions[origin] += 1
 
     def resolve_generic(self, generic_type: Any) -> type | None:
         """Resolve a generic type to a concrete implementation.
@@ -84,6 +99,29 @@ class GenericTypeResolver:
             >>> concrete = resolver.resolve_generic(Repository[User])
             >>> # Returns UserRepository if registered
         """
+        origin = get_origin(generic_type)
+        if origin is None:
+            return self._resolve_generic_uncached(generic_type)
+
+        try:
+            stamp = (
+                self._mapping_versions.get(origin, 0),
+                self.registry.interface_version(origin) if self.registry else 0,
+            )
+            cached = self._resolution_cache.get(generic_type)
+        except TypeError:
+            # Unhashable type arguments - resolve without memoizing
+            return self._resolve_generic_uncached(generic_type)
+
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        result = self._resolve_generic_uncached(generic_type)
+        self._resolution_cache[generic_type] = (stamp, result)
+        return result
+
+    def _resolve_generic_uncached(self, generic_type: Any) -> type | None:
+        """Resolve a generic type by mapping lookup, scoring and discovery."""
         # Direct lookup first
         if generic_type in self._generic_mappings:
             candidates = self._generic_mappings[generic_type]
@@ -293,8 +331,9 @@ class GenericTypeResolver:
         if not origin:
             return None
 
-        # Look for classes that inherit from the generic origin
-        for descriptor in self.registry.list_all():
+        # Look for classes that inherit from the generic origin; the
+        # registry's interface index lists exactly those
+        for descriptor in self.registry.get_all(origin):
             component_type = descriptor.component_type
 
             if not inspect.isclass(component_type):
@@ -524,6 +563,7 @@ class GenericTypeResolver:
         """Clear all caches."""
         self._type_parameter_cache.clear()
         self._variance_cache.clear()
+        self._resolution_cache.clear()
 
 
 class TypeParameterBinder:
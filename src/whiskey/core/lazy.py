@@ -6,6 +6,7 @@ startup performance, and handling optional dependencies elegantly.
 
 Classes:
     Lazy[T]: Generic wrapper for lazy dependency resolution
+    AsyncLazy[T]: Lazy wrapper resolved by awaiting it, for async code
     LazyDescriptor[T]: Property descriptor for class-level lazy attributes
 
 Functions:
@@ -31,6 +32,11 @@ Usage Patterns:
     4. Resolution Control:
        Access .value property to trigger resolution
 
+    5. Async Code:
+       ``.value`` cannot resolve while an event loop is running. Use
+       AsyncLazy[T] and ``await`` it instead; this also supports async
+       factories. Concurrent awaiters share a single in-flight resolution.
+
 Example:
     >>> from whiskey import Lazy, singleton, component, inject
     >>>
@@ -63,6 +69,13 @@ Example:
     ...     def __init__(self, a: ServiceA):
     ...         self.a = a
 
+    >>> # In async code, create an AsyncLazy and await it
+    >>> analytics = AsyncLazy(AnalyticsClient, container=container)
+    >>>
+    >>> async def export():
+    ...     client = await analytics   # built on first await only
+    ...     return await client.export()
+
 Performance Considerations:
     - First access incurs resolution cost
     - Subsequent accesses are direct property access
@@ -165,6 +178,18 @@ class Lazy(Generic[T]):
         """
         return self._resolved
 
+    def _get_container(self) -> Container:
+        """Return the container to resolve from."""
+        if self._container_ref:
+            container = self._container_ref()
+            if container is None:
+                raise RuntimeError("Container has been garbage collected")
+        else:
+            container = get_current_container()
+            if container is None:
+                raise RuntimeError("No container available for lazy resolution")
+        return container
+
     def _resolve(self) -> None:
         """Resolve the dependency from the container."""
         if self._resolving:
@@ -172,15 +197,7 @@ class Lazy(Generic[T]):
 
         self._resolving = True
         try:
-            # Get container
-            if self._container_ref:
-                container = self._container_ref()
-                if container is None:
-                    raise RuntimeError("Container has been garbage collected")
-            else:
-                container = get_current_container()
-                if container is None:
-                    raise RuntimeError("No container available for lazy resolution")
+            container = self._get_container()
 
             # Check if we're in an async context
             try:
@@ -190,7 +207,8 @@ class Lazy(Generic[T]):
                 # For now, raise an error suggesting to use await on the container directly
                 raise RuntimeError(
                     "Cannot resolve Lazy values synchronously in async context. "
-                    "Consider resolving the component directly with 'await container.resolve()'"
+                    "Use AsyncLazy and 'await' it, or resolve the component directly "
+                    "with 'await container.resolve()'"
                 )
             except RuntimeError as e:
                 if "no running event loop" not in str(e):
@@ -233,6 +251,86 @@ class Lazy(Generic[T]):
         return bool(self._instance)
 
 
+class AsyncLazy(Lazy[T]):
+    """A lazy wrapper that is resolved by awaiting it.
+
+    Awaiting resolves the component with ``container.resolve_async()``, so
+    async factories and async initialization work. All coroutines awaiting
+    an unresolved AsyncLazy share one in-flight resolution: the component is
+    built once and every awaiter receives the same instance (or the same
+    error, after which the next await tries again). Cancelling one awaiter
+    does not cancel the resolution for the others.
+
+    Once resolved, ``.value`` and attribute proxying work as for Lazy.
+    Outside an event loop ``.value`` still resolves synchronously.
+
+    Examples:
+        >>> search = AsyncLazy(SearchClient, container=container)
+        >>>
+        >>> async def handle(query: str):
+        ...     client = await search
+        ...     return await client.search(query)
+    """
+
+    def __init__(
+        self, component_type: type[T], name: str | None = None, container: Container | None = None
+    ):
+        """Initialize an awaitable lazy wrapper.
+
+        Args:
+            component_type: The type to lazily resolve
+            name: Optional name for named dependencies
+            container: Container to use (defaults to current container)
+        """
+        super().__init__(component_type, name, container)
+        self._pending: asyncio.Task | None = None
+
+    def __await__(self):
+        """Resolve the dependency (once) and return the instance."""
+        return self._resolve_async().__await__()
+
+    async def _resolve_async(self) -> T:
+        """Resolve the dependency if necessary and return it.
+
+        Not a public method: attribute names are proxied to the resolved
+        instance, so AsyncLazy is used through ``await`` only.
+
+        Returns:
+            The resolved component instance
+
+        Raises:
+            RuntimeError: If no container is available or the lazy value is
+                awaited from within its own resolution
+        """
+        if self._resolved:
+            return cast(T, self._instance)
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending
+        if pending is None or pending.get_loop() is not loop:
+            pending = self._pending = loop.create_task(self._resolve_once())
+        elif asyncio.current_task() is pending:
+            raise RuntimeError(f"Circular lazy resolution detected for {self._component_type}")
+
+        # Shield so one cancelled awaiter doesn't cancel the shared resolution
+        return await asyncio.shield(pending)
+
+    async def _resolve_once(self) -> T:
+        """Perform the shared resolution."""
+        try:
+            container = self._get_container()
+            instance = await container.resolve_async(self._component_type, name=self._name)
+            self._instance = instance
+            self._resolved = True
+            return instance
+        finally:
+            self._pending = None
+
+    def __repr__(self) -> str:
+        """String representation of the lazy wrapper."""
+        return "Async" + super().__repr__()
+
+
 class LazyDescriptor(Generic[T]):
     """A descriptor that creates Lazy instances for class attributes.
 
@@ -246,17 +344,29 @@ class LazyDescriptor(Generic[T]):
         ...     def use_database(self):
         ...         # First access creates and returns a Lazy instance
         ...         return self.database.value.query("SELECT * FROM users")
+
+        With ``awaitable=True`` the attribute is an AsyncLazy:
+
+        >>> class Reports:
+        ...     warehouse = LazyDescriptor(Warehouse, awaitable=True)
+        ...
+        ...     async def totals(self):
+        ...         return await (await self.warehouse).totals()
     """
 
-    def __init__(self, component_type: type[T], name: str | None = None):
+    def __init__(
+        self, component_type: type[T], name: str | None = None, *, awaitable: bool = False
+    ):
         """Initialize the lazy descriptor.
 
         Args:
             component_type: The type to lazily resolve
             name: Optional name for named dependencies
+            awaitable: Create AsyncLazy instances, resolved with ``await``
         """
         self._component_type = component_type
         self._name = name
+        self._lazy_class = AsyncLazy if awaitable else Lazy
         self._attr_name: str | None = None
 
     def __set_name__(self, owner: type, name: str) -> None:
@@ -297,7 +407,7 @@ class LazyDescriptor(Generic[T]):
                 container = get_current_container()
 
             # Create new Lazy instance
-            lazy_instance = Lazy(self._component_type, self._name, container)
+            lazy_instance = self._lazy_class(self._component_type, self._name, container)
             setattr(instance, self._attr_name, lazy_instance)
 
         return lazy_instance
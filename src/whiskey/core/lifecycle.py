@@ -0,0 +1,341 @@
+"""Dependency-graph-aware component startup and shutdown.
+
+This module orders registered components by their dependencies and starts
+them level by level: every component in a level only depends on components
+from earlier levels, so the components of one level are resolved and their
+``initialize()`` hooks awaited concurrently. Shutdown walks the same graph
+in reverse, restricted to the singletons that were actually created.
+
+Classes:
+    StartupReport: Timings, levels and critical path of one startup run
+    ShutdownReport: Disposal levels, timings and errors of one shutdown run
+
+Functions:
+    build_dependency_graph: Map each component key to the keys it depends on
+    topological_levels: Group a dependency graph into startup levels
+    start_components: Resolve and initialize components level by level
+    dispose_singletons: Dispose created singletons in reverse dependency order
+
+Example:
+    >>> report = await start_components(container, max_concurrency=10, timeout=5.0)
+    >>> print(report.format())
+    Started 150 components in 4 levels in 2.314s
+    Critical path (2.290s): Database (1.800s) -> UserRepository (0.490s)
+
+See Also:
+    - whiskey.core.application: Whiskey.startup/shutdown use this module
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .errors import ResolutionError
+from .profiler import profile_span
+
+if TYPE_CHECKING:
+    from .container import Container
+    from .registry import ComponentDescriptor
+
+
+@dataclass
+class StartupReport:
+    """Outcome of a startup run.
+
+    Attributes:
+        levels: Component keys grouped by topological level, in start order
+        durations: Seconds spent resolving and initializing each component
+        critical_path: Longest chain of dependent components by duration
+        critical_path_time: Summed duration of the critical path
+        total_time: Wall-clock seconds for the whole startup
+    """
+
+    levels: list[list[str]] = field(default_factory=list)
+    durations: dict[str, float] = field(default_factory=dict)
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_time: float = 0.0
+    total_time: float = 0.0
+
+    def format(self) -> str:
+        """Render a short human-readable summary."""
+        count = sum(len(level) for level in self.levels)
+        lines = [
+            f"Started {count} components in {len(self.levels)} levels in {self.total_time:.3f}s"
+        ]
+        if self.critical_path:
+            path = " -> ".join(
+                f"{key} ({self.durations.get(key, 0.0):.3f}s)" for key in self.critical_path
+            )
+            lines.append(f"Critical path ({self.critical_path_time:.3f}s): {path}")
+        return "\n".join(lines)
+
+
+@dataclass
+class ShutdownReport:
+    """Outcome of a shutdown run.
+
+    Attributes:
+        levels: Disposed singleton keys grouped by level, in disposal order
+        durations: Seconds spent in each component's dispose()
+        errors: Exceptions raised (or timeouts hit) by dispose(), by key
+        total_time: Wall-clock seconds for the whole disposal
+    """
+
+    levels: list[list[str]] = field(default_factory=list)
+    durations: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+    total_time: float = 0.0
+
+
+def build_dependency_graph(
+    container: Container, descriptors: list[ComponentDescriptor]
+) -> dict[str, set[str]]:
+    """Map each component key to the keys of the registered components it needs.
+
+    Dependencies that are not registered (auto-created or unresolvable) are
+    left out; they are handled when the component itself is resolved.
+    """
+    resolver = container.resolver
+    keys = {descriptor.key for descriptor in descriptors}
+    graph: dict[str, set[str]] = {}
+
+    for descriptor in descriptors:
+        edges: set[str] = set()
+        try:
+            # The cached plan start_components will resolve the key with
+            plan = resolver.get_plan(descriptor.key)
+        except ResolutionError:
+            # Inactive or unimportable; resolving it reports the problem
+            graph[descriptor.key] = edges
+            continue
+        for _param_name, dep_key, _optional in plan.dependencies:
+            try:
+                dep_descriptor = resolver.get_plan(dep_key, allow_auto_create=False).descriptor
+            except (ResolutionError, TypeError):
+                continue
+            if dep_descriptor.key in keys and dep_descriptor.key != descriptor.key:
+                edges.add(dep_descriptor.key)
+        graph[descriptor.key] = edges
+
+    return graph
+
+
+def topological_levels(graph: dict[str, set[str]]) -> list[list[str]]:
+    """Group a dependency graph into levels using Kahn's algorithm.
+
+    Components caught in a cycle cannot be ordered; they are placed in a
+    final level so that resolving them reports the circular dependency.
+    """
+    remaining = {key: set(deps) for key, deps in graph.items()}
+    dependents: dict[str, list[str]] = {key: [] for key in graph}
+    for key, deps in graph.items():
+        for dep in deps:
+            dependents[dep].append(key)
+
+    levels = []
+    ready = [key for key, deps in remaining.items() if not deps]
+    while ready:
+        levels.append(ready)
+        next_ready = []
+        for key in ready:
+            del remaining[key]
+            for dependent in dependents[key]:
+                deps = remaining[dependent]
+                deps.discard(key)
+                if not deps:
+                    next_ready.append(dependent)
+        ready = next_ready
+
+    if remaining:
+        levels.append(list(remaining))
+
+    return levels
+
+
+def _critical_path(
+    graph: dict[str, set[str]], levels: list[list[str]], durations: dict[str, float]
+) -> tuple[list[str], float]:
+    """Find the dependency chain with the largest summed duration."""
+    finish: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+
+    for level in levels:
+        for key in level:
+            best_dep = None
+            best_finish = 0.0
+            for dep in graph.get(key, ()):
+                if finish.get(dep, 0.0) > best_finish:
+                    best_dep, best_finish = dep, finish[dep]
+            finish[key] = best_finish + durations.get(key, 0.0)
+            previous[key] = best_dep
+
+    if not finish:
+        return [], 0.0
+
+    end = max(finish, key=finish.__getitem__)
+    path = []
+    node: str | None = end
+    while node is not None:
+        path.append(node)
+        node = previous[node]
+    path.reverse()
+    return path, finish[end]
+
+
+async def start_components(
+    container: Container,
+    descriptors: list[ComponentDescriptor] | None = None,
+    *,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+) -> StartupReport:
+    """Resolve and initialize components in dependency order.
+
+    Args:
+        container: The container to start components from
+        descriptors: Components to start (defaults to all active registrations)
+        max_concurrency: Maximum number of components starting at once
+        timeout: Per-component limit in seconds for resolution plus initialize()
+
+    Returns:
+        A StartupReport with levels, per-component durations and critical path
+
+    Raises:
+        asyncio.TimeoutError: If a component exceeds ``timeout``
+        Exception: The first error raised by a component; components still
+            starting in the same level are cancelled
+    """
+    if descriptors is None:
+        descriptors = container.registry.list_all()
+
+    started = time.perf_counter()
+    graph = build_dependency_graph(container, descriptors)
+    levels = topological_levels(graph)
+    durations: dict[str, float] = {}
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def initialize(key: str) -> None:
+        instance = await container.resolve(key)
+        if hasattr(instance, "initialize") and callable(instance.initialize):
+            with profile_span(f"{key}.initialize"):
+                await instance.initialize()
+
+    async def start_one(key: str) -> None:
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            component_started = time.perf_counter()
+            if timeout is None:
+                await initialize(key)
+            else:
+                try:
+                    await asyncio.wait_for(initialize(key), timeout)
+                except asyncio.TimeoutError:
+                    raise asyncio.TimeoutError(
+                        f"Component '{key}' did not start within {timeout}s"
+                    ) from None
+            durations[key] = time.perf_counter() - component_started
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    for level in levels:
+        tasks = [asyncio.ensure_future(start_one(key)) for key in level]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    critical_path, critical_path_time = _critical_path(graph, levels, durations)
+    return StartupReport(
+        levels=levels,
+        durations=durations,
+        critical_path=critical_path,
+        critical_path_time=critical_path_time,
+        total_time=time.perf_counter() - started,
+    )
+
+
+async def dispose_singletons(
+    container: Container,
+    *,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+) -> ShutdownReport:
+    """Dispose the singletons a container created, dependents first.
+
+    Only instances already in the singleton cache are considered; nothing is
+    constructed just to be disposed. Components that share a disposal level
+    have no dependency relationship and are disposed concurrently. Errors are
+    collected in the report instead of aborting the shutdown. Disposed
+    singletons are removed from the cache.
+
+    Args:
+        container: The container whose singletons should be disposed
+        max_concurrency: Maximum number of dispose() calls running at once
+        timeout: Per-component limit in seconds for an async dispose()
+
+    Returns:
+        A ShutdownReport with disposal levels, durations and errors
+    """
+    started = time.perf_counter()
+    created = container.resolver.scope_resolver.created_singletons()
+    registry = container.registry
+
+    # Only registered singletons take part in the graph; anything else (e.g.
+    # removed registrations) is disposed first since nothing can depend on it
+    registered = dict(registry.items())
+    descriptors = [registered[key] for key, _ in created if key in registered]
+    graph = build_dependency_graph(container, descriptors)
+    for key, _ in created:
+        graph.setdefault(key, set())
+
+    # Reverse of startup order: a component is disposed before its dependencies
+    levels = list(reversed(topological_levels(graph)))
+    instances = dict(created)
+    report = ShutdownReport()
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    disposed_ids: set[int] = set()
+
+    async def dispose_one(key: str) -> None:
+        instance = instances[key]
+        dispose = getattr(instance, "dispose", None)
+        if not callable(dispose) or id(instance) in disposed_ids:
+            return
+        # The same instance may be cached under several keys
+        disposed_ids.add(id(instance))
+
+        if semaphore is not None:
+            await semaphore.acquire()
+        component_started = time.perf_counter()
+        try:
+            result = dispose()
+            if asyncio.iscoroutine(result):
+                if timeout is None:
+                    await result
+                else:
+                    await asyncio.wait_for(result, timeout)
+        except asyncio.TimeoutError:
+            report.errors[key] = asyncio.TimeoutError(
+                f"Component '{key}' did not dispose within {timeout}s"
+            )
+        except Exception as e:
+            report.errors[key] = e
+        finally:
+            report.durations[key] = time.perf_counter() - component_started
+            if semaphore is not None:
+                semaphore.release()
+
+    for level in levels:
+        report.levels.append(level)
+        await asyncio.gather(*(dispose_one(key) for key in level))
+        container.resolver.scope_resolver.forget_singletons(level)
+
+    report.total_time = time.perf_counter() - started
+    return report
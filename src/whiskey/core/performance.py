@@ -7,9 +7,11 @@ insights for optimization.
 
 Classes:
     ResolutionMetrics: Metrics for individual component resolutions
+    LatencyHistogram: Bounded latency sample window with percentile queries
     PerformanceMetrics: Aggregated performance statistics
     PerformanceMonitor: Context manager for performance monitoring
     WeakValueCache: Memory-efficient cache using weak references
+    LRUCache: Bounded O(1) LRU mapping with optional weak keys and counters
 
 Functions:
     is_performance_monitoring_enabled: Check if monitoring is active
@@ -19,9 +21,12 @@ Functions:
     monitor_resolution: Decorator to monitor resolution performance
     record_resolution: Record resolution metrics
     record_error: Record resolution errors
+    get_cache_stats: Hit/miss/eviction counters of all live LRU caches by name
+    set_cache_size: Change the size limit of a named cache
 
 Features:
     - Resolution time tracking with percentiles
+    - Per-component resolution and factory latency histograms (p50/p95/p99)
     - Dependency graph analysis
     - Cache hit/miss ratios
     - Memory usage monitoring
@@ -29,6 +34,14 @@ Features:
     - Error rate monitoring
     - Hot path identification
 
+The UnifiedResolver records into the metrics of the active PerformanceMonitor.
+When no monitor is active, instrumentation costs a single ContextVar lookup
+and branch per resolution.
+
+Core caches (type analysis, callable analysis, injection plans, generic
+resolution) are LRUCache instances. Each keeps its own counters; a
+PerformanceMonitor reports how they changed while it was active.
+
 Example:
     >>> from whiskey.core.performance import PerformanceMonitor
     >>> from whiskey import Container
@@ -60,9 +73,12 @@ Performance Tips:
 
 from __future__ import annotations
 
+import contextlib
+import math
 import time
 import weakref
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict, deque
+from collections.abc import Iterator, MutableMapping
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any
@@ -85,6 +101,54 @@ class ResolutionMetrics:
     type_analysis_time: float
 
 
+class LatencyHistogram:
+    """Latency samples for one component with percentile queries.
+
+    Keeps exact count/total/min/max plus a bounded window of the most recent
+    samples, from which percentiles are computed on demand.
+    """
+
+    def __init__(self, max_samples: int = 4096):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self._samples: deque[float] = deque(maxlen=max_samples)
+
+    def record(self, duration: float) -> None:
+        """Record a single latency sample in seconds."""
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        self._samples.append(duration)
+
+    @property
+    def mean(self) -> float:
+        """Mean latency across all recorded samples."""
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+    def percentile(self, pct: float) -> float:
+        """Get the latency at a percentile (0-100) using nearest-rank."""
+        return self._nearest_rank(sorted(self._samples), pct)
+
+    def percentiles(self) -> dict[str, float]:
+        """Get p50/p95/p99 latencies."""
+        ordered = sorted(self._samples)
+        return {f"p{pct}": self._nearest_rank(ordered, pct) for pct in (50, 95, 99)}
+
+    @staticmethod
+    def _nearest_rank(ordered: list[float], pct: float) -> float:
+        if not ordered:
+            return 0.0
+        rank = max(1, math.ceil(len(ordered) * pct / 100))
+        return ordered[min(rank, len(ordered)) - 1]
+
+
 @dataclass
 class PerformanceMetrics:
     """Comprehensive performance metrics for the DI container."""
@@ -111,6 +175,18 @@ class PerformanceMetrics:
     active_instances: dict[str, int] = field(default_factory=lambda: defaultdict(int))
     weak_references: set[weakref.ref] = field(default_factory=set)
 
+    # Per-component latency histograms
+    resolution_latency: dict[str, LatencyHistogram] = field(
+        default_factory=lambda: defaultdict(LatencyHistogram)
+    )
+    factory_latency: dict[str, LatencyHistogram] = field(
+        default_factory=lambda: defaultdict(LatencyHistogram)
+    )
+    factory_time: float = 0.0
+
+    # Cache counter changes while monitoring, by cache name
+    cache_stats: dict[str, dict[str, int]] = field(default_factory=dict)
+
     def record_resolution(self, metrics: ResolutionMetrics):
         """Record metrics for a component resolution."""
         self.resolution_count += 1
@@ -119,6 +195,8 @@ class PerformanceMetrics:
         self.resolution_depths.append(metrics.depth)
         self.type_analysis_time += metrics.type_analysis_time
 
+        self.resolution_latency[metrics.service_key].record(metrics.resolution_time)
+
         if metrics.cache_hit:
             self.cache_hits += 1
         else:
@@ -129,6 +207,31 @@ class PerformanceMetrics:
         self.slowest_resolutions.sort(key=lambda x: x.resolution_time, reverse=True)
         self.slowest_resolutions = self.slowest_resolutions[:10]
 
+    def record_factory(self, service_key: str, duration: float):
+        """Record one execution of a component's provider (class or factory)."""
+        self.factory_time += duration
+        self.factory_latency[service_key].record(duration)
+
+    def record_type_analysis(self, duration: float):
+        """Record time spent analyzing a provider's signature."""
+        self.type_analysis_time += duration
+
+    def get_latency_percentiles(self, service_key: str) -> dict[str, float]:
+        """Get p50/p95/p99 resolution latency for a component."""
+        histogram = self.resolution_latency.get(service_key)
+        if histogram is None:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        return histogram.percentiles()
+
+    def get_slowest_factories(self, top_n: int = 5) -> list[tuple[str, LatencyHistogram]]:
+        """Get the components whose providers have the highest p95 latency."""
+        ranked = sorted(
+            self.factory_latency.items(),
+            key=lambda item: item[1].percentile(95),
+            reverse=True,
+        )
+        return ranked[:top_n]
+
     def record_error(self, error_type: str):
         """Record an error during resolution."""
         self.resolution_errors += 1
@@ -195,6 +298,37 @@ class PerformanceMetrics:
                 )
             report.append("")
 
+        # Latency percentiles
+        if self.resolution_latency:
+            report.append("Resolution Latency (p50/p95/p99):")
+            for service, _count in self.get_hot_services():
+                if service in self.resolution_latency:
+                    pcts = self.resolution_latency[service].percentiles()
+                    report.append(
+                        f"  {service}: {pcts['p50']:.6f}s / {pcts['p95']:.6f}s / "
+                        f"{pcts['p99']:.6f}s"
+                    )
+            report.append("")
+
+        slowest_factories = self.get_slowest_factories()
+        if slowest_factories:
+            report.append("Slowest Factories (p95):")
+            for service, histogram in slowest_factories:
+                report.append(
+                    f"  {service}: {histogram.percentile(95):.6f}s "
+                    f"({histogram.count} calls, max {histogram.max:.6f}s)"
+                )
+            report.append("")
+
+        if self.cache_stats:
+            report.append("Cache Activity (hits/misses/evictions, size):")
+            for name, stats in sorted(self.cache_stats.items()):
+                report.append(
+                    f"  {name}: {stats['hits']}/{stats['misses']}/{stats['evictions']}, "
+                    f"{stats['size']}/{stats['maxsize'] or 'unbounded'}"
+                )
+            report.append("")
+
         # Performance recommendations
         report.extend(self._generate_recommendations())
 
@@ -220,6 +354,14 @@ class PerformanceMetrics:
         if self.average_resolution_depth > 5:
             recommendations.append("• High dependency depth - consider flattening dependencies")
 
+        # Eviction storms: entries are dropped faster than they are reused
+        for name, stats in sorted(self.cache_stats.items()):
+            if stats["evictions"] >= 100 and stats["evictions"] > stats["hits"]:
+                recommendations.append(
+                    f"• '{name}' cache evicted {stats['evictions']} entries - "
+                    f"raise its limit with set_cache_size()"
+                )
+
         # Error rate recommendations
         if self.resolution_errors > 0:
             error_rate = (self.resolution_errors / self.resolution_count) * 100
@@ -245,12 +387,14 @@ class PerformanceMonitor:
         if self.enabled:
             self._token = _current_metrics.set(self.metrics)
             _performance_enabled.set(True)
+            self._cache_baseline = get_cache_stats()
         return self.metrics
 
     def __exit__(self, *args):
         if self.enabled and self._token:
             _current_metrics.reset(self._token)
             _performance_enabled.set(False)
+            self.metrics.cache_stats = _cache_stats_delta(self._cache_baseline, get_cache_stats())
 
 
 class ResolutionTimer:
@@ -410,3 +554,212 @@ class WeakValueCache:
             del self._cache[key]
 
         return len(self._cache)
+
+
+class LRUCache(MutableMapping):
+    """Bounded mapping that evicts the least recently used entry in O(1).
+
+    Lookups through ``get``/``[]`` count hits and misses and refresh the
+    entry's recency; ``in`` does neither. Inserting beyond ``maxsize`` evicts
+    the oldest entry and counts an eviction.
+
+    With ``weak_keys=True`` entries disappear when their key is garbage
+    collected, like a WeakKeyDictionary. Keys that cannot be weakly
+    referenced are held strongly.
+
+    Operations are individually atomic under the GIL and the cache can be
+    shared between threads without a lock; counters may drift slightly
+    under contention.
+
+    Attributes:
+        name: Name the cache reports its statistics under
+        maxsize: Maximum number of entries (None for unbounded)
+        hits: Successful lookups
+        misses: Failed lookups
+        evictions: Entries dropped to respect ``maxsize``
+    """
+
+    def __init__(self, name: str, maxsize: int | None = 1024, *, weak_keys: bool = False):
+        """Create an empty cache.
+
+        Args:
+            name: Statistics name (several caches may share one)
+            maxsize: Default size limit (None for unbounded); a limit
+                configured for ``name`` with set_cache_size() takes precedence
+            weak_keys: Drop entries whose key has been garbage collected
+        """
+        self.name = name
+        self.maxsize = _cache_sizes.get(name, maxsize)
+        self.weak_keys = weak_keys
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        _caches[id(self)] = self
+
+    def _key(self, key: Any) -> Any:
+        """Storage key for lookups (a callback-free weakref for weak caches)."""
+        if self.weak_keys:
+            try:
+                return weakref.ref(key)
+            except TypeError:
+                return key
+        return key
+
+    def _storage_key(self, key: Any) -> Any:
+        """Storage key for inserts; weak entries remove themselves on collection."""
+        if self.weak_keys:
+            data = self._data
+
+            def remove(ref: weakref.ref) -> None:
+                data.pop(ref, None)
+
+            try:
+                return weakref.ref(key, remove)
+            except TypeError:
+                return key
+        return key
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for ``key`` (refreshing it) or ``default``."""
+        data_key = self._key(key)
+        try:
+            value = self._data[data_key]
+        except KeyError:
+            self.misses += 1
+            return default
+        # The entry may have been evicted concurrently; the value is still valid
+        with contextlib.suppress(KeyError):
+            self._data.move_to_end(data_key)
+        self.hits += 1
+        return value
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        data = self._data
+        data_key = self._key(key)
+        if data_key in data:
+            data[data_key] = value
+            data.move_to_end(data_key)
+            return
+        data[self._storage_key(key)] = value
+        if self.maxsize is not None:
+            while len(data) > self.maxsize:
+                try:
+                    data.popitem(last=False)
+                except KeyError:
+                    break
+                self.evictions += 1
+
+    def __delitem__(self, key: Any) -> None:
+        del self._data[self._key(key)]
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return self._key(key) in self._data
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[Any]:
+        for data_key in list(self._data):
+            if self.weak_keys and isinstance(data_key, weakref.ref):
+                key = data_key()
+                if key is not None:
+                    yield key
+            else:
+                yield data_key
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        self._data.clear()
+
+    def resize(self, maxsize: int | None) -> None:
+        """Change the size limit, evicting the oldest entries if needed."""
+        self.maxsize = maxsize
+        if maxsize is not None:
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Hit percentage of all counted lookups."""
+        total = self.hits + self.misses
+        return (self.hits / total) * 100 if total else 0.0
+
+    def stats(self) -> dict[str, int]:
+        """Counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize or 0,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"LRUCache({self.name!r}, size={len(self._data)}, maxsize={self.maxsize}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+
+_MISSING = object()
+
+# Every live LRUCache by id, for statistics and resizing (LRUCache compares
+# by contents like a dict and is unhashable, so a WeakSet can't hold it)
+_caches: weakref.WeakValueDictionary[int, LRUCache] = weakref.WeakValueDictionary()
+
+# Size limits configured through set_cache_size(), by cache name
+_cache_sizes: dict[str, int | None] = {}
+
+
+def get_cache_stats() -> dict[str, dict[str, int]]:
+    """Sum the counters of all live LRU caches, grouped by cache name."""
+    totals: dict[str, dict[str, int]] = {}
+    for cache in list(_caches.values()):
+        stats = cache.stats()
+        total = totals.get(cache.name)
+        if total is None:
+            totals[cache.name] = stats
+        else:
+            for counter, value in stats.items():
+                total[counter] += value
+    return totals
+
+
+def set_cache_size(name: str, maxsize: int | None) -> None:
+    """Set the size limit of every cache with ``name``, now and for new caches.
+
+    Args:
+        name: Cache name, e.g. ``"analyzer.callables"``
+        maxsize: New limit (None for unbounded)
+    """
+    _cache_sizes[name] = maxsize
+    for cache in list(_caches.values()):
+        if cache.name == name:
+            cache.resize(maxsize)
+
+
+def _cache_stats_delta(
+    before: dict[str, dict[str, int]], after: dict[str, dict[str, int]]
+) -> dict[str, dict[str, int]]:
+    """Counter changes between two get_cache_stats() snapshots."""
+    delta = {}
+    for name, stats in after.items():
+        previous = before.get(name, {})
+        changed = {
+            counter: stats[counter] - previous.get(counter, 0)
+            for counter in ("hits", "misses", "evictions")
+        }
+        if any(changed.values()):
+            delta[name] = {**changed, "size": stats["size"], "maxsize": stats["maxsize"]}
+    return delta
@@ -0,0 +1,271 @@
+"""Object pools for pooled transient components.
+
+A transient component registered with ``pooled=N`` keeps up to N idle
+instances for reuse instead of constructing a new one on every resolution.
+This suits components that are expensive to build but cheap to reset, such as
+parsers, serializers or buffers.
+
+An instance goes back to its pool when:
+    - the innermost scope that was active when it was resolved exits, or
+    - the ``Container.checkout()`` context manager it came from exits.
+
+Instances resolved outside any scope or checkout are handed out like plain
+transients and never returned. Before an instance is pooled again its
+``reset()`` method, if it has one, is called; an instance whose reset fails,
+or that would exceed the pool's size, is dropped.
+
+Checkout is safe across threads and tasks: taking and returning an idle
+instance happens under a short lock that is never held while a provider
+runs or while awaiting.
+
+Classes:
+    ObjectPool: Bounded pool of idle instances for one component
+    PoolCheckout: Context manager returned by ``Container.checkout()``
+
+Functions:
+    pool_size: Normalize a ``pooled`` registration option
+    release_checkouts: Return recorded checkouts to their pools
+
+Example:
+    >>> container.register(JSONEncoder, pooled=16)
+    >>>
+    >>> with container.scope("request"):
+    ...     encoder = container.resolve_sync(JSONEncoder)  # reused if one is idle
+    ...                                                 # returned on scope exit
+    >>> async with container.checkout(JSONEncoder) as encoder:
+    ...     payload = encoder.encode(data)
+    >>>
+    >>> container.pool_stats()
+    {'JSONEncoder': {'created': 2, 'reused': 40, 'released': 42, ...}}
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .resolver import UnifiedResolver
+
+T = TypeVar("T")
+
+# Idle instances kept per component when registered with ``pooled=True``
+DEFAULT_POOL_SIZE = 8
+
+# Key of the checkout list inside a scope activation's instance dict
+POOL_CHECKOUTS = object()
+
+# Name of the private activation a PoolCheckout resolves in
+CHECKOUT_SCOPE = "whiskey.checkout"
+
+_EMPTY = object()
+
+
+def pool_size(option: Any) -> int:
+    """Normalize a ``pooled`` registration option to a pool size.
+
+    Args:
+        option: True for the default size, or a positive int
+
+    Returns:
+        The maximum number of idle instances, 0 if pooling is off
+    """
+    if option is True:
+        return DEFAULT_POOL_SIZE
+    if not option:
+        return 0
+    if isinstance(option, int) and option > 0:
+        return option
+    raise ValueError(f"pooled must be True or a positive int, got {option!r}")
+
+
+def release_checkouts(checkouts: Any) -> None:
+    """Return (pool, instance) checkouts to their pools, newest first."""
+    for pool, instance in reversed(checkouts):
+        pool.release(instance)
+
+
+class ObjectPool(Generic[T]):
+    """Bounded pool of idle instances for one pooled component.
+
+    Attributes:
+        key: Key of the pooled component
+        maxsize: Maximum number of idle instances kept
+        created: Instances built because no idle one was available
+        reused: Checkouts served from an idle instance
+        released: Instances returned to the pool
+        discarded: Returned instances dropped (pool full or reset failed)
+    """
+
+    def __init__(self, key: str, maxsize: int = DEFAULT_POOL_SIZE):
+        self.key = key
+        self.maxsize = maxsize
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+        self._idle: list[T] = []
+        self._in_use = 0
+        self._lock = threading.Lock()
+
+    def _take(self, track: bool) -> Any:
+        """Pop an idle instance (or _EMPTY) and update the counters."""
+        with self._lock:
+            if track:
+                self._in_use += 1
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+            self.created += 1
+            return _EMPTY
+
+    def acquire(self, create: Callable[[], T], track: bool = True) -> T:
+        """Check out an idle instance, or create one.
+
+        Args:
+            create: Builds a new instance when the pool is empty
+            track: Whether the caller will release() the instance
+
+        Returns:
+            An instance for exclusive use until it is released
+        """
+        instance = self._take(track)
+        if instance is not _EMPTY:
+            return instance
+        try:
+            return create()
+        except BaseException:
+            self._untrack(track)
+            raise
+
+    async def acquire_async(self, create: Callable[[], Any], track: bool = True) -> T:
+        """Check out an idle instance, or await ``create()`` for a new one."""
+        instance = self._take(track)
+        if instance is not _EMPTY:
+            return instance
+        try:
+            return await create()
+        except BaseException:
+            self._untrack(track)
+            raise
+
+    def _untrack(self, track: bool) -> None:
+        if track:
+            with self._lock:
+                self._in_use -= 1
+
+    def release(self, instance: T) -> bool:
+        """Reset an instance and return it to the pool.
+
+        Args:
+            instance: An instance obtained from acquire() with tracking
+
+        Returns:
+            True if the instance was kept for reuse
+        """
+        reset = getattr(instance, "reset", None)
+        keep = True
+        if callable(reset):
+            try:
+                reset()
+            except Exception:
+                keep = False
+
+        with self._lock:
+            self._in_use = max(self._in_use - 1, 0)
+            if keep and len(self._idle) < self.maxsize:
+                self._idle.append(instance)
+                self.released += 1
+                return True
+            self.discarded += 1
+            return False
+
+    def clear(self) -> list[T]:
+        """Drop all idle instances.
+
+        Returns:
+            The instances that were idle
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+            return idle
+
+    def stats(self) -> dict[str, int]:
+        """Counters plus the current number of idle and checked-out instances."""
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "released": self.released,
+                "discarded": self.discarded,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "maxsize": self.maxsize,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"ObjectPool({self.key!r}, idle={len(self._idle)}, in_use={self._in_use}, "
+            f"maxsize={self.maxsize})"
+        )
+
+
+class PoolCheckout:
+    """Context manager that checks out one instance for the duration of a block.
+
+    The instance and any pooled transients it needed are resolved in a private
+    activation layered over the active scopes, and are returned to their pools
+    when the block exits. Works with both ``with`` and ``async with``.
+    """
+
+    def __init__(
+        self,
+        resolver: UnifiedResolver,
+        key: Any,
+        name: str | None,
+        active_scopes: Callable[[], dict[str, dict[str, Any]] | None],
+    ):
+        self.resolver = resolver
+        self.key = key
+        self.name = name
+        self._active_scopes = active_scopes
+        self._activation: dict[Any, Any] | None = None
+
+    def _scope_context(self) -> dict[str, dict[str, Any]]:
+        if self._activation is not None:
+            raise RuntimeError("PoolCheckout is not reentrant")
+        self._activation = {}
+        # Innermost activation, so checkouts are recorded here and not in an
+        # enclosing scope
+        return {**(self._active_scopes() or {}), CHECKOUT_SCOPE: self._activation}
+
+    def _release(self) -> None:
+        activation, self._activation = self._activation, None
+        if activation:
+            release_checkouts(activation.pop(POOL_CHECKOUTS, ()))
+
+    def __enter__(self) -> Any:
+        scope_context = self._scope_context()
+        try:
+            return self.resolver._resolve_sync(
+                self.key, self.name, scope_context=scope_context
+            )
+        except BaseException:
+            self._release()
+            raise
+
+    def __exit__(self, *args) -> None:
+        self._release()
+
+    async def __aenter__(self) -> Any:
+        scope_context = self._scope_context()
+        try:
+            return await self.resolver._resolve_async(
+                self.key, self.name, scope_context=scope_context
+            )
+        except BaseException:
+            self._release()
+            raise
+
+    async def __aexit__(self, *args) -> None:
+        self._release()
@@ -9,6 +9,7 @@ Classes:
     Scope: Enumeration of component lifecycle scopes (singleton, transient, scoped)
     ComponentDescriptor: Complete metadata for a registered component
     ComponentRegistry: Central registry managing all component registrations
+    ImportRef: Provider placeholder for a class imported on first resolution
 
 Key Concepts:
     - Components are identified by a key (string) which can be a type or custom name
@@ -17,6 +18,10 @@ Key Concepts:
     - Named components allow multiple implementations of the same interface
     - Conditional registration based on runtime conditions
     - Metadata storage for additional component information
+    - Child registries overlay a parent: lookups fall through, writes stay local
+    - Interface lookups: components are indexed under every class in their MRO
+      and under the Protocols/ABCs they satisfy, so ``get_all(Interface)`` and
+      resolving an unregistered interface never scan the registry
 
 Example:
     >>> registry = ComponentRegistry()
@@ -37,7 +42,7 @@ Example:
     >>> # Query components
     >>> db_descriptor = registry.get(Database)
     >>> cache_descriptors = registry.get_all(Cache)
-    >>> tagged = registry.get_by_tag('critical')
+    >>> tagged = registry.find_by_tag('critical')
 
 See Also:
     - whiskey.core.container: Uses registry for component storage
@@ -46,13 +51,82 @@ See Also:
 
 from __future__ import annotations
 
+import abc
+import importlib
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Generic, Protocol
 
+from .conditions import CachedCondition, is_static
 from .errors import RegistrationError
 
+# Bases shared by too many classes to be useful as interface keys
+_UNINDEXED_BASES = frozenset({object, Generic, Protocol, abc.ABC})
+
+# Attributes typing adds to every Protocol; not part of the interface
+_PROTOCOL_BOOKKEEPING = frozenset(
+    {
+        "__abstractmethods__",
+        "__annotations__",
+        "__class_getitem__",
+        "__dict__",
+        "__doc__",
+        "__firstlineno__",
+        "__init__",
+        "__module__",
+        "__new__",
+        "__non_callable_proto_members__",
+        "__orig_bases__",
+        "__parameters__",
+        "__protocol_attrs__",
+        "__qualname__",
+        "__slots__",
+        "__static_attributes__",
+        "__subclasshook__",
+        "__type_params__",
+        "__weakref__",
+    }
+)
+
+
+def _is_protocol(cls: Any) -> bool:
+    """Check if a class is a typing.Protocol (not merely a subclass of one)."""
+    return isinstance(cls, type) and bool(getattr(cls, "_is_protocol", False))
+
+
+def _protocol_members(protocol: type) -> frozenset[str]:
+    """Names of the attributes and methods a Protocol requires."""
+    members = getattr(protocol, "__protocol_attrs__", None)
+    if members is not None:
+        return frozenset(members)
+
+    names = set()
+    for base in protocol.__mro__:
+        if base in _UNINDEXED_BASES:
+            continue
+        for name in (*vars(base), *getattr(base, "__annotations__", {})):
+            if name in _PROTOCOL_BOOKKEEPING or name.startswith(("_abc_", "_is_")):
+                continue
+            names.add(name)
+    return frozenset(names)
+
+
+def _satisfies(cls: type, interface: type) -> bool:
+    """Check whether a class satisfies a Protocol structurally or an ABC virtually."""
+    if _is_protocol(interface):
+        members = _protocol_members(interface)
+        if not members:
+            return False
+        annotated = set()
+        for base in cls.__mro__:
+            annotated.update(getattr(base, "__annotations__", {}))
+        return all(hasattr(cls, name) or name in annotated for name in members)
+    try:
+        return issubclass(cls, interface)
+    except TypeError:
+        return False
+
 
 class Scope(Enum):
     """Component lifecycle scopes."""
@@ -62,6 +136,35 @@ class Scope(Enum):
     SCOPED = "scoped"  # One instance per scope context
 
 
+class ImportRef:
+    """Provider placeholder for a class that is imported on first resolution.
+
+    Static discovery registers components with an ImportRef so their modules
+    are not imported at startup. ComponentRegistry.materialize() replaces it
+    with the real class the first time the component is compiled.
+
+    Attributes:
+        module: Fully qualified name of the defining module
+        qualname: Qualified name of the class within the module
+    """
+
+    __slots__ = ("module", "qualname")
+
+    def __init__(self, module: str, qualname: str):
+        self.module = module
+        self.qualname = qualname
+
+    def load(self) -> Any:
+        """Import the module and return the referenced class."""
+        target = importlib.import_module(self.module)
+        for part in self.qualname.split("."):
+            target = getattr(target, part)
+        return target
+
+    def __repr__(self) -> str:
+        return f"ImportRef('{self.module}:{self.qualname}')"
+
+
 @dataclass
 class ComponentDescriptor:
     """Complete metadata for a registered component.
@@ -80,6 +183,8 @@ class ComponentDescriptor:
         lazy: Whether this component should use lazy resolution
         is_factory: True if provider is a factory function
         metadata: Additional arbitrary metadata
+        dynamic_condition: True if the condition must be re-checked on every
+            resolution (see whiskey.core.conditions)
     """
 
     key: str
@@ -92,6 +197,7 @@ class ComponentDescriptor:
     lazy: bool = False
     is_factory: bool = False
     metadata: dict[str, Any] = field(default_factory=dict)
+    dynamic_condition: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate and normalize descriptor data."""
@@ -113,6 +219,8 @@ class ComponentDescriptor:
         if callable(self.provider) and not isinstance(self.provider, type):
             self.is_factory = True
 
+        self.dynamic_condition = not is_static(self.condition)
+
     def matches_condition(self) -> bool:
         """Check if this component's registration condition is met.
 
@@ -161,10 +269,23 @@ class ComponentRegistry:
         - Tag-based filtering
         - Condition evaluation
         - Efficient querying
+        - Copy-on-write overlays of a parent registry
+
+    A registry created with a ``parent`` starts empty and shares the parent's
+    registrations without copying them: get() and has() fall through to the
+    parent for keys not registered locally, and version reflects changes on
+    either side. Enumeration (list_all(), find_by_*(), keys(), len()) and
+    mutation only ever cover the registry's own registrations.
     """
 
-    def __init__(self):
-        """Initialize an empty registry."""
+    def __init__(self, parent: ComponentRegistry | None = None):
+        """Initialize an empty registry.
+
+        Args:
+            parent: Optional registry whose registrations this one overlays
+        """
+        self._parent = parent
+
         # Primary storage: key → descriptor
         self._descriptors: dict[str, ComponentDescriptor] = {}
 
@@ -173,11 +294,90 @@ class ComponentRegistry:
         self._tag_to_keys: dict[str, set[str]] = defaultdict(set)
         self._scope_to_keys: dict[Scope, set[str]] = defaultdict(set)
 
+        # Interface index: every class in a component type's MRO → keys, kept
+        # in registration order. Protocols and ABCs (which can be satisfied
+        # without inheriting) are indexed lazily, on first lookup, and then
+        # maintained on every register/remove.
+        self._supertype_to_keys: dict[type, dict[str, None]] = defaultdict(dict)
+        self._structural_to_keys: dict[type, dict[str, None]] = {}
+        # abc.get_cache_token() when the structural index was last checked;
+        # it changes whenever some ABC gains a virtual subclass
+        self._abc_token = abc.get_cache_token()
+        # Per-interface counters so caches derived from one interface's
+        # implementations can ignore unrelated registrations
+        self._interface_versions: dict[type, int] = defaultdict(int)
+
         # Compatibility properties for tests
         self._components = self._descriptors  # Alias for old tests
         self._tag_index = self._tag_to_keys  # Alias for old tests
         self._type_index = self._type_to_keys  # Alias for old tests
 
+        # Bumped on every mutation so derived caches (e.g. resolution plans)
+        # can detect staleness with a single integer comparison
+        self._version = 0
+
+        # Set by freeze(); conditions are evaluated once and never again
+        self._frozen = False
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter incremented whenever registrations change.
+
+        For a child registry this includes the parent's version, so caches
+        keyed on it also notice changes made to the parent.
+        """
+        if self._parent is not None:
+            return self._version + self._parent.version
+        return self._version
+
+    @property
+    def parent(self) -> ComponentRegistry | None:
+        """The registry this one overlays, if any."""
+        return self._parent
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry has been frozen against further changes."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Make the registry read-only and settle all conditions.
+
+        Conditions are evaluated one last time; components whose condition
+        does not hold are dropped. Afterwards register(), remove() and clear()
+        raise RegistrationError and lookups no longer evaluate conditions.
+        """
+        if self._frozen:
+            return
+
+        for key, descriptor in list(self._descriptors.items()):
+            if not descriptor.matches_condition():
+                self.remove(key)
+
+        self._frozen = True
+        self._version += 1
+
+    def refresh_conditions(self) -> None:
+        """Re-evaluate cached conditions on their next check.
+
+        Static conditions keep their first result until this is called, so
+        call it after changing whatever they depend on (e.g. the
+        environment). Caches derived from the registry are invalidated.
+
+        Raises:
+            RegistrationError: If the registry is frozen
+        """
+        self._check_not_frozen("refresh conditions")
+        for descriptor in self._descriptors.values():
+            if isinstance(descriptor.condition, CachedCondition):
+                descriptor.condition.invalidate()
+        self._version += 1
+
+    def _check_not_frozen(self, operation: str) -> None:
+        """Raise if the registry is frozen."""
+        if self._frozen:
+            raise RegistrationError(f"Cannot {operation}: registry is frozen")
+
     def register(
         self,
         key: str | type,
@@ -220,10 +420,13 @@ class ComponentRegistry:
 
         # Normalize key to string
         string_key = self._normalize_key(key, name)
+        self._check_not_frozen(f"register '{string_key}'")
 
         # Check for duplicate registration unless override is allowed
-        if string_key in self._descriptors and not allow_override:
-            raise RegistrationError(f"Component '{string_key}' is already registered")
+        if string_key in self._descriptors:
+            if not allow_override:
+                raise RegistrationError(f"Component '{string_key}' is already registered")
+            self._unindex_interfaces(string_key)
 
         # Determine component type
         if component_type is None:
@@ -272,8 +475,38 @@ class ComponentRegistry:
         for tag in descriptor.tags:
             self._tag_to_keys[tag].add(string_key)
 
+        self._index_interfaces(string_key, component_type)
+
+        self._version += 1
         return descriptor
 
+    def _index_interfaces(self, string_key: str, component_type: Any) -> None:
+        """Add a component to the interface index."""
+        if not isinstance(component_type, type) or component_type is ImportRef:
+            # Placeholders are indexed once materialize() imports the class
+            return
+        for base in component_type.__mro__:
+            if base not in _UNINDEXED_BASES:
+                self._supertype_to_keys[base][string_key] = None
+                self._interface_versions[base] += 1
+        for interface, keys in self._structural_to_keys.items():
+            if _satisfies(component_type, interface):
+                keys[string_key] = None
+                self._interface_versions[interface] += 1
+
+    def _unindex_interfaces(self, string_key: str) -> None:
+        """Remove a component from the interface index."""
+        component_type = self._descriptors[string_key].component_type
+        if not isinstance(component_type, type):
+            return
+        for base in component_type.__mro__:
+            keys = self._supertype_to_keys.get(base)
+            if keys is not None and keys.pop(string_key, False) is None:
+                self._interface_versions[base] += 1
+        for interface, keys in self._structural_to_keys.items():
+            if keys.pop(string_key, False) is None:
+                self._interface_versions[interface] += 1
+
     def get(self, key: str | type, name: str | None = None) -> ComponentDescriptor:
         """Get a component descriptor by key.
 
@@ -287,6 +520,15 @@ class ComponentRegistry:
         Raises:
             KeyError: If component is not registered
         """
+        if self._parent is None:
+            return self._get_local(key, name)
+        try:
+            return self._get_local(key, name)
+        except KeyError:
+            return self._parent.get(key, name)
+
+    def _get_local(self, key: str | type, name: str | None = None) -> ComponentDescriptor:
+        """Get a descriptor registered in this registry, ignoring the parent."""
         string_key = self._normalize_key(key, name)
 
         # Try the key as-is first
@@ -311,8 +553,8 @@ class ComponentRegistry:
             else:
                 raise KeyError(f"Component '{string_key}' not registered")
 
-        # Check condition if present
-        if not descriptor.matches_condition():
+        # Check condition if present (settled once the registry is frozen)
+        if not self._frozen and not descriptor.matches_condition():
             raise KeyError(f"Component '{string_key}' condition not met")
 
         return descriptor
@@ -333,6 +575,25 @@ class ComponentRegistry:
         except KeyError:
             return False
 
+    def has_local(self, key: str | type, name: str | None = None) -> bool:
+        """Check if a component is registered in this registry itself.
+
+        Unlike has(), registrations inherited from a parent registry are not
+        considered.
+
+        Args:
+            key: Component key (string or type)
+            name: Optional name for named components
+
+        Returns:
+            True if component is registered here and condition is met
+        """
+        try:
+            self._get_local(key, name)
+            return True
+        except KeyError:
+            return False
+
     def remove(self, key: str | type, name: str | None = None) -> bool:
         """Remove a component from the registry.
 
@@ -344,10 +605,12 @@ class ComponentRegistry:
             True if component was removed, False if not found
         """
         string_key = self._normalize_key(key, name)
+        self._check_not_frozen(f"remove '{string_key}'")
 
         if string_key not in self._descriptors:
             return False
 
+        self._unindex_interfaces(string_key)
         descriptor = self._descriptors.pop(string_key)
 
         # Update reverse lookups
@@ -357,8 +620,52 @@ class ComponentRegistry:
         for tag in descriptor.tags:
             self._tag_to_keys[tag].discard(string_key)
 
+        self._version += 1
         return True
 
+    def materialize(self, descriptor: ComponentDescriptor) -> ComponentDescriptor:
+        """Import the class behind a descriptor registered with an ImportRef.
+
+        The descriptor is updated in place and re-indexed under the real
+        class. If importing the module re-registers the component (e.g. its
+        own decorator targets this registry), the new registration wins and
+        is returned instead. Other descriptors are returned unchanged.
+
+        Args:
+            descriptor: A descriptor from this registry or its parent
+
+        Returns:
+            The descriptor to compile
+
+        Raises:
+            ImportError: If the module cannot be imported
+            AttributeError: If the module does not define the class
+        """
+        if not isinstance(descriptor.provider, ImportRef):
+            return descriptor
+
+        string_key = descriptor.key
+        if self._descriptors.get(string_key) is not descriptor and self._parent is not None:
+            return self._parent.materialize(descriptor)
+
+        cls = descriptor.provider.load()
+        current = self._descriptors.get(string_key)
+        if current is not None and current is not descriptor:
+            return self.materialize(current)
+        if not isinstance(descriptor.provider, ImportRef):
+            # Materialized by a concurrent resolution
+            return descriptor
+
+        if current is descriptor:
+            self._type_to_keys[descriptor.component_type].discard(string_key)
+            self._type_to_keys[cls].add(string_key)
+        descriptor.provider = cls
+        descriptor.component_type = cls
+        descriptor.is_factory = callable(cls) and not isinstance(cls, type)
+        if current is descriptor:
+            self._index_interfaces(string_key, cls)
+        return descriptor
+
     def find_by_type(self, component_type: type) -> list[ComponentDescriptor]:
         """Find all components that provide a specific type.
 
@@ -373,11 +680,101 @@ class ComponentRegistry:
 
         for key in keys:
             descriptor = self._descriptors[key]
-            if descriptor.matches_condition():
+            if self._frozen or descriptor.matches_condition():
                 descriptors.append(descriptor)
 
         return descriptors
 
+    def get_all(self, interface: type) -> list[ComponentDescriptor]:
+        """Find all components that provide an interface.
+
+        Unlike find_by_type(), which matches the exact component type, this
+        includes subclasses, components structurally satisfying a Protocol and
+        virtual subclasses of an ABC. Lookups are served from an index that
+        is maintained incrementally; nothing is scanned after the first
+        lookup of a given Protocol or ABC, unless ``ABC.register()`` has been
+        called since the last lookup, which re-scans the indexed ones.
+
+        Args:
+            interface: Base class, ABC or Protocol to look up
+
+        Returns:
+            Matching ComponentDescriptors whose condition is met
+        """
+        try:
+            keys = self._supertype_to_keys.get(interface)
+        except TypeError:
+            return []
+
+        if _is_protocol(interface) or isinstance(interface, abc.ABCMeta):
+            self._refresh_structural_index()
+            structural = self._structural_to_keys.get(interface)
+            if structural is None:
+                structural = self._structural_to_keys[interface] = self._scan_structural(
+                    interface
+                )
+            keys = {**keys, **structural} if keys else structural
+
+        if not keys:
+            return []
+
+        descriptors = []
+        for key in keys:
+            descriptor = self._descriptors[key]
+            if self._frozen or descriptor.matches_condition():
+                descriptors.append(descriptor)
+        return descriptors
+
+    def interface_version(self, interface: type) -> int:
+        """Counter that changes whenever get_all(interface) may change.
+
+        Only registrations and removals of components providing ``interface``
+        (including new virtual subclasses of an ABC) bump it, so caches keyed
+        on one interface survive unrelated changes. Condition outcomes are
+        not tracked.
+
+        Args:
+            interface: Base class, ABC or Protocol
+
+        Returns:
+            The current version for ``interface``
+        """
+        self._refresh_structural_index()
+        try:
+            return self._interface_versions.get(interface, 0)
+        except TypeError:
+            return 0
+
+    def _scan_structural(self, interface: type) -> dict[str, None]:
+        """Keys of the components satisfying a Protocol or ABC, in registration order."""
+        return {
+            key: None
+            for key, descriptor in self._descriptors.items()
+            if isinstance(descriptor.component_type, type)
+            and descriptor.component_type is not ImportRef
+            and _satisfies(descriptor.component_type, interface)
+        }
+
+    def _refresh_structural_index(self) -> None:
+        """Re-scan indexed Protocols and ABCs after an ``ABC.register()`` call.
+
+        Virtual subclasses registered after a component was indexed would
+        otherwise never be found. Frozen registries keep their index.
+        """
+        token = abc.get_cache_token()
+        if token == self._abc_token or self._frozen:
+            return
+        self._abc_token = token
+        changed = False
+        for interface, keys in self._structural_to_keys.items():
+            current = self._scan_structural(interface)
+            if current.keys() != keys.keys():
+                self._structural_to_keys[interface] = current
+                self._interface_versions[interface] += 1
+                changed = True
+        if changed:
+            self._version += 1
+
     def find_by_tag(self, tag: str) -> list[ComponentDescriptor]:
         """Find all components with a specific tag.
 
@@ -392,7 +789,7 @@ class ComponentRegistry:
 
         for key in keys:
             descriptor = self._descriptors[key]
-            if descriptor.matches_condition():
+            if self._frozen or descriptor.matches_condition():
                 descriptors.append(descriptor)
 
         return descriptors
@@ -411,7 +808,7 @@ class ComponentRegistry:
 
         for key in keys:
             descriptor = self._descriptors[key]
-            if descriptor.matches_condition():
+            if self._frozen or descriptor.matches_condition():
                 descriptors.append(descriptor)
 
         return descriptors
@@ -425,17 +822,23 @@ class ComponentRegistry:
         descriptors = []
 
         for descriptor in self._descriptors.values():
-            if descriptor.matches_condition():
+            if self._frozen or descriptor.matches_condition():
                 descriptors.append(descriptor)
 
         return descriptors
 
     def clear(self) -> None:
         """Clear all registered components."""
+        self._check_not_frozen("clear registry")
         self._descriptors.clear()
         self._type_to_keys.clear()
         self._tag_to_keys.clear()
         self._scope_to_keys.clear()
+        self._supertype_to_keys.clear()
+        self._structural_to_keys.clear()
+        for interface in self._interface_versions:
+            self._interface_versions[interface] += 1
+        self._version += 1
 
     def _normalize_key(self, key: str | type, name: str | None = None) -> str:
         """Convert key to normalized string format.
@@ -16,22 +16,90 @@ Architecture:
         ├── DependencyResolver - Resolves component dependencies
         ├── ScopeResolver - Handles scoped resolution
         └── AsyncResolver - Handles async/sync context adaptation
+
+Resolution Plans:
+    UnifiedResolver compiles each descriptor into a ResolutionPlan the first
+    time it is resolved: the provider, its dependency getters and the scope
+    strategy are folded into a single ``resolve`` callable. Plans are cached
+    per (key, name) and dropped as soon as the registry version changes, so
+    repeated resolutions skip key normalization, descriptor lookup and
+    signature analysis entirely. A cached plan re-checks its component's
+    condition only if the condition is dynamic; static conditions (see
+    ``whiskey.core.conditions``) are settled when the plan is compiled.
+
+Frozen Mode:
+    ``UnifiedResolver.freeze()`` validates the whole dependency graph once
+    (missing dependencies, cycles, singletons capturing scoped components),
+    binds every plan eagerly and publishes them in an immutable lookup table
+    keyed by (type, name) and (string key, name). Frozen lookups skip the
+    registry version and condition checks entirely.
+
+Cycle Detection:
+    Circular dependencies are found on the dependency graph, not by tracking
+    every resolution. The first time a plan is bound (or when the resolver is
+    frozen), its required dependencies are walked once; a cycle raises
+    CircularDependencyError with the full path, and plans proven acyclic are
+    marked so the walk is never repeated. Resolving them carries no stack
+    bookkeeping at all. Plans whose dependencies cannot all be seen
+    statically (factories, auto-created types, optional dependencies) still
+    record their creations in a task-local chain, so interleaved async tasks
+    on one thread never see each other's creations as cycles.
+
+Child Resolvers:
+    ``UnifiedResolver.create_child()`` returns a ChildResolver over a registry
+    that overlays the parent's. Creating one copies nothing: keys the child
+    does not register resolve through the parent's plans, singletons and
+    type analysis. Parent plans whose (non-singleton) dependency chain reaches
+    a key the child overrides are rebound locally, copy-on-write.
+
+Precompiled Wiring:
+    ``install_precompiled()`` feeds dependency analysis generated ahead of
+    time by ``whiskey.core.compiler``; plans built from it never inspect the
+    provider's signature.
+
+Pooled Transients:
+    A transient registered with ``pooled=N`` metadata gets an ObjectPool
+    (see ``whiskey.core.pool``). Its plan checks instances out of the pool
+    and records them in the innermost active scope, which returns them when
+    it exits. Pooled instances built as dependencies of a pooled, singleton or
+    scoped component are owned by it and never checked in separately.
+
+Batch Resolution:
+    ``resolve_many_async()`` groups requests by the async factories their
+    dependency trees await. Groups that share none run concurrently with
+    ``asyncio.gather``; requests that never suspend resolve inline. Singleton
+    single-flight and scope activations behave exactly as for one-by-one
+    resolution.
+
+Performance Monitoring:
+    Inside a PerformanceMonitor, top-level resolutions, provider executions
+    and plan type analysis are recorded into the active PerformanceMetrics.
+    Without a monitor the cost is one ContextVar lookup and branch. Inside a
+    Profiler (see ``whiskey.core.profiler``) every instance creation is also
+    recorded as a span nested under the creation that needed it.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
 import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Iterator, Mapping, Sequence
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Callable, Protocol, TypeVar, runtime_checkable
-from weakref import WeakKeyDictionary
 
 from .analyzer import InjectDecision, InjectResult, TypeAnalyzer
-from .errors import CircularDependencyError, ResolutionError, ScopeError
+from .errors import CircularDependencyError, ConfigurationError, ResolutionError, ScopeError
 from .generic import GenericTypeResolver
-from .registry import ComponentDescriptor, ComponentRegistry, Scope
+from .performance import LRUCache, PerformanceMetrics, ResolutionMetrics, _current_metrics
+from .pool import POOL_CHECKOUTS, ObjectPool, pool_size, release_checkouts
+from .profiler import _current_profiler, profile_span
+from .registry import ComponentDescriptor, ComponentRegistry, ImportRef, Scope
 
 T = TypeVar("T")
 
@@ -49,6 +117,263 @@ class ResolutionContext:
     is_async: bool = False
 
 
+class ResolutionPlan:
+    """Compiled, reusable recipe for resolving one component.
+    
+    A plan captures everything that does not change between resolutions of
+    the same descriptor: the provider, the analyzed dependency list and the
+    scope strategy. ``resolve`` is a flat closure built by
+    ``UnifiedResolver.compile_plan``; dependency getters are bound to the
+    dependencies' own plans on first use.
+    
+    Attributes:
+        key: The lookup key the plan was compiled for
+        descriptor: The component descriptor backing this plan
+        provider: Class, factory or instance that produces the component
+        scope: Lifecycle scope of the component
+        scope_name: Scope name for scoped components
+        is_async: True if the provider is an async factory
+        offload: True if a sync singleton should be constructed in the default
+            executor when resolved from async context (``offload=True`` metadata)
+        pool: ObjectPool for pooled transients (``pooled=N`` metadata), else None
+        async_keys: Keys of the plans in this plan's dependency tree (itself
+            included) that must be awaited; computed on first batch resolution
+        auto_created: True if the descriptor was synthesized for an
+            unregistered but auto-creatable type
+        cycle_checked: True once the plan's static dependency graph is known
+            to be acyclic
+        track_cycles: True if creations must also be tracked at runtime, for
+            plans whose dependencies are not all visible statically (factories,
+            auto-created types and optional dependencies)
+        dependencies: Tuple of (param_name, dependency_key, optional) entries
+        param_names: Names of all analyzed parameters (used for overrides)
+        resolve: Compiled ``(scope_context, overrides=None) -> instance`` callable
+    """
+    
+    __slots__ = (
+        "async_keys",
+        "auto_created",
+        "bound_dependencies",
+        "cycle_checked",
+        "dependencies",
+        "descriptor",
+        "is_async",
+        "key",
+        "offload",
+        "param_names",
+        "pool",
+        "provider",
+        "resolve",
+        "scope",
+        "scope_name",
+        "track_cycles",
+    )
+    
+    def __init__(
+        self,
+        key: Any,
+        descriptor: ComponentDescriptor,
+        dependencies: tuple[tuple[str, Any, bool], ...],
+        param_names: frozenset[str],
+        auto_created: bool = False,
+    ):
+        self.key = key
+        self.descriptor = descriptor
+        self.provider = descriptor.provider
+        self.scope = descriptor.scope
+        self.scope_name = descriptor.metadata.get("scope_name", "default")
+        self.is_async = callable(self.provider) and asyncio.iscoroutinefunction(self.provider)
+        self.offload = bool(descriptor.metadata.get("offload", False))
+        self.auto_created = auto_created
+        self.dependencies = dependencies
+        self.param_names = param_names
+        self.bound_dependencies: list[tuple[str, Callable[[Any], Any]]] | None = None
+        self.pool: ObjectPool | None = None
+        self.async_keys: frozenset[str] | None = None
+        self.cycle_checked = False
+        self.track_cycles = (
+            auto_created
+            or descriptor.is_factory
+            or any(optional for _, _, optional in dependencies)
+        )
+        self.resolve: Callable[..., Any] | None = None
+    
+    def __repr__(self) -> str:
+        return (
+            f"ResolutionPlan({self.descriptor.key!r}, scope={self.scope.value}, "
+            f"deps={[name for name, _, _ in self.dependencies]})"
+        )
+
+
+class InjectionPlan:
+    """Compiled injection recipe for calling a function with dependency injection.
+    
+    Built once per callable by ``UnifiedResolver.get_injection_plan`` and used
+    by ``Container.call`` and ``@inject`` wrappers, so a call no longer runs
+    ``inspect.signature`` or re-analyzes parameters. The plan deliberately
+    holds no reference to the function, which is the key of the weak cache.
+    
+    Attributes:
+        name: Qualified name of the callable (for debugging)
+        is_async: True if the callable is a coroutine function
+        parameters: All parameter names in signature order (positional slots)
+        injections: Tuple of (position, param_name, dependency_key, optional)
+        version: Registry version the analysis was made against
+    """
+    
+    __slots__ = ("injections", "is_async", "name", "parameters", "version")
+    
+    def __init__(
+        self,
+        func: Callable,
+        parameters: tuple[str, ...],
+        injections: tuple[tuple[int, str, Any, bool], ...],
+        version: int,
+    ):
+        self.name = getattr(func, "__qualname__", repr(func))
+        self.is_async = asyncio.iscoroutinefunction(func)
+        self.parameters = parameters
+        self.injections = injections
+        self.version = version
+    
+    def select_kwargs(self, num_args: int, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Keep only caller kwargs that name a parameter not filled positionally."""
+        if not kwargs:
+            return {}
+        parameters = self.parameters[num_args:] if num_args else self.parameters
+        return {name: kwargs[name] for name in parameters if name in kwargs}
+    
+    def __repr__(self) -> str:
+        return f"InjectionPlan({self.name}, injections={[entry[1] for entry in self.injections]})"
+
+
+# Tracked plans being created in the current task (see ResolutionPlan.track_cycles)
+_resolving: ContextVar[tuple[ResolutionPlan, ...]] = ContextVar("resolving", default=())
+
+# Sentinel for cache misses, since None is a valid cached instance
+_MISSING = object()
+
+# Set while a pooled instance is being built: its pooled dependencies belong
+# to it and must not be returned to their pools at scope exit
+_building_pooled: ContextVar[bool] = ContextVar("building_pooled", default=False)
+
+
+def _pool_checkouts(scope_context: dict[str, dict[str, Any]] | None) -> list | None:
+    """Checkout list of the innermost active scope, or None if untracked."""
+    if not scope_context or _building_pooled.get():
+        return None
+    activation = next(reversed(scope_context.values()))
+    return activation.setdefault(POOL_CHECKOUTS, [])
+
+
+def _create_owned(create: Callable[..., Any], *args: Any) -> Any:
+    """Run a creation whose pooled dependencies are owned by the result."""
+    token = _building_pooled.set(True)
+    try:
+        return create(*args)
+    finally:
+        _building_pooled.reset(token)
+
+
+async def _create_owned_async(create: Callable[[], Any]) -> Any:
+    """Await a creation whose pooled dependencies are owned by the result."""
+    token = _building_pooled.set(True)
+    try:
+        return await create()
+    finally:
+        _building_pooled.reset(token)
+
+
+def _display_key(plan: ResolutionPlan) -> str:
+    """Readable name for a plan in error messages."""
+    if plan.auto_created:
+        return getattr(plan.descriptor.component_type, "__name__", plan.descriptor.key)
+    return plan.descriptor.key
+
+
+def _enter_tracked(plan: ResolutionPlan) -> Token:
+    """Push a tracked plan onto the task's creation chain.
+    
+    The chain is per task (a ContextVar), so concurrent tasks on one thread
+    (e.g. parallel startup) never see each other's creations as cycles.
+    
+    Raises:
+        CircularDependencyError: If the plan is already being created
+    """
+    chain = _resolving.get()
+    key = plan.descriptor.key
+    for index, entry in enumerate(chain):
+        if entry.descriptor.key == key:
+            raise CircularDependencyError(
+                [cycle_entry.descriptor.component_type for cycle_entry in chain[index:]]
+            )
+    return _resolving.set((*chain, plan))
+
+
+def _find_cycles(graph: dict[str, list[str]]) -> list[list[str]]:
+    """Find the distinct dependency cycles in a graph, each as a node path."""
+    cycles = []
+    seen_cycles: set[frozenset[str]] = set()
+    done: set[str] = set()
+    
+    for root in graph:
+        if root in done:
+            continue
+        # Iterative DFS; ``path`` mirrors the current stack for cycle extraction
+        path: list[str] = []
+        on_path: dict[str, int] = {}
+        stack = [(root, iter(graph.get(root, ())))]
+        path.append(root)
+        on_path[root] = 0
+        while stack:
+            node, edges = stack[-1]
+            for dep in edges:
+                if dep in on_path:
+                    cycle = path[on_path[dep] :]
+                    if frozenset(cycle) not in seen_cycles:
+                        seen_cycles.add(frozenset(cycle))
+                        cycles.append(cycle)
+                elif dep not in done:
+                    on_path[dep] = len(path)
+                    path.append(dep)
+                    stack.append((dep, iter(graph.get(dep, ()))))
+                    break
+            else:
+                stack.pop()
+                path.pop()
+                del on_path[node]
+                done.add(node)
+    
+    return cycles
+
+
+def _unsatisfied_parameters(plan: ResolutionPlan) -> list[str]:
+    """Names of required provider parameters that the plan will not inject."""
+    provider = plan.provider
+    if not callable(provider):
+        return []
+    target = provider.__init__ if isinstance(provider, type) else provider
+    try:
+        parameters = inspect.signature(target).parameters
+    except (ValueError, TypeError):
+        return []
+    
+    injected = {param_name for param_name, _, _ in plan.dependencies}
+    return [
+        param.name
+        for param in parameters.values()
+        if param.name != "self"
+        and param.default is inspect.Parameter.empty
+        and param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        and param.name not in injected
+    ]
+
+
+def _resolve_none(scope_context: Any) -> None:
+    """Dependency getter for optional dependencies that are not registered."""
+    return None
+
+
 @runtime_checkable
 class ResolverInterface(Protocol):
     """Protocol defining the resolver interface."""
@@ -80,13 +405,14 @@ class TypeResolver:
         self.registry = registry
         self._type_analyzer = TypeAnalyzer(registry)
         self._generic_resolver = GenericTypeResolver(registry)
-        self._analysis_cache: WeakKeyDictionary = WeakKeyDictionary()
+        self._analysis_cache = LRUCache("resolver.type_analysis", 2048, weak_keys=True)
     
     def analyze_type(self, type_hint: Any) -> InjectResult:
         """Analyze a type and determine injection strategy."""
         # Check cache first
-        if type_hint in self._analysis_cache:
-            return self._analysis_cache[type_hint]
+        result = self._analysis_cache.get(type_hint)
+        if result is not None:
+            return result
         
         # Perform analysis
         result = self._type_analyzer._analyze_type_hint(type_hint)
@@ -148,14 +474,16 @@ class DependencyResolver:
     def __init__(self, registry: ComponentRegistry, type_resolver: TypeResolver):
         self.registry = registry
         self.type_resolver = type_resolver
-        self._injection_cache: WeakKeyDictionary = WeakKeyDictionary()
+        self._injection_cache = LRUCache("resolver.injection", 2048, weak_keys=True)
         self._resolving_local = threading.local()
     
     def resolve_dependencies(self, cls: type, overrides: dict[str, Any]) -> dict[str, Any]:
         """Resolve all dependencies for a class constructor."""
         # Check cache
-        if cls in self._injection_cache and not overrides:
-            return self._injection_cache[cls].copy()
+        if not overrides:
+            cached = self._injection_cache.get(cls)
+            if cached is not None:
+                return cached.copy()
         
         # Analyze constructor
         analysis = self.type_resolver.analyze_callable(cls.__init__)
@@ -203,12 +531,18 @@ class ScopeResolver:
     - Handling scoped instances
     - Implementing scope validation
     - Managing instance lifecycle
+    
+    Scoped instances are not stored here. Each scope activation owns its own
+    instance dict inside the ``active_scopes`` mapping carried by a ContextVar,
+    so concurrent activations of the same scope name never see each other's
+    instances and lookups need no lock.
     """
     
     def __init__(self):
         self._singleton_cache: dict[str, Any] = {}
-        self._scoped_caches: dict[str, dict[str, Any]] = {}
         self._singleton_lock = threading.RLock()
+        # In-flight async singleton creations: key -> (future, creating task)
+        self._singleton_futures: dict[str, tuple[asyncio.Future, asyncio.Task | None]] = {}
     
     def resolve_singleton(self, key: str, factory: Callable[[], Any]) -> Any:
         """Resolve a singleton instance with thread safety."""
@@ -224,24 +558,104 @@ class ScopeResolver:
             self._singleton_cache[key] = instance
             return instance
     
+    async def resolve_singleton_async(
+        self, key: str, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Resolve a singleton instance in async context.
+        
+        Concurrent awaiters of the same key share a single creation through a
+        per-key future, and no lock is held across an await. The threading lock
+        is only taken briefly to publish the instance, so sync resolution from
+        other threads still sees exactly one instance.
+        """
+        if key in self._singleton_cache:
+            return self._singleton_cache[key]
+        
+        loop = asyncio.get_running_loop()
+        pending = self._singleton_futures.get(key)
+        if pending is not None and pending[0].get_loop() is loop:
+            # Shield so a cancelled awaiter doesn't cancel the shared creation
+            return await asyncio.shield(pending[0])
+        
+        future = loop.create_future()
+        if pending is None:
+            self._singleton_futures[key] = (future, asyncio.current_task())
+        try:
+            instance = await factory()
+            with self._singleton_lock:
+                # A sync resolution in another thread may have won the race
+                instance = self._singleton_cache.setdefault(key, instance)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved; awaiters (if any) still receive it
+                future.exception()
+            raise
+        else:
+            future.set_result(instance)
+            return instance
+        finally:
+            if self._singleton_futures.get(key, (None,))[0] is future:
+                del self._singleton_futures[key]
+    
+    def created_singletons(self) -> list[tuple[str, Any]]:
+        """Get the singletons created so far as (key, instance), in creation order.
+        
+        The singleton cache is only ever appended to when an instance is
+        published, so its insertion order is the creation order. A singleton's
+        dependencies are therefore always listed before it.
+        """
+        with self._singleton_lock:
+            return list(self._singleton_cache.items())
+    
+    def forget_singletons(self, keys: list[str] | None = None) -> None:
+        """Drop cached singletons (all of them if keys is None) without disposing."""
+        with self._singleton_lock:
+            if keys is None:
+                self._singleton_cache.clear()
+            else:
+                for key in keys:
+                    self._singleton_cache.pop(key, None)
+    
     def resolve_scoped(self, key: str, scope_name: str, factory: Callable[[], Any], 
                       active_scopes: dict[str, dict[str, Any]] | None) -> Any:
-        """Resolve a scoped instance."""
-        if not active_scopes or scope_name not in active_scopes:
+        """Resolve a scoped instance from the current activation's storage."""
+        scope_cache = active_scopes.get(scope_name) if active_scopes else None
+        if scope_cache is None:
             raise ScopeError(f"Scope '{scope_name}' is not active")
         
-        scope_cache = self._scoped_caches.setdefault(scope_name, {})
+        instance = scope_cache.get(key, _MISSING)
+        if instance is _MISSING:
+            # setdefault keeps the first instance if another thread sharing
+            # this activation raced us to create it
+            instance = scope_cache.setdefault(key, factory())
+        return instance
+    
+    def clear_scope(
+        self, scope_name: str, active_scopes: dict[str, dict[str, Any]] | None = None
+    ) -> list[Any]:
+        """Clear the instances of one scope activation.
         
-        if key not in scope_cache:
-            instance = factory()
-            scope_cache[key] = instance
+        Args:
+            scope_name: Name of the scope being torn down
+            active_scopes: The active scopes mapping holding the activation
         
-        return scope_cache[key]
-    
-    def clear_scope(self, scope_name: str) -> None:
-        """Clear all instances in a scope."""
-        if scope_name in self._scoped_caches:
-            del self._scoped_caches[scope_name]
+        Returns:
+            The instances that were stored in the activation, in creation order,
+            excluding pooled instances (which are released to their pools)
+        """
+        scope_cache = active_scopes.get(scope_name) if active_scopes else None
+        if not scope_cache:
+            return []
+        
+        # Pooled instances go back to their pools rather than being disposed
+        release_checkouts(scope_cache.pop(POOL_CHECKOUTS, ()))
+        
+        instances = list(scope_cache.values())
+        scope_cache.clear()
+        return instances
 
 
 class AsyncResolver:
@@ -289,6 +703,11 @@ class UnifiedResolver:
     
     This is the main entry point that combines all resolvers into a cohesive system.
     It delegates to specialized resolvers while maintaining loose coupling.
+    
+    Every resolution goes through a compiled ResolutionPlan. Plans are cached
+    per (key, name) and invalidated wholesale whenever the registry version
+    changes, so steady-state resolution is a dict lookup plus the plan's
+    ``resolve`` closure.
     """
     
     def __init__(self, registry: ComponentRegistry):
@@ -297,6 +716,15 @@ class UnifiedResolver:
         self.dependency_resolver = DependencyResolver(registry, self.type_resolver)
         self.scope_resolver = ScopeResolver()
         self.async_resolver = AsyncResolver()
+        self._plans: dict[tuple[Any, str | None], ResolutionPlan] = {}
+        self._plans_version = registry.version
+        self._injection_plans = LRUCache("resolver.injection_plans", 4096, weak_keys=True)
+        # Populated by freeze(); read without locks or version checks
+        self._frozen_plans: Mapping[tuple[Any, str | None], ResolutionPlan] | None = None
+        # Dependency analysis loaded from generated wiring (see compiler.py)
+        self._precompiled: dict[str, tuple[Any, tuple, frozenset[str]]] = {}
+        # Pools of pooled transients: key -> (provider, pool)
+        self._pools: dict[str, tuple[Any, ObjectPool]] = {}
     
     def resolve(self, key: str | type, name: str | None = None, **kwargs) -> Any:
         """Smart resolution that adapts to context."""
@@ -309,56 +737,808 @@ class UnifiedResolver:
     
     def _resolve_sync(self, key: str | type, name: str | None = None, **kwargs) -> Any:
         """Synchronous resolution implementation."""
-        context = ResolutionContext(
-            key=key,
-            name=name,
-            overrides=kwargs.get("overrides", {}),
-            scope_context=kwargs.get("scope_context", {}),
-            is_async=False
-        )
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            return self._resolve_sync_monitored(metrics, key, name, **kwargs)
         
-        # Get descriptor
-        descriptor = self._get_descriptor(context)
+        plan = self.get_plan(key, name)
         
         # Check provider compatibility
-        self.async_resolver.check_async_provider(descriptor.provider, key)
-        
-        # Check circular dependencies
-        self._check_circular_dependency(context, descriptor)
+        if plan.is_async:
+            self.async_resolver.check_async_provider(plan.provider, key)
         
-        try:
-            # Resolve based on scope
-            return self._resolve_by_scope_sync(descriptor, context)
-        finally:
-            self._clear_resolving(context, descriptor)
+        return plan.resolve(kwargs.get("scope_context"), kwargs.get("overrides"))
     
     async def _resolve_async(self, key: str | type, name: str | None = None, **kwargs) -> Any:
         """Asynchronous resolution implementation."""
-        context = ResolutionContext(
-            key=key,
-            name=name,
-            overrides=kwargs.get("overrides", {}),
-            scope_context=kwargs.get("scope_context", {}),
-            is_async=True
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            return await self._resolve_async_monitored(metrics, key, name, **kwargs)
+        
+        plan = self.get_plan(key, name)
+        return await self._resolve_plan_async(
+            plan, kwargs.get("scope_context"), kwargs.get("overrides")
         )
+    
+    # Batch resolution
+    
+    async def resolve_many_async(
+        self, requests: Sequence[tuple[Any, str | None, bool]], scope_context: Any = None
+    ) -> list[Any]:
+        """Resolve several components, awaiting independent subgraphs concurrently.
+        
+        Args:
+            requests: (key, name, optional) entries; an optional entry resolves
+                to None instead of raising ResolutionError
+            scope_context: Active scopes to resolve in
+        
+        Returns:
+            The instances, in request order
+        """
+        results: list[Any] = [None] * len(requests)
         
-        # Get descriptor
-        descriptor = self._get_descriptor(context)
+        async def run(indices: list[int]) -> None:
+            for index in indices:
+                key, name, optional = requests[index]
+                try:
+                    results[index] = await self._resolve_async(
+                        key, name, scope_context=scope_context
+                    )
+                except ResolutionError:
+                    if not optional:
+                        raise
         
-        # Check circular dependencies
-        self._check_circular_dependency(context, descriptor)
+        inline, groups = self._independent_groups(requests, scope_context)
+        await run(inline)
+        if len(groups) == 1:
+            await run(groups[0])
+        elif groups:
+            tasks = [asyncio.ensure_future(run(group)) for group in groups]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+        return results
+    
+    def _independent_groups(
+        self, requests: Sequence[tuple[Any, str | None, bool]], scope_context: Any
+    ) -> tuple[list[int], list[list[int]]]:
+        """Split request indices into inline ones and groups sharing no async factory."""
+        singletons = self.scope_resolver._singleton_cache
+        inline: list[int] = []
+        groups: list[tuple[set[str], list[int]]] = []
+        for index, (key, name, _optional) in enumerate(requests):
+            try:
+                plan = self.get_plan(key, name)
+            except ResolutionError:
+                inline.append(index)  # Raises (or yields None) when run
+                continue
+            keys = {dep for dep in self._async_keys(plan) if dep not in singletons}
+            if not keys or self._is_cached(plan, scope_context):
+                inline.append(index)
+                continue
+            indices = [index]
+            for shared in [group for group in groups if not keys.isdisjoint(group[0])]:
+                groups.remove(shared)
+                keys |= shared[0]
+                indices = shared[1] + indices
+            groups.append((keys, sorted(indices)))
+        return inline, [indices for _, indices in groups]
+    
+    def _async_keys(self, plan: ResolutionPlan) -> frozenset[str]:
+        """Keys of the plans in a plan's dependency tree that must be awaited.
         
+        Computed bottom-up (iteratively, chains can be deep) and stored on
+        every plan visited, so a plan shared by many dependents is analyzed
+        once.
+        """
+        if plan.async_keys is not None:
+            return plan.async_keys
+        on_path: set[int] = set()
+        stack: list[tuple[ResolutionPlan, list[ResolutionPlan] | None]] = [(plan, None)]
+        while stack:
+            current, deps = stack.pop()
+            if current.async_keys is not None:
+                continue
+            if deps is None:
+                # First visit: compute the dependencies before this plan
+                deps = []
+                for _, dep_key, optional in current.dependencies:
+                    with contextlib.suppress(ResolutionError):
+                        deps.append(self.get_plan(dep_key, allow_auto_create=not optional))
+                on_path.add(id(current))
+                stack.append((current, deps))
+                stack.extend(
+                    (dep, None)
+                    for dep in deps
+                    if dep.async_keys is None and id(dep) not in on_path
+                )
+                continue
+            on_path.discard(id(current))
+            keys = set()
+            if current.is_async or (current.offload and current.scope == Scope.SINGLETON):
+                keys.add(current.descriptor.key)
+            for dep in deps:
+                # None only for a dependency cycle, which fails on resolution anyway
+                if dep.async_keys:
+                    keys |= dep.async_keys
+            current.async_keys = frozenset(keys)
+        return plan.async_keys
+    
+    def _awaits_dependencies(self, plan: ResolutionPlan) -> bool:
+        """Whether a plan's dependency tree awaits anything besides the plan itself."""
+        keys = self._async_keys(plan)
+        # The plan's own key only counts once, if present
+        return len(keys) > (plan.descriptor.key in keys)
+    
+    # Performance monitoring
+    
+    def _resolve_sync_monitored(
+        self, metrics: PerformanceMetrics, key: str | type, name: str | None, **kwargs
+    ) -> Any:
+        """Synchronous resolution that records a ResolutionMetrics sample."""
+        start = time.perf_counter()
+        service_key = getattr(key, "__name__", str(key))
+        cache_hit = False
+        plan = None
         try:
-            # Resolve based on scope
-            return await self._resolve_by_scope_async(descriptor, context)
+            plan = self.get_plan(key, name)
+            service_key = plan.descriptor.key
+            if plan.is_async:
+                self.async_resolver.check_async_provider(plan.provider, key)
+            scope_context = kwargs.get("scope_context")
+            cache_hit = self._is_cached(plan, scope_context)
+            return plan.resolve(scope_context, kwargs.get("overrides"))
+        except Exception as e:
+            self._record_resolution_error(metrics, e)
+            raise
         finally:
-            self._clear_resolving(context, descriptor)
+            self._record_resolution(metrics, service_key, plan, cache_hit, start)
+    
+    async def _resolve_async_monitored(
+        self, metrics: PerformanceMetrics, key: str | type, name: str | None, **kwargs
+    ) -> Any:
+        """Asynchronous resolution that records a ResolutionMetrics sample."""
+        start = time.perf_counter()
+        service_key = getattr(key, "__name__", str(key))
+        cache_hit = False
+        plan = None
+        try:
+            plan = self.get_plan(key, name)
+            service_key = plan.descriptor.key
+            scope_context = kwargs.get("scope_context")
+            cache_hit = self._is_cached(plan, scope_context)
+            return await self._resolve_plan_async(plan, scope_context, kwargs.get("overrides"))
+        except Exception as e:
+            self._record_resolution_error(metrics, e)
+            raise
+        finally:
+            self._record_resolution(metrics, service_key, plan, cache_hit, start)
+    
+    def _is_cached(self, plan: ResolutionPlan, scope_context: Any) -> bool:
+        """Check whether resolving a plan will be served from a cache."""
+        if plan.scope == Scope.SINGLETON:
+            return plan.descriptor.key in self.scope_resolver._singleton_cache
+        if plan.scope == Scope.SCOPED and scope_context:
+            return plan.descriptor.key in scope_context.get(plan.scope_name, ())
+        return not callable(plan.provider)
+    
+    @staticmethod
+    def _record_resolution(
+        metrics: PerformanceMetrics,
+        service_key: str,
+        plan: ResolutionPlan | None,
+        cache_hit: bool,
+        start: float,
+    ) -> None:
+        """Record a top-level resolution sample."""
+        metrics.record_resolution(
+            ResolutionMetrics(
+                service_key=service_key,
+                resolution_time=time.perf_counter() - start,
+                cache_hit=cache_hit,
+                depth=0,
+                dependencies_resolved=len(plan.dependencies) if plan is not None else 0,
+                circular_check_time=0.0,
+                # Recorded separately when plans are compiled
+                type_analysis_time=0.0,
+            )
+        )
+    
+    @staticmethod
+    def _record_resolution_error(metrics: PerformanceMetrics, error: Exception) -> None:
+        """Record a failed resolution."""
+        if isinstance(error, CircularDependencyError):
+            metrics.record_error("circular_dependency")
+        else:
+            metrics.record_error(type(error).__name__.lower())
+    
+    # Resolution plans
+    
+    def get_plan(
+        self, key: str | type, name: str | None = None, allow_auto_create: bool = True
+    ) -> ResolutionPlan:
+        """Get the compiled resolution plan for a key, compiling it if needed.
+        
+        Args:
+            key: Component key (string or type)
+            name: Optional name for named components
+            allow_auto_create: Whether unregistered classes may be auto-created
+        
+        Returns:
+            The cached or freshly compiled ResolutionPlan
+        
+        Raises:
+            ResolutionError: If the component is not registered and cannot be
+                auto-created
+        """
+        frozen_plans = self._frozen_plans
+        if frozen_plans is not None:
+            try:
+                plan = frozen_plans.get((key, name))
+            except TypeError:
+                plan = None
+            if plan is not None and (allow_auto_create or not plan.auto_created):
+                return plan
+        
+        if self._plans_version != self.registry.version:
+            self.invalidate_plans()
+        
+        try:
+            plan = self._plans.get((key, name))
+        except TypeError:
+            # Unhashable key - compile without caching
+            return self._compile_uncached(key, name, allow_auto_create)
+        
+        if plan is not None:
+            if plan.auto_created and not allow_auto_create:
+                raise ResolutionError(f"Component '{key}' not registered")
+            if (
+                not plan.descriptor.dynamic_condition
+                or self.registry.frozen
+                or plan.descriptor.matches_condition()
+            ):
+                return plan
+            # Condition no longer holds - fall back to a fresh lookup
+            return self._compile_uncached(key, name, allow_auto_create)
+        
+        plan = self._compile_uncached(key, name, allow_auto_create)
+        self._plans[(key, name)] = plan
+        return plan
+    
+    def invalidate_plans(self) -> None:
+        """Drop all compiled plans so they are rebuilt from the registry.
+        
+        The frozen lookup table is immutable and survives invalidation.
+        """
+        self._plans.clear()
+        self._plans_version = self.registry.version
+    
+    def install_precompiled(
+        self,
+        key: str,
+        provider: Any,
+        dependencies: tuple[tuple[str, Any, bool], ...],
+        param_names: frozenset[str],
+    ) -> None:
+        """Supply ahead-of-time dependency analysis for a component.
+        
+        ``compile_plan`` uses it instead of analyzing the provider's signature
+        as long as the descriptor registered under ``key`` still has the same
+        provider.
+        
+        Args:
+            key: The descriptor key the analysis belongs to
+            provider: The provider that was analyzed
+            dependencies: Tuple of (param_name, dependency_key, optional) entries
+            param_names: Names of all analyzed parameters
+        """
+        self._precompiled[key] = (provider, dependencies, param_names)
+    
+    def create_child(self, registry: ComponentRegistry) -> ChildResolver:
+        """Create a resolver for a registry overlaying this resolver's registry.
+        
+        Args:
+            registry: A registry whose parent is this resolver's registry
+        
+        Returns:
+            A ChildResolver that falls through to this resolver
+        """
+        return ChildResolver(self, registry)
+    
+    # Frozen mode
+    
+    @property
+    def frozen(self) -> bool:
+        """Whether freeze() has published an immutable plan table."""
+        return self._frozen_plans is not None
+    
+    def validate(self, descriptors: list[ComponentDescriptor] | None = None) -> list[str]:
+        """Check a set of components for problems that would fail at resolution.
+        
+        Walks the dependency graph reachable from ``descriptors`` (defaults to
+        all active registrations), including auto-created dependencies, and
+        reports required dependencies that cannot be resolved, circular
+        dependencies and singletons that depend on scoped components.
+        
+        Args:
+            descriptors: Components to start the walk from
+        
+        Returns:
+            Human-readable problem descriptions; empty if the graph is valid
+        """
+        if descriptors is None:
+            descriptors = self.registry.list_all()
+        
+        problems: list[str] = []
+        plans: dict[str, ResolutionPlan] = {}
+        graph: dict[str, list[str]] = {}
+        pending = [self.compile_plan(descriptor) for descriptor in descriptors]
+        
+        while pending:
+            plan = pending.pop()
+            key = plan.descriptor.key
+            if key in graph:
+                continue
+            plans[key] = plan
+            edges = graph[key] = []
+            
+            for param_name in _unsatisfied_parameters(plan):
+                problems.append(
+                    f"'{_display_key(plan)}' requires parameter '{param_name}', "
+                    f"which has no default and cannot be injected"
+                )
+            
+            for param_name, dep_key, optional in plan.dependencies:
+                try:
+                    dep_plan = self.get_plan(dep_key, allow_auto_create=not optional)
+                except (ResolutionError, TypeError):
+                    if not optional:
+                        problems.append(
+                            f"'{_display_key(plan)}' requires parameter '{param_name}' of "
+                            f"type '{getattr(dep_key, '__name__', dep_key)}', "
+                            f"which is not registered and cannot be auto-created"
+                        )
+                    continue
+                
+                edges.append(dep_plan.descriptor.key)
+                if dep_plan.descriptor.key not in graph:
+                    pending.append(dep_plan)
+                
+                if plan.scope == Scope.SINGLETON and dep_plan.scope == Scope.SCOPED:
+                    problems.append(
+                        f"Invalid scope dependency: singleton '{_display_key(plan)}' cannot "
+                        f"depend on scoped '{_display_key(dep_plan)}' "
+                        f"(scope '{dep_plan.scope_name}')"
+                    )
+        
+        for cycle in _find_cycles(graph):
+            path = " -> ".join(_display_key(plans[key]) for key in [*cycle, cycle[0]])
+            problems.append(f"Circular dependency: {path}")
+        
+        return problems
+    
+    def freeze(self) -> None:
+        """Validate the graph, freeze the registry and publish precompiled plans.
+        
+        Every active component is compiled and bound once, then stored in an
+        immutable table keyed by its string key and by its type (both with
+        the component name), together with every dependency key seen while
+        binding. Lookups that hit the table skip the registry version and
+        condition checks; misses (e.g. resolving an unrelated auto-creatable
+        class) fall back to the regular plan cache.
+        
+        Raises:
+            ConfigurationError: If validation finds any problem; the registry
+                is left unfrozen in that case
+        """
+        if self._frozen_plans is not None:
+            return
+        
+        problems = self.validate()
+        if problems:
+            details = "\n".join(f"  - {problem}" for problem in problems)
+            raise ConfigurationError(f"Cannot freeze container:\n{details}")
+        
+        self.registry.freeze()
+        self.invalidate_plans()
+        
+        table: dict[tuple[Any, str | None], ResolutionPlan] = {}
+        for descriptor in self.registry.values():
+            plan = self.compile_plan(descriptor)
+            base_key = descriptor.key
+            if descriptor.name and base_key.endswith(f":{descriptor.name}"):
+                base_key = base_key[: -len(descriptor.name) - 1]
+            table[(descriptor.key, None)] = plan
+            table[(base_key, descriptor.name)] = plan
+            component_type = descriptor.component_type
+            if isinstance(component_type, type) and component_type.__name__ == base_key:
+                table[(component_type, descriptor.name)] = plan
+        self._plans.update(table)
+        
+        # Bind every plan (and, transitively, every dependency plan) up front so
+        # the first resolution does no lookups either
+        while True:
+            unbound = [
+                plan
+                for plan in self._plans.values()
+                if plan.bound_dependencies is None and callable(plan.provider)
+            ]
+            if not unbound:
+                break
+            for plan in unbound:
+                self._bind_dependencies(plan)
+        
+        for (key, name), plan in self._plans.items():
+            table.setdefault((key, name), plan)
+        self._frozen_plans = MappingProxyType(table)
+    
+    def get_injection_plan(self, func: Callable) -> InjectionPlan:
+        """Get the compiled injection plan for calling a function.
+        
+        Plans are held in a bounded, weak-keyed LRU cache, so they live at
+        most as long as the function itself, and are recompiled when the
+        registry changes.
+        
+        Args:
+            func: The callable to inject into
+        
+        Returns:
+            The cached or freshly compiled InjectionPlan
+        """
+        try:
+            plan = self._injection_plans.get(func)
+        except TypeError:
+            # Unhashable callable - compile uncached
+            return self.compile_injection_plan(func)
+        
+        if plan is None or plan.version != self.registry.version:
+            plan = self.compile_injection_plan(func)
+            self._injection_plans[func] = plan
+        return plan
+    
+    def compile_injection_plan(self, func: Callable) -> InjectionPlan:
+        """Analyze a callable's signature into an InjectionPlan."""
+        analysis = self.type_resolver.analyze_callable(func)
+        parameters = tuple(inspect.signature(func).parameters)
+        
+        injections = []
+        for position, param_name in enumerate(parameters):
+            inject_result = analysis.get(param_name)
+            if inject_result is None:
+                continue
+            if inject_result.decision == InjectDecision.YES:
+                injections.append((position, param_name, inject_result.type_hint, False))
+            elif inject_result.decision == InjectDecision.OPTIONAL:
+                injections.append((position, param_name, inject_result.inner_type, True))
+        
+        return InjectionPlan(func, parameters, tuple(injections), self.registry.version)
+    
+    def _compile_uncached(
+        self, key: str | type, name: str | None, allow_auto_create: bool
+    ) -> ResolutionPlan:
+        """Look up the descriptor for a key and compile it into a plan.
+        
+        A descriptor reached through several keys (its string key, its class,
+        a name) is compiled once: the plan is also cached under the
+        descriptor's normalized key and reused for the others.
+        """
+        context = ResolutionContext(key=key, name=name)
+        descriptor = self._get_descriptor(context, allow_auto_create=allow_auto_create)
+        if descriptor.metadata.get("auto_created", False):
+            return self.compile_plan(descriptor, key=key, auto_created=True)
+        
+        plan = self._plans.get((descriptor.key, None))
+        if plan is None or plan.descriptor is not descriptor:
+            plan = self.compile_plan(descriptor, key=key)
+            self._plans[(descriptor.key, None)] = plan
+        return plan
+    
+    def compile_plan(
+        self, descriptor: ComponentDescriptor, key: Any = None, auto_created: bool = False
+    ) -> ResolutionPlan:
+        """Compile a descriptor into a ResolutionPlan.
+        
+        Args:
+            descriptor: The descriptor to compile
+            key: The lookup key the plan is compiled for (defaults to descriptor key)
+            auto_created: Whether the descriptor was synthesized for auto-creation
+        
+        Returns:
+            A plan whose ``resolve`` closure implements the descriptor's scope
+        """
+        if isinstance(descriptor.provider, ImportRef):
+            # Statically discovered component - import it now
+            try:
+                descriptor = self.registry.materialize(descriptor)
+            except (ImportError, AttributeError) as e:
+                raise ResolutionError(
+                    f"Cannot import component '{descriptor.key}' "
+                    f"from {descriptor.provider!r}: {e}"
+                ) from e
+        
+        provider = descriptor.provider
+        dependencies: list[tuple[str, Any, bool]] = []
+        param_names: frozenset[str] = frozenset()
+        precompiled = self._precompiled.get(descriptor.key)
+        
+        if precompiled is not None and precompiled[0] is provider:
+            # Analysis was done ahead of time
+            _, compiled_dependencies, param_names = precompiled
+            dependencies.extend(compiled_dependencies)
+        elif callable(provider):
+            target = provider.__init__ if isinstance(provider, type) else provider
+            metrics = _current_metrics.get()
+            if metrics is None:
+                analysis = self.type_resolver.analyze_callable(target)
+            else:
+                start = time.perf_counter()
+                analysis = self.type_resolver.analyze_callable(target)
+                metrics.record_type_analysis(time.perf_counter() - start)
+            param_names = frozenset(analysis)
+            for param_name, inject_result in analysis.items():
+                if inject_result.decision == InjectDecision.YES:
+                    dependencies.append((param_name, inject_result.type_hint, False))
+                elif inject_result.decision == InjectDecision.OPTIONAL:
+                    dependencies.append((param_name, inject_result.inner_type, True))
+        
+        plan = ResolutionPlan(
+            key if key is not None else descriptor.key,
+            descriptor,
+            tuple(dependencies),
+            param_names,
+            auto_created=auto_created,
+        )
+        pooled = descriptor.metadata.get("pooled")
+        if pooled and plan.scope == Scope.TRANSIENT and callable(provider):
+            plan.pool = self._get_pool(descriptor)
+        plan.resolve = self._build_scope_strategy(plan, self._build_creator(plan))
+        return plan
+    
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Statistics of every pool created so far, keyed by component key."""
+        return {key: pool.stats() for key, (_, pool) in self._pools.items()}
+    
+    def _get_pool(self, descriptor: ComponentDescriptor) -> ObjectPool:
+        """Get the pool for a pooled descriptor, keeping it across recompiles."""
+        try:
+            size = pool_size(descriptor.metadata["pooled"])
+        except ValueError as e:
+            raise ConfigurationError(f"Component '{descriptor.key}': {e}") from e
+        
+        entry = self._pools.get(descriptor.key)
+        if entry is None or entry[0] is not descriptor.provider or entry[1].maxsize != size:
+            # New or re-registered: never hand out instances of the old provider
+            entry = self._pools[descriptor.key] = (
+                descriptor.provider,
+                ObjectPool(descriptor.key, size),
+            )
+        return entry[1]
+    
+    def _bind_dependencies(self, plan: ResolutionPlan) -> list[tuple[str, Callable[[Any], Any]]]:
+        """Bind each dependency of a plan to its own plan's resolve callable.
+        
+        Raises:
+            CircularDependencyError: If the plan's dependency graph has a cycle
+        """
+        if not plan.cycle_checked:
+            self._check_cycles(plan)
+        bound = []
+        for param_name, dep_key, optional in plan.dependencies:
+            if not optional:
+                dep_plan = self.get_plan(dep_key)
+                bound.append((param_name, self._dependency_getter(dep_plan, dep_key)))
+                continue
+            
+            # Optional dependencies are never auto-created and fall back to None
+            try:
+                dep_plan = self.get_plan(dep_key, allow_auto_create=False)
+            except ResolutionError:
+                bound.append((param_name, _resolve_none))
+                continue
+            dep_resolve = self._dependency_getter(dep_plan, dep_key, allow_auto_create=False)
+            
+            def resolve_optional(scope_context, _resolve=dep_resolve):
+                try:
+                    return _resolve(scope_context)
+                except ResolutionError:
+                    return None
+            
+            bound.append((param_name, resolve_optional))
+        
+        plan.bound_dependencies = bound
+        return bound
+    
+    def _dependency_getter(
+        self, dep_plan: ResolutionPlan, dep_key: Any, allow_auto_create: bool = True
+    ) -> Callable[[Any], Any]:
+        """Getter for a bound dependency.
+        
+        Usually the dependency plan's own resolve callable. A dependency with a
+        dynamic condition is looked up on every call instead, so its condition
+        is re-checked just as for a top-level resolution.
+        """
+        if not dep_plan.descriptor.dynamic_condition or self.registry.frozen:
+            return dep_plan.resolve
+        get_plan = self.get_plan
+        
+        def resolve_checked(scope_context):
+            return get_plan(dep_key, allow_auto_create=allow_auto_create).resolve(scope_context)
+        
+        return resolve_checked
+    
+    def _check_cycles(self, plan: ResolutionPlan) -> None:
+        """Verify once that a plan's static dependency graph is acyclic.
+        
+        Walks required dependencies depth-first (iteratively, chains can be
+        deep) and marks every plan whose subgraph is proven acyclic, so a
+        plan shared by many dependents is walked once. Optional dependencies
+        are skipped: they resolve to None when they would close a cycle,
+        which the runtime tracking of their dependent handles. Dependencies
+        that cannot be looked up fail later, when they are bound.
+        
+        Raises:
+            CircularDependencyError: With the full cycle path
+        """
+        path = [plan]
+        on_path = {plan.descriptor.key: 0}
+        stack = [(plan, self._required_plans(plan))]
+        while stack:
+            current, deps = stack[-1]
+            for dep in deps:
+                if dep.cycle_checked:
+                    continue
+                index = on_path.get(dep.descriptor.key)
+                if index is not None:
+                    raise CircularDependencyError(
+                        [entry.descriptor.component_type for entry in path[index:]]
+                    )
+                on_path[dep.descriptor.key] = len(path)
+                path.append(dep)
+                stack.append((dep, self._required_plans(dep)))
+                break
+            else:
+                stack.pop()
+                path.pop()
+                del on_path[current.descriptor.key]
+                current.cycle_checked = True
+    
+    def _required_plans(self, plan: ResolutionPlan) -> Iterator[ResolutionPlan]:
+        """Plans of a plan's required dependencies that can be looked up."""
+        for _, dep_key, optional in plan.dependencies:
+            if optional:
+                continue
+            try:
+                yield self.get_plan(dep_key)
+            except (ResolutionError, TypeError):
+                continue
+    
+    def _build_creator(self, plan: ResolutionPlan) -> Callable[[Any, Any], Any]:
+        """Build the instance-creation closure for a plan (sync)."""
+        provider = plan.provider
+        
+        if not callable(provider):
+            # Direct instance
+            return lambda scope_context, overrides=None: provider
+        
+        bind = self._bind_dependencies
+        param_names = plan.param_names
+        key = plan.descriptor.key
+        
+        def create(scope_context, overrides=None):
+            bound = plan.bound_dependencies
+            if bound is None:
+                bound = bind(plan)
+            if overrides:
+                kwargs = {
+                    param_name: overrides[param_name]
+                    for param_name in param_names
+                    if param_name in overrides
+                }
+                for param_name, getter in bound:
+                    if param_name not in kwargs:
+                        kwargs[param_name] = getter(scope_context)
+            else:
+                kwargs = {param_name: getter(scope_context) for param_name, getter in bound}
+            
+            metrics = _current_metrics.get()
+            if metrics is None:
+                return provider(**kwargs)
+            # Time only the provider itself; dependencies record their own samples
+            start = time.perf_counter()
+            try:
+                return provider(**kwargs)
+            finally:
+                metrics.record_factory(key, time.perf_counter() - start)
+        
+        return create
+    
+    def _build_scope_strategy(
+        self, plan: ResolutionPlan, create: Callable[[Any, Any], Any]
+    ) -> Callable[..., Any]:
+        """Wrap a creation closure with the plan's scope and cycle handling."""
+        key = plan.descriptor.key
+        scope_resolver = self.scope_resolver
+        singleton_cache = scope_resolver._singleton_cache
+        
+        def run(scope_context, overrides=None):
+            profiler = _current_profiler.get()
+            if profiler is None:
+                return create(scope_context, overrides)
+            with profile_span(key):
+                return create(scope_context, overrides)
+        
+        if plan.track_cycles:
+            
+            def tracked(scope_context, overrides=None):
+                token = _enter_tracked(plan)
+                try:
+                    return run(scope_context, overrides)
+                finally:
+                    _resolving.reset(token)
+        
+        else:
+            # Cycles were ruled out statically when the plan was first bound
+            tracked = run
+        
+        if plan.scope == Scope.SINGLETON:
+            
+            def resolve_singleton(scope_context=None, overrides=None):
+                if key in singleton_cache:
+                    return singleton_cache[key]
+                # Pooled dependencies live as long as the singleton
+                return scope_resolver.resolve_singleton(
+                    key, lambda: _create_owned(tracked, scope_context, overrides)
+                )
+            
+            return resolve_singleton
+        
+        if plan.scope == Scope.SCOPED:
+            scope_name = plan.scope_name
+            
+            def resolve_scoped(scope_context=None, overrides=None):
+                return scope_resolver.resolve_scoped(
+                    key,
+                    scope_name,
+                    lambda: _create_owned(tracked, scope_context, overrides),
+                    scope_context,
+                )
+            
+            return resolve_scoped
+        
+        if plan.pool is not None:
+            pool = plan.pool
+            
+            def resolve_pooled(scope_context=None, overrides=None):
+                if overrides:
+                    # Customized instances are never shared through the pool
+                    return tracked(scope_context, overrides)
+                checkouts = _pool_checkouts(scope_context)
+                instance = pool.acquire(
+                    lambda: _create_owned(tracked, scope_context), checkouts is not None
+                )
+                if checkouts is not None:
+                    checkouts.append((pool, instance))
+                return instance
+            
+            return resolve_pooled
+        
+        return tracked
     
     def _get_descriptor(self, context: ResolutionContext, allow_auto_create: bool = True) -> ComponentDescriptor:
         """Get component descriptor, with auto-creation fallback."""
         try:
             return self.registry.get(context.key, context.name)
         except KeyError:
+            implementations = []
+            if context.name is None and isinstance(context.key, type):
+                # An interface registered only through its implementations
+                implementations = self.registry.get_all(context.key)
+                if len(implementations) == 1:
+                    return implementations[0]
+            
             # Try auto-creation for unregistered types only if allowed
             if (allow_auto_create and 
                 isinstance(context.key, type) and 
@@ -368,180 +1548,246 @@ class UnifiedResolver:
                     key=str(context.key),
                     component_type=context.key,
                     provider=context.key,
-                    scope=Scope.TRANSIENT
+                    scope=Scope.TRANSIENT,
+                    metadata={"auto_created": True},
                 )
                 return descriptor
+            if implementations:
+                keys = ", ".join(descriptor.key for descriptor in implementations)
+                raise ResolutionError(
+                    f"Component '{context.key}' is ambiguous: implemented by {keys}"
+                ) from None
             raise ResolutionError(f"Component '{context.key}' not registered")
     
-    def _check_circular_dependency(self, context: ResolutionContext, descriptor: ComponentDescriptor) -> None:
-        """Check for circular dependencies."""
-        resolving = self.dependency_resolver.get_resolving_stack()
-        if descriptor.key in resolving:
-            raise CircularDependencyError(f"Circular dependency detected: {list(resolving)} -> {descriptor.key}")
-        resolving.add(descriptor.key)
-    
-    def _clear_resolving(self, context: ResolutionContext, descriptor: ComponentDescriptor) -> None:
-        """Clear from resolving stack."""
-        resolving = self.dependency_resolver.get_resolving_stack()
-        resolving.discard(descriptor.key)
-    
-    def _resolve_by_scope_sync(self, descriptor: ComponentDescriptor, context: ResolutionContext) -> Any:
-        """Resolve based on component scope (sync)."""
-        if descriptor.scope == Scope.SINGLETON:
-            return self.scope_resolver.resolve_singleton(
-                descriptor.key,
-                lambda: self._create_instance_sync(descriptor, context)
-            )
-        elif descriptor.scope == Scope.SCOPED:
-            scope_name = descriptor.metadata.get("scope_name", "default")
-            return self.scope_resolver.resolve_scoped(
-                descriptor.key,
-                scope_name,
-                lambda: self._create_instance_sync(descriptor, context),
-                context.scope_context
-            )
-        else:  # TRANSIENT
-            return self._create_instance_sync(descriptor, context)
-    
-    async def _resolve_by_scope_async(self, descriptor: ComponentDescriptor, context: ResolutionContext) -> Any:
-        """Resolve based on component scope (async)."""
-        if descriptor.scope == Scope.SINGLETON:
-            # For async factories, we need special handling
-            if (callable(descriptor.provider) and 
-                asyncio.iscoroutinefunction(descriptor.provider)):
-                # Async singleton factory - needs async resolution
-                async def async_factory():
-                    return await self._create_instance_async(descriptor, context)
-                
-                # Check if already cached
-                if descriptor.key in self.scope_resolver._singleton_cache:
-                    return self.scope_resolver._singleton_cache[descriptor.key]
-                
-                # Create with async factory
-                with self.scope_resolver._singleton_lock:
-                    if descriptor.key in self.scope_resolver._singleton_cache:
-                        return self.scope_resolver._singleton_cache[descriptor.key]
-                    
-                    instance = await async_factory()
-                    self.scope_resolver._singleton_cache[descriptor.key] = instance
-                    return instance
-            else:
-                # Sync singleton - use executor for thread safety
+    async def _resolve_plan_async(
+        self, plan: ResolutionPlan, scope_context: Any, overrides: dict[str, Any] | None = None
+    ) -> Any:
+        """Resolve a plan based on its scope (async)."""
+        if plan.scope == Scope.SINGLETON:
+            key = plan.descriptor.key
+            scope_resolver = self.scope_resolver
+            if key in scope_resolver._singleton_cache:
+                return scope_resolver._singleton_cache[key]
+            
+            pending = scope_resolver._singleton_futures.get(key)
+            if pending is not None and pending[1] is asyncio.current_task():
+                # This task is already creating the singleton further up the chain
+                raise CircularDependencyError([plan.descriptor.component_type])
+            
+            if plan.is_async or self._awaits_dependencies(plan):
+                return await scope_resolver.resolve_singleton_async(
+                    key,
+                    lambda: _create_owned_async(
+                        lambda: self._create_plan_async(plan, scope_context, overrides)
+                    ),
+                )
+            if plan.offload:
+                # Explicitly requested: construct in the default executor
                 loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(
-                    None,
-                    self.scope_resolver.resolve_singleton,
-                    descriptor.key,
-                    lambda: self._create_instance_sync(descriptor, context)
+                return await scope_resolver.resolve_singleton_async(
+                    key,
+                    lambda: loop.run_in_executor(None, plan.resolve, scope_context, overrides),
                 )
-        elif descriptor.scope == Scope.SCOPED:
-            scope_name = descriptor.metadata.get("scope_name", "default")
+            # Sync singleton - construct inline, no await happens under the lock
+            return plan.resolve(scope_context, overrides)
+        elif plan.scope == Scope.SCOPED:
             # For now, use sync version
             # TODO: Implement async scope resolution
-            return self.scope_resolver.resolve_scoped(
-                descriptor.key,
-                scope_name,
-                lambda: self._create_instance_sync(descriptor, context),
-                context.scope_context
-            )
+            return plan.resolve(scope_context, overrides)
         else:  # TRANSIENT
-            return await self._create_instance_async(descriptor, context)
+            if (
+                plan.pool is not None
+                and not overrides
+                and (plan.is_async or self._awaits_dependencies(plan))
+            ):
+                return await self._acquire_pooled_async(plan, scope_context)
+            return await self._create_plan_async(plan, scope_context, overrides)
     
-    def _create_instance_sync(self, descriptor: ComponentDescriptor, context: ResolutionContext) -> Any:
-        """Create instance with dependency injection (sync)."""
-        provider = descriptor.provider
+    async def _acquire_pooled_async(self, plan: ResolutionPlan, scope_context: Any) -> Any:
+        """Check out an instance of a pooled async factory."""
+        checkouts = _pool_checkouts(scope_context)
+        instance = await plan.pool.acquire_async(
+            lambda: _create_owned_async(lambda: self._create_plan_async(plan, scope_context)),
+            checkouts is not None,
+        )
+        if checkouts is not None:
+            checkouts.append((plan.pool, instance))
+        return instance
+    
+    async def _create_plan_async(
+        self, plan: ResolutionPlan, scope_context: Any, overrides: dict[str, Any] | None = None
+    ) -> Any:
+        """Create an instance for a plan, awaiting async factories and their dependencies."""
+        if not plan.is_async and not self._awaits_dependencies(plan):
+            # Nothing to await: use the compiled sync path
+            return plan.resolve(scope_context, overrides)
         
-        if not callable(provider) and not isinstance(provider, type):
-            # Direct instance
-            return provider
+        key = plan.descriptor.key
+        if not plan.cycle_checked:
+            self._check_cycles(plan)
+        token = _enter_tracked(plan) if plan.track_cycles else None
+        span = None
+        profiler = _current_profiler.get()
+        if profiler is not None:
+            span = profiler.begin(key)
+        try:
+            kwargs = {}
+            for param_name, dep_key, optional in plan.dependencies:
+                if overrides and param_name in overrides:
+                    kwargs[param_name] = overrides[param_name]
+                elif optional:
+                    try:
+                        dep_plan = self.get_plan(dep_key, allow_auto_create=False)
+                        kwargs[param_name] = await self._resolve_plan_async(dep_plan, scope_context)
+                    except ResolutionError:
+                        kwargs[param_name] = None
+                else:
+                    kwargs[param_name] = await self._resolve_plan_async(
+                        self.get_plan(dep_key), scope_context
+                    )
+            if overrides:
+                for param_name in plan.param_names:
+                    if param_name in overrides and param_name not in kwargs:
+                        kwargs[param_name] = overrides[param_name]
+            
+            metrics = _current_metrics.get()
+            start = time.perf_counter() if metrics is not None else 0.0
+            try:
+                instance = plan.provider(**kwargs)
+                if plan.is_async:
+                    instance = await instance
+                return instance
+            finally:
+                if metrics is not None:
+                    metrics.record_factory(key, time.perf_counter() - start)
+        finally:
+            if span is not None:
+                profiler.end(span)
+            if token is not None:
+                _resolving.reset(token)
+
+
+class ChildResolver(UnifiedResolver):
+    """Resolver for a child container that overlays a parent resolver.
+    
+    Nothing is copied from the parent when a child is created. Lookups for
+    keys registered in the child compile local plans; every other key is
+    served by the parent's plan, so its singletons, compiled plans and
+    (while the child only overrides keys the parent already knows) type
+    analysis are shared.
+    
+    A parent plan is only rebound in the child when some dependency it
+    resolves per call - directly or through other transient or scoped
+    dependencies - is overridden in the child. Singletons always belong to
+    the container that registered them: a parent singleton is created once
+    with the parent's dependencies and shared by all children.
+    """
+    
+    def __init__(self, parent: UnifiedResolver, registry: ComponentRegistry):
+        self.parent = parent
+        self.registry = registry
+        self.dependency_resolver = parent.dependency_resolver
+        self.scope_resolver = ScopeResolver()
+        self.async_resolver = parent.async_resolver
+        self._plans: dict[tuple[Any, str | None], ResolutionPlan] = {}
+        self._plans_version = registry.version
+        self._injection_plans = LRUCache("resolver.injection_plans", 256, weak_keys=True)
+        self._frozen_plans: Mapping[tuple[Any, str | None], ResolutionPlan] | None = None
+        self._precompiled = parent._precompiled
+        self._pools: dict[str, tuple[Any, ObjectPool]] = {}
+        # Parent descriptor key -> whether its dependency chain reaches an override
+        self._shadowed: dict[str, bool] = {}
+        self._type_resolver: TypeResolver | None = None
+        self._type_resolver_version = -1
+    
+    @property
+    def type_resolver(self) -> TypeResolver:
+        """Type analysis for this child, shared with the parent when possible.
         
-        # Get dependency map - analyze the provider (class or function)
-        if isinstance(provider, type):
-            # Class constructor
-            dep_map = self.dependency_resolver.resolve_dependencies(provider, context.overrides)
-        elif callable(provider):
-            # Factory function - analyze the function directly
-            analysis = self.type_resolver.analyze_callable(provider)
-            dep_map = {}
-            for param_name, inject_result in analysis.items():
-                if param_name in context.overrides:
-                    dep_map[param_name] = context.overrides[param_name]
-                elif inject_result.decision == InjectDecision.YES:
-                    dep_map[param_name] = inject_result.type_hint
-                elif inject_result.decision == InjectDecision.OPTIONAL:
-                    dep_map[param_name] = (inject_result.inner_type, True)
-        else:
-            dep_map = {}
+        Injection decisions only depend on which keys are registered, so as
+        long as every local registration overrides a key the parent also has,
+        the parent's analyzer (and its warm caches) gives the same answers.
+        """
+        version = self.registry.version
+        if self._type_resolver_version != version:
+            parent_registry = self.registry.parent
+            if all(parent_registry.has(key) for key in self.registry):
+                self._type_resolver = self.parent.type_resolver
+            elif self._type_resolver is None or self._type_resolver is self.parent.type_resolver:
+                type_resolver = TypeResolver(self.registry)
+                type_resolver._generic_resolver = self.parent.type_resolver._generic_resolver
+                self._type_resolver = type_resolver
+            self._type_resolver_version = version
+        return self._type_resolver
+    
+    def invalidate_plans(self) -> None:
+        """Drop local plans and the cached override analysis."""
+        super().invalidate_plans()
+        self._shadowed.clear()
+    
+    def _compile_uncached(
+        self, key: str | type, name: str | None, allow_auto_create: bool
+    ) -> ResolutionPlan:
+        """Compile local registrations; fall through to the parent otherwise."""
+        if self.registry.has_local(key, name):
+            return super()._compile_uncached(key, name, allow_auto_create)
         
-        # Resolve each dependency
-        resolved = {}
-        for param_name, dep_spec in dep_map.items():
-            if isinstance(dep_spec, tuple):  # Optional dependency
-                dep_type, is_optional = dep_spec
-                try:
-                    # For optional dependencies, don't allow auto-creation
-                    opt_context = ResolutionContext(
-                        key=dep_type,
-                        overrides=context.overrides,
-                        scope_context=context.scope_context,
-                        is_async=context.is_async
-                    )
-                    opt_descriptor = self._get_descriptor(opt_context, allow_auto_create=False)
-                    resolved[param_name] = self._resolve_by_scope_sync(opt_descriptor, opt_context)
-                except ResolutionError:
-                    if is_optional:
-                        resolved[param_name] = None
-                    else:
-                        raise
-            else:
-                # Regular dependency or override
-                if param_name in context.overrides:
-                    resolved[param_name] = context.overrides[param_name]
-                else:
-                    resolved[param_name] = self._resolve_sync(dep_spec)
+        plan = self.parent.get_plan(key, name, allow_auto_create)
+        if not self._is_shadowed(plan):
+            return plan
         
-        # Create instance
-        return self.dependency_resolver.create_instance(provider, resolved)
+        # Copy-on-write: reuse the parent's analysis, bind dependencies here
+        local = ResolutionPlan(
+            key, plan.descriptor, plan.dependencies, plan.param_names, plan.auto_created
+        )
+        local.resolve = self._build_scope_strategy(local, self._build_creator(local))
+        return local
     
-    async def _create_instance_async(self, descriptor: ComponentDescriptor, context: ResolutionContext) -> Any:
-        """Create instance with dependency injection (async)."""
-        provider = descriptor.provider
+    def _is_shadowed(self, plan: ResolutionPlan) -> bool:
+        """Check whether a parent plan resolves any key overridden in this child."""
+        if plan.scope == Scope.SINGLETON or not len(self.registry):
+            return False
         
-        if not callable(provider) and not isinstance(provider, type):
-            # Direct instance
-            return provider
+        key = plan.descriptor.key
+        shadowed = self._shadowed.get(key)
+        if shadowed is not None:
+            return shadowed
         
-        # Handle async factories
-        if callable(provider) and asyncio.iscoroutinefunction(provider):
-            # Async factory function
-            sig = inspect.signature(provider)
-            kwargs = {}
-            
-            # Resolve dependencies for async factory
-            for param_name, param in sig.parameters.items():
-                if param_name in context.overrides:
-                    kwargs[param_name] = context.overrides[param_name]
-                elif param.annotation != inspect.Parameter.empty:
-                    analysis = self.type_resolver.analyze_type(param.annotation)
-                    if analysis.decision == InjectDecision.YES:
-                        kwargs[param_name] = await self._resolve_async(param.annotation)
-                    elif analysis.decision == InjectDecision.OPTIONAL:
-                        try:
-                            opt_context = ResolutionContext(
-                                key=analysis.inner_type,
-                                overrides=context.overrides,
-                                scope_context=context.scope_context,
-                                is_async=True
-                            )
-                            opt_descriptor = self._get_descriptor(opt_context, allow_auto_create=False)
-                            kwargs[param_name] = await self._resolve_by_scope_async(opt_descriptor, opt_context)
-                        except ResolutionError:
-                            kwargs[param_name] = None
-            
-            return await provider(**kwargs)
-        else:
-            # For sync providers, use sync version
-            return self._create_instance_sync(descriptor, context)
+        # Provisional answer breaks cycles; they fail at resolution anyway
+        self._shadowed[key] = False
+        shadowed = False
+        for _param_name, dep_key, optional in plan.dependencies:
+            try:
+                if self.registry.has_local(dep_key):
+                    shadowed = True
+                    break
+                dep_plan = self.parent.get_plan(dep_key, allow_auto_create=not optional)
+            except (ResolutionError, TypeError):
+                continue
+            if self._is_shadowed(dep_plan):
+                shadowed = True
+                break
+        
+        self._shadowed[key] = shadowed
+        return shadowed
+    
+    def _owns(self, plan: ResolutionPlan) -> bool:
+        """Whether a plan's descriptor is registered in this child."""
+        return self.registry._descriptors.get(plan.descriptor.key) is plan.descriptor
+    
+    def _is_cached(self, plan: ResolutionPlan, scope_context: Any) -> bool:
+        """Check the cache of whichever resolver owns a singleton."""
+        if plan.scope == Scope.SINGLETON and not self._owns(plan):
+            return self.parent._is_cached(plan, scope_context)
+        return super()._is_cached(plan, scope_context)
+    
+    async def _resolve_plan_async(
+        self, plan: ResolutionPlan, scope_context: Any, overrides: dict[str, Any] | None = None
+    ) -> Any:
+        """Resolve a plan, leaving parent singletons to the parent."""
+        if plan.scope == Scope.SINGLETON and not self._owns(plan):
+            return await self.parent._resolve_plan_async(plan, scope_context, overrides)
+        return await super()._resolve_plan_async(plan, scope_context, overrides)
 
 
 # Public API functions
@@ -0,0 +1,330 @@
+"""Scheduler for periodic background tasks.
+
+Whiskey runs every periodic ``@app.task`` from one TaskScheduler instead of a
+sleeping loop per task. Due times are kept in a heap, and a single event loop
+timer is armed for the earliest one; when it fires, every task that is due
+is started and the timer is re-armed. Idle tasks cost nothing but a heap
+entry.
+
+``Whiskey.task`` schedules each function through the container, so its
+parameters are injected on every run.
+
+Scheduling modes:
+    - ``"fixed_rate"`` (default): runs are due at ``start + n * interval``.
+      The schedule does not drift with run time or timer latency.
+    - ``"fixed_delay"``: the next run is due ``interval`` seconds after the
+      previous one finished, so runs never overlap.
+
+Overrun policy (fixed rate only), for a run that comes due while the
+previous one is still running:
+    - ``"skip"`` (default): drop the run and count it as skipped
+    - ``"queue"``: start it as soon as the running one finishes; at most
+      ``max_pending`` runs wait (default 1), further ones are skipped
+
+``jitter`` delays each run by a random amount between 0 and ``jitter``
+seconds without moving the schedule itself, spreading tasks that share an
+interval. Lateness (how long after its due time a run started) and duration
+are recorded per task and reported by ``stats()``.
+
+Classes:
+    ScheduledTask: One periodic task and its metrics
+    TaskScheduler: Heap-based scheduler of periodic tasks
+
+Example:
+    >>> @app.task(interval=60, jitter=5)
+    ... async def refresh_cache(cache: Cache):
+    ...     await cache.refresh()
+    >>>
+    >>> @app.task(interval=1, mode="fixed_delay")
+    ... async def poll_queue(queue: Queue):
+    ...     await queue.poll()
+    >>>
+    >>> app.task_stats()["refresh_cache"]
+    {'runs': 12, 'failures': 0, 'skipped': 0, 'max_lateness': 0.0021, ...}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import inspect
+import itertools
+import math
+import random
+from collections import deque
+from collections.abc import Awaitable
+from typing import Any, Callable
+
+SCHEDULING_MODES = ("fixed_rate", "fixed_delay")
+OVERRUN_POLICIES = ("skip", "queue")
+
+
+class ScheduledTask:
+    """One periodic task and its metrics.
+
+    Args:
+        func: Function to run; may be sync or async
+        interval: Seconds between runs
+        name: Name the task reports its statistics under
+        mode: "fixed_rate" or "fixed_delay"
+        overrun: "skip" or "queue"
+        jitter: Maximum random delay added to each run, in seconds
+        max_pending: Most overrun runs kept waiting under the "queue" policy
+
+    Raises:
+        ValueError: If an option is invalid
+    """
+
+    __slots__ = (
+        "failures",
+        "func",
+        "interval",
+        "jitter",
+        "last_duration",
+        "last_lateness",
+        "max_duration",
+        "max_lateness",
+        "max_pending",
+        "mode",
+        "name",
+        "overrun",
+        "pending",
+        "runs",
+        "skipped",
+        "task",
+        "total_duration",
+        "total_lateness",
+    )
+
+    def __init__(
+        self,
+        func: Callable,
+        interval: float,
+        *,
+        name: str | None = None,
+        mode: str = "fixed_rate",
+        overrun: str = "skip",
+        jitter: float = 0.0,
+        max_pending: int = 1,
+    ):
+        if not interval or interval <= 0:
+            raise ValueError(f"Task interval must be a positive number, got {interval!r}")
+        if mode not in SCHEDULING_MODES:
+            raise ValueError(
+                f"Unknown scheduling mode {mode!r}; expected one of {SCHEDULING_MODES}"
+            )
+        if overrun not in OVERRUN_POLICIES:
+            raise ValueError(
+                f"Unknown overrun policy {overrun!r}; expected one of {OVERRUN_POLICIES}"
+            )
+        if jitter < 0:
+            raise ValueError(f"Task jitter must not be negative, got {jitter!r}")
+        if max_pending < 1:
+            raise ValueError(f"Task max_pending must be at least 1, got {max_pending!r}")
+        self.func = func
+        self.interval = interval
+        self.name = name or getattr(func, "__name__", repr(func))
+        self.mode = mode
+        self.overrun = overrun
+        self.jitter = jitter
+        self.max_pending = max_pending
+        self.task: asyncio.Task | None = None
+        # Due times of overrun runs waiting for the running one (queue policy)
+        self.pending: deque[float] = deque()
+        self.reset_metrics()
+
+    def reset_metrics(self) -> None:
+        """Zero the run counters and timings."""
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether a run of this task is in progress."""
+        return self.task is not None and not self.task.done()
+
+    def stats(self) -> dict[str, Any]:
+        """Run counters and lateness/duration timings in seconds."""
+        runs = self.runs or 1
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "pending": len(self.pending),
+            "last_lateness": self.last_lateness,
+            "max_lateness": self.max_lateness,
+            "avg_lateness": self.total_lateness / runs,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+            "avg_duration": self.total_duration / runs,
+        }
+
+    def __repr__(self) -> str:
+        return f"ScheduledTask({self.name!r}, interval={self.interval}, mode={self.mode!r})"
+
+
+class TaskScheduler:
+    """Heap-based scheduler of periodic tasks.
+
+    Tasks can be added before or after start(); a task added while running
+    runs for the first time immediately (plus jitter).
+
+    Args:
+        on_error: Awaited with exceptions raised by task runs
+    """
+
+    def __init__(self, *, on_error: Callable[[Exception], Awaitable[Any]] | None = None):
+        self.on_error = on_error
+        self.tasks: list[ScheduledTask] = []
+        # (fire_at, sequence, task, due): fire_at is due plus jitter
+        self._heap: list[tuple[float, int, ScheduledTask, float]] = []
+        self._sequence = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_at = math.inf
+
+    @property
+    def running(self) -> bool:
+        """Whether the scheduler has been started and not stopped."""
+        return self._loop is not None
+
+    def add(self, func: Callable, interval: float, **options: Any) -> ScheduledTask:
+        """Schedule ``func`` every ``interval`` seconds (see ScheduledTask)."""
+        task = ScheduledTask(func, interval, **options)
+        self.tasks.append(task)
+        if self._loop is not None:
+            self._push(task, self._loop.time())
+            self._arm()
+        return task
+
+    def start(self) -> None:
+        """Start running the scheduled tasks; every task runs once right away."""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        now = self._loop.time()
+        for task in self.tasks:
+            self._push(task, now)
+        self._arm()
+
+    async def stop(self) -> None:
+        """Stop scheduling and cancel runs in progress."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._timer_at = math.inf
+        self._heap.clear()
+        self._loop = None
+        running = []
+        for task in self.tasks:
+            task.pending.clear()
+            if task.running:
+                task.task.cancel()
+                running.append(task.task)
+            task.task = None
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Metrics per task name (see ScheduledTask.stats)."""
+        return {task.name: task.stats() for task in self.tasks}
+
+    # Timer
+
+    def _push(self, task: ScheduledTask, due: float) -> None:
+        fire_at = due + random.uniform(0, task.jitter) if task.jitter else due
+        heapq.heappush(self._heap, (fire_at, next(self._sequence), task, due))
+
+    def _arm(self) -> None:
+        """Point the timer at the earliest due run."""
+        if not self._heap or self._loop is None:
+            return
+        fire_at = self._heap[0][0]
+        if fire_at >= self._timer_at:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_at = fire_at
+        self._timer = self._loop.call_at(fire_at, self._tick)
+
+    def _tick(self) -> None:
+        self._timer = None
+        self._timer_at = math.inf
+        now = self._loop.time()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            fire_at, _, task, due = heapq.heappop(heap)
+            if task.mode == "fixed_rate":
+                self._push(task, self._next_due(task, due, now))
+            self._fire(task, fire_at)
+        self._arm()
+
+    def _next_due(self, task: ScheduledTask, due: float, now: float) -> float:
+        """Next fixed-rate slot, skipping slots the timer has already missed."""
+        next_due = due + task.interval
+        if next_due <= now:
+            missed = math.floor((now - next_due) / task.interval) + 1
+            next_due += missed * task.interval
+            if task.overrun == "skip":
+                task.skipped += missed
+            else:
+                for _ in range(missed):
+                    self._queue_run(task, now)
+        return next_due
+
+    def _fire(self, task: ScheduledTask, fire_at: float) -> None:
+        if task.running:
+            if task.overrun == "skip":
+                task.skipped += 1
+            else:
+                self._queue_run(task, fire_at)
+            return
+        task.task = self._loop.create_task(self._run(task, fire_at))
+
+    def _queue_run(self, task: ScheduledTask, due: float) -> None:
+        """Queue an overrun run, or skip it if max_pending runs already wait."""
+        if len(task.pending) < task.max_pending:
+            task.pending.append(due)
+        else:
+            task.skipped += 1
+
+    # Runs
+
+    async def _run(self, task: ScheduledTask, fire_at: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            lateness = max(start - fire_at, 0.0)
+            try:
+                result = task.func()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as error:
+                task.failures += 1
+                if self.on_error is not None:
+                    with contextlib.suppress(Exception):
+                        await self.on_error(error)
+            duration = loop.time() - start
+            task.runs += 1
+            task.last_lateness = lateness
+            task.max_lateness = max(task.max_lateness, lateness)
+            task.total_lateness += lateness
+            task.last_duration = duration
+            task.max_duration = max(task.max_duration, duration)
+            task.total_duration += duration
+
+            if not task.pending:
+                break
+            fire_at = task.pending.popleft()
+
+        if task.mode == "fixed_delay" and self._loop is not None:
+            self._push(task, loop.time() + task.interval)
+            self._arm()
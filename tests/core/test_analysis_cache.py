@@ -0,0 +1,108 @@
+"""Tests for the persistent type-analysis cache."""
+
+import sqlite3
+from typing import Annotated, Optional
+
+import pytest
+
+from whiskey.core.analysis_cache import (
+    disable_analysis_cache,
+    enable_analysis_cache,
+    get_analysis_cache,
+)
+from whiskey.core.analyzer import InjectDecision, TypeAnalyzer
+from whiskey.core.registry import ComponentRegistry
+
+
+class Database:
+    pass
+
+
+class Cache:
+    pass
+
+
+def handler(name: str, db: Database, cache: Optional[Cache] = None, retries: int = 3):
+    pass
+
+
+class Marker:
+    pass
+
+
+def annotated_handler(db: Annotated[Database, Marker()]):
+    pass
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    path = tmp_path / "analysis.sqlite3"
+    yield path
+    disable_analysis_cache()
+
+
+def make_analyzer(*registered) -> TypeAnalyzer:
+    registry = ComponentRegistry()
+    for cls in registered:
+        registry.register(cls, cls)
+    return TypeAnalyzer(registry)
+
+
+@pytest.mark.unit
+class TestAnalysisCache:
+    """Test storing, loading and invalidating analyzed signatures."""
+
+    def test_second_process_served_from_disk(self, cache_path):
+        """Test that a fresh cache on the same file returns identical results."""
+        enable_analysis_cache(cache_path)
+        expected = make_analyzer(Database, Cache).analyze_callable(handler)
+        get_analysis_cache().flush()
+        disable_analysis_cache()
+
+        # Simulates a new worker process: nothing in memory yet
+        cache = enable_analysis_cache(cache_path)
+        results = make_analyzer(Database, Cache).analyze_callable(handler)
+
+        assert results == expected
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 0
+
+    def test_decisions_follow_current_registry(self, cache_path):
+        """Test that only hints are cached, not registry-dependent decisions."""
+        enable_analysis_cache(cache_path)
+        make_analyzer().analyze_callable(handler)
+
+        results = make_analyzer(Database).analyze_callable(handler)
+
+        assert get_analysis_cache().hits == 1
+        assert results["db"].decision == InjectDecision.YES
+        assert results["cache"].decision == InjectDecision.OPTIONAL
+        assert results["name"].decision == InjectDecision.NO
+        assert results["retries"].decision == InjectDecision.NO
+
+    def test_stale_entry_reanalyzed(self, cache_path):
+        """Test that a changed source fingerprint invalidates the entry."""
+        enable_analysis_cache(cache_path)
+        make_analyzer().analyze_callable(handler)
+        disable_analysis_cache()
+
+        with sqlite3.connect(cache_path) as connection:
+            connection.execute("UPDATE analysis SET fingerprint = 'changed'")
+
+        cache = enable_analysis_cache(cache_path)
+        results = make_analyzer(Database).analyze_callable(handler)
+
+        assert cache.stale == 1
+        assert results["db"].decision == InjectDecision.YES
+
+    def test_unrestorable_hints_not_cached(self, cache_path):
+        """Test that hints which can't round-trip are always analyzed live."""
+        cache = enable_analysis_cache(cache_path)
+        make_analyzer(Database).analyze_callable(annotated_handler)
+        cache.flush()
+
+        assert cache.stats()["entries"] == 0
+
+    def test_disabled_by_default(self):
+        """Test that the cache is opt-in."""
+        assert get_analysis_cache() is None
@@ -0,0 +1,106 @@
+"""Tests for ahead-of-time container compilation."""
+
+import pytest
+
+from whiskey.core.application import Whiskey
+from whiskey.core.compiler import (
+    compile_container,
+    generate_source,
+    load_compiled,
+    source_hash,
+)
+from whiskey.core.container import Container
+
+
+class Settings:
+    pass
+
+
+class Repository:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Handler:
+    def __init__(self, repository: Repository, settings: Settings | None = None):
+        self.repository = repository
+        self.settings = settings
+
+
+def make_container() -> Container:
+    container = Container()
+    container.singleton(Settings)
+    container.register(Repository)
+    container.register(Handler)
+    return container
+
+
+@pytest.mark.unit
+class TestGenerateSource:
+    """Test rendering of wiring modules."""
+
+    def test_generated_module_references_providers(self):
+        """Test that components are wired through import-path references."""
+        source = generate_source(make_container())
+
+        assert f"import {__name__} as _m0" in source
+        assert "('Handler', _m0.Handler, (('repository', _m0.Repository, False), " in source
+        compile(source, "<wiring>", "exec")
+
+    def test_local_classes_are_skipped(self):
+        """Test that components without an import path fall back to runtime analysis."""
+
+        class Local:
+            def __init__(self, settings: Settings):
+                self.settings = settings
+
+        container = make_container()
+        container.register(Local)
+
+        assert "Local" not in generate_source(container)
+
+
+@pytest.mark.unit
+class TestLoadCompiled:
+    """Test caching and installation of generated wiring."""
+
+    def test_compiled_wiring_skips_analysis(self, tmp_path, monkeypatch):
+        """Test that a fresh container resolves without analyzing signatures."""
+        load_compiled(make_container(), cache_dir=tmp_path)
+
+        container = make_container()
+        assert load_compiled(container, cache_dir=tmp_path) == 3
+
+        def fail(*args, **kwargs):
+            raise AssertionError("signature analyzed at runtime")
+
+        monkeypatch.setattr(container.resolver.type_resolver, "analyze_callable", fail)
+        handler = container.resolve_sync(Handler)
+
+        assert isinstance(handler.repository, Repository)
+        assert handler.repository.settings is container.resolve_sync(Settings)
+        # Parameters with defaults are left alone, exactly as without wiring
+        assert handler.settings is None
+
+    def test_cache_reused_and_keyed_by_registrations(self, tmp_path):
+        """Test that identical containers share a module and different ones don't."""
+        path = compile_container(make_container(), cache_dir=tmp_path)
+        assert compile_container(make_container(), cache_dir=tmp_path) == path
+
+        app = Whiskey()
+        app.singleton(Settings)
+        assert source_hash(app) != source_hash(make_container())
+        assert compile_container(app, cache_dir=tmp_path) != path
+
+    def test_stale_module_regenerated(self, tmp_path):
+        """Test that wiring whose source digests no longer match is rebuilt."""
+        path = compile_container(make_container(), cache_dir=tmp_path)
+        path.write_text(path.read_text().replace(f"'{__name__}': '", f"'{__name__}': 'x"))
+
+        assert load_compiled(make_container(), cache_dir=tmp_path) == 3
+        assert f"'{__name__}': 'x" not in path.read_text()
+
+    def test_compile_missing_disabled(self, tmp_path):
+        """Test that nothing is generated when compile_missing is False."""
+        assert load_compiled(make_container(), cache_dir=tmp_path, compile_missing=False) == 0
+        assert list(tmp_path.iterdir()) == []
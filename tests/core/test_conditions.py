@@ -1,18 +1,26 @@
 """Tests for conditional registration functionality."""
 
 import os
+import time
 from unittest.mock import patch
 
+import pytest
+
+from whiskey import Container
 from whiskey.core.conditions import (
     ConditionalRegistry,
     all_conditions,
     any_conditions,
+    dynamic,
     env_equals,
     env_exists,
     env_truthy,
     evaluate_condition,
+    is_static,
     not_condition,
+    static,
 )
+from whiskey.core.errors import RegistrationError, ResolutionError
 
 
 class TestEvaluateCondition:
@@ -166,6 +174,7 @@ class TestConditionalRegistry:
         # Set condition
         def condition():
             return True
+
         registry.set_condition(TestService, None, condition)
 
         # Get condition
@@ -237,3 +246,129 @@ class TestConditionalRegistry:
         assert not registry.has_condition(TestService1, None)
         assert not registry.has_condition(TestService2, None)
         assert not registry.has_condition(TestService1, "named")
+
+
+class TestCachedConditions:
+    """Test static and dynamic condition caching."""
+
+    def test_static_condition_evaluated_once(self):
+        """Test that a static condition keeps its first result until invalidated."""
+        calls = []
+        condition = static(lambda: calls.append(1) or True)
+
+        assert condition() is True
+        assert condition() is True
+        assert len(calls) == 1
+
+        condition.invalidate()
+        assert condition() is True
+        assert len(calls) == 2
+
+    def test_dynamic_condition_ttl(self):
+        """Test that a dynamic condition is re-evaluated once its TTL expires."""
+        flag = {"on": True}
+        condition = dynamic(lambda: flag["on"], ttl=0.05)
+
+        assert condition() is True
+        flag["on"] = False
+        assert condition() is True
+        time.sleep(0.06)
+        assert condition() is False
+
+    def test_classification(self):
+        """Test which conditions count as static."""
+        assert is_static(None)
+        assert is_static(static(lambda: True))
+        assert is_static(env_equals("ENV", "production"))
+        assert is_static(all_conditions(env_exists("A"), not_condition(env_truthy("B"))))
+        assert not is_static(lambda: True)
+        assert not is_static(dynamic(lambda: True, ttl=1.0))
+        assert not is_static(any_conditions(env_exists("A"), lambda: True))
+        with pytest.raises(ValueError):
+            dynamic(lambda: True, ttl=-1)
+
+    def test_static_condition_skips_resolve_path(self):
+        """Test that resolving a statically conditioned component never re-evaluates it."""
+        calls = []
+        container = Container()
+
+        class Service:
+            pass
+
+        container.register(Service, condition=static(lambda: calls.append(1) or True))
+
+        for _ in range(5):
+            container.resolve_sync(Service)
+
+        assert len(calls) == 1
+
+    def test_refresh_conditions(self):
+        """Test that refresh_conditions() re-evaluates static conditions."""
+        container = Container()
+
+        class DevTools:
+            pass
+
+        with patch.dict(os.environ, {"WHISKEY_TEST_ENV": "development"}):
+            container.register(DevTools, condition=env_equals("WHISKEY_TEST_ENV", "development"))
+            container.resolve_sync(DevTools)
+
+            os.environ["WHISKEY_TEST_ENV"] = "production"
+            container.resolve_sync(DevTools)  # Still settled
+
+            container.refresh_conditions()
+            with pytest.raises(ResolutionError):
+                container.resolve_sync(DevTools)
+
+        container.freeze()
+        with pytest.raises(RegistrationError):
+            container.refresh_conditions()
+
+    def test_refresh_reaches_composite_parts(self):
+        """Test that refresh_conditions() re-evaluates the parts of composite conditions."""
+        container = Container()
+
+        class Feature:
+            pass
+
+        class Mixed:
+            pass
+
+        with patch.dict(os.environ, {"WHISKEY_TEST_FLAG": "0"}):
+            container.register(
+                Feature,
+                condition=all_conditions(env_truthy("WHISKEY_TEST_FLAG"), env_exists("PATH")),
+            )
+            container.register(
+                Mixed, condition=any_conditions(env_truthy("WHISKEY_TEST_FLAG"), lambda: False)
+            )
+            with pytest.raises(ResolutionError):
+                container.resolve_sync(Feature)
+            with pytest.raises(ResolutionError):
+                container.resolve_sync(Mixed)
+
+            os.environ["WHISKEY_TEST_FLAG"] = "1"
+            container.refresh_conditions()
+
+            assert isinstance(container.resolve_sync(Feature), Feature)
+            assert isinstance(container.resolve_sync(Mixed), Mixed)
+
+    def test_dynamic_condition_without_ttl_invalidate(self):
+        """Test that invalidating a ttl-less dynamic condition takes effect on resolution."""
+        flag = {"on": True}
+        condition = dynamic(lambda: flag["on"])
+        container = Container()
+
+        class Service:
+            pass
+
+        container.register(Service, condition=condition)
+        container.resolve_sync(Service)
+
+        flag["on"] = False
+        container.resolve_sync(Service)  # Cached until invalidated
+
+        condition.invalidate()
+        with pytest.raises(ResolutionError):
+            container.resolve_sync(Service)
+        assert not is_static(condition)
@@ -6,7 +6,7 @@ from typing import Optional
 import pytest
 
 from whiskey.core.container import Container, get_current_container, set_current_container
-from whiskey.core.errors import ResolutionError
+from whiskey.core.errors import ConfigurationError, RegistrationError, ResolutionError
 
 
 # Test classes
@@ -312,6 +312,32 @@ class TestScopeManagement:
             db3 = container.resolve_sync(Database)
             assert db3 is not db1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_scopes_are_isolated(self):
+        """Test that concurrent activations of one scope do not share instances."""
+        container = Container()
+        container.scoped(Database, scope_name="request")
+        exited = asyncio.Event()
+
+        async def short_request():
+            async with container.scope("request"):
+                db = await container.resolve(Database)
+            exited.set()
+            return db
+
+        async def long_request():
+            async with container.scope("request"):
+                db1 = await container.resolve(Database)
+                await exited.wait()
+                # The other request's exit must not clear our instances
+                db2 = await container.resolve(Database)
+            return db1, db2
+
+        (db1, db2), other = await asyncio.gather(long_request(), short_request())
+
+        assert db1 is db2
+        assert db1 is not other
+
 
 @pytest.mark.unit
 class TestContextManagement:
@@ -399,5 +425,454 @@ class TestErrorHandling:
         # The actual implementation needs to be adjusted
 
 
+@pytest.mark.unit
+class TestFrozenContainer:
+    """Test freeze() validation and frozen resolution."""
+
+    def test_frozen_resolution(self):
+        """Test that a frozen container resolves from its precomputed table."""
+        container = Container()
+        container.singleton(Database)
+        container.register(Logger)
+        container.register(Service)
+
+        container.freeze()
+
+        assert container.frozen
+        service = container.resolve_sync(Service)
+        assert service.db is container.resolve_sync(Database)
+        assert isinstance(service.logger, Logger)
+        # Dependencies were bound at freeze time
+        assert container.resolver.get_plan(Service).bound_dependencies is not None
+
+    def test_registration_after_freeze_raises(self):
+        """Test that the registry is read-only once frozen."""
+        container = Container()
+        container.register(Database)
+        container.freeze()
+
+        with pytest.raises(RegistrationError, match="frozen"):
+            container.register(Logger)
+        with pytest.raises(RegistrationError, match="frozen"):
+            del container[Database]
+
+    def test_conditions_settled_once(self):
+        """Test that conditions are not re-evaluated after freezing."""
+        calls = []
+
+        def enabled():
+            calls.append(1)
+            return True
+
+        container = Container()
+        container.register(Database, condition=enabled)
+        container.register("disabled", Logger, condition=lambda: False)
+        container.freeze()
+        calls.clear()
+
+        container.resolve_sync(Database)
+        container.resolve_sync(Database)
+
+        assert calls == []
+        assert "disabled" not in container
+
+    def test_freeze_reports_all_problems(self):
+        """Test that missing deps, cycles and scope violations are collected."""
+
+        class Missing:
+            def __init__(self, value: int):
+                pass
+
+        class NeedsMissing:
+            def __init__(self, missing: Missing):
+                pass
+
+        class A:
+            def __init__(self, b: "B"):
+                pass
+
+        class B:
+            def __init__(self, a: A):
+                pass
+
+        class Request:
+            pass
+
+        class Captive:
+            def __init__(self, request: Request):
+                pass
+
+        A.__init__.__annotations__["b"] = B
+        container = Container()
+        container.register(NeedsMissing)
+        container.register(A)
+        container.register(B)
+        container.scoped(Request, scope_name="request")
+        container.singleton(Captive)
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            container.freeze()
+
+        message = str(exc_info.value)
+        assert "'NeedsMissing' requires parameter 'missing'" in message
+        assert "Circular dependency: " in message
+        assert "singleton 'Captive' cannot depend on scoped 'Request'" in message
+        # A failed freeze leaves the container usable
+        assert not container.frozen
+        container.register(Logger)
+
+
+@pytest.mark.unit
+class TestChildContainer:
+    """Test copy-on-write child containers."""
+
+    def test_child_falls_through_to_parent(self):
+        """Test that unregistered keys resolve through the parent's plans and singletons."""
+        parent = Container()
+        parent.singleton(Database)
+        parent.register(Service)
+        child = parent.child()
+
+        assert child.parent is parent
+        assert len(child.registry) == 0
+        assert child.resolve_sync(Database) is parent.resolve_sync(Database)
+        assert child.resolver.get_plan(Service) is parent.resolver.get_plan(Service)
+        assert Database in child
+
+    def test_override_rebinds_dependents_in_child_only(self):
+        """Test that parent components see a child's override through the child."""
+
+        class TenantDatabase(Database):
+            pass
+
+        parent = Container()
+        parent.singleton(Database)
+        parent.register(Service)
+        child = parent.child()
+        child.singleton(Database, TenantDatabase)
+
+        assert isinstance(child.resolve_sync(Service).db, TenantDatabase)
+        assert type(parent.resolve_sync(Service).db) is Database
+        # The override is a pure replacement, so type analysis stays shared
+        assert child.resolver.type_resolver is parent.resolver.type_resolver
+
+    def test_parent_singletons_are_shared(self):
+        """Test that parent singletons keep the parent's dependencies."""
+
+        class Repository:
+            def __init__(self, db: Database):
+                self.db = db
+
+        parent = Container()
+        parent.register(Database)
+        parent.singleton(Repository)
+        child = parent.child()
+        child.register(Database, lambda: Database())
+
+        assert child.resolve_sync(Repository) is parent.resolve_sync(Repository)
+
+    def test_parent_changes_visible_to_child(self):
+        """Test that registrations made on the parent later are seen by the child."""
+        parent = Container()
+        parent.register(Logger)
+        child = parent.child()
+        child.resolve_sync(Logger)
+
+        parent.register("greeting", "hello")
+
+        assert child.resolve_sync("greeting") == "hello"
+
+    @pytest.mark.asyncio
+    async def test_async_resolution_through_child(self):
+        """Test async resolution uses the parent's singleton cache for its singletons."""
+        parent = Container()
+        parent.singleton(Database, factory=async_database_factory)
+        parent.register(Service)
+        child = parent.child()
+        child.register(Logger)
+
+        service = await child.resolve_async(Service)
+
+        assert service.db is await parent.resolve_async(Database)
+        assert isinstance(service.logger, Logger)
+
+
+@pytest.mark.unit
+class TestInterfaceResolution:
+    """Test resolving interfaces registered only through implementations."""
+
+    def test_single_implementation_injected(self):
+        """Test that an unregistered base class resolves to its only implementation."""
+
+        class Storage:
+            pass
+
+        class DiskStorage(Storage):
+            pass
+
+        class Uploader:
+            def __init__(self, storage: Storage):
+                self.storage = storage
+
+        container = Container()
+        container.singleton(DiskStorage)
+        container.register(Uploader)
+
+        assert container.resolve_sync(Storage) is container.resolve_sync(DiskStorage)
+        assert isinstance(container.resolve_sync(Uploader).storage, DiskStorage)
+
+    def test_multiple_implementations_ambiguous(self):
+        """Test that an interface with several implementations is not guessed."""
+
+        class Storage:
+            pass
+
+        class DiskStorage(Storage):
+            pass
+
+        class MemoryStorage(Storage):
+            pass
+
+        container = Container()
+        container.register(DiskStorage)
+        container.register(MemoryStorage)
+
+        with pytest.raises(ResolutionError, match="ambiguous"):
+            container.resolve_sync(Storage)
+
+
+@pytest.mark.unit
+class TestPooledComponents:
+    """Test transients registered with pooled=N."""
+
+    class Buffer:
+        def __init__(self):
+            self.data = []
+            self.resets = 0
+
+        def reset(self):
+            self.data.clear()
+            self.resets += 1
+
+    def test_scope_exit_returns_instances(self):
+        """Test that pooled instances are reset and reused across scopes."""
+        container = Container()
+        container.register(self.Buffer, pooled=2)
+
+        with container.scope("request"):
+            first = container.resolve_sync(self.Buffer)
+            first.data.append(1)
+            assert container.resolve_sync(self.Buffer) is not first
+
+        with container.scope("request"):
+            reused = container.resolve_sync(self.Buffer)
+            assert reused.resets == 1
+            assert reused.data == []
+
+        stats = container.pool_stats()["Buffer"]
+        assert stats["created"] == 2
+        assert stats["reused"] == 1
+        assert stats["in_use"] == 0
+
+    def test_unscoped_resolution_is_not_pooled(self):
+        """Test that instances resolved outside a scope or checkout are plain transients."""
+        container = Container()
+        container.register(self.Buffer, pooled=True)
+
+        assert container.resolve_sync(self.Buffer) is not container.resolve_sync(self.Buffer)
+        assert container.pool_stats()["Buffer"]["idle"] == 0
+
+    def test_checkout_context_manager(self):
+        """Test that checkout() returns the instance when the block exits."""
+        container = Container()
+        container.register(self.Buffer, pooled=1)
+
+        with container.checkout(self.Buffer) as buffer:
+            assert container.pool_stats()["Buffer"]["in_use"] == 1
+        with container.checkout(self.Buffer) as again:
+            pass
+
+        assert again is buffer
+        assert buffer.resets == 2
+        assert container.pool_stats()["Buffer"]["reused"] == 1
+
+    def test_pool_size_bounds_idle_instances(self):
+        """Test that instances beyond the pool size are discarded."""
+        container = Container()
+        container.register(self.Buffer, pooled=1)
+
+        with container.scope("request"):
+            container.resolve_sync(self.Buffer)
+            container.resolve_sync(self.Buffer)
+
+        stats = container.pool_stats()["Buffer"]
+        assert stats["idle"] == 1
+        assert stats["discarded"] == 1
+
+    def test_singleton_owns_pooled_dependency(self):
+        """Test that a pooled dependency of a singleton is never checked back in."""
+
+        class Owner:
+            def __init__(self, buffer: TestPooledComponents.Buffer):
+                self.buffer = buffer
+
+        container = Container()
+        container.register(self.Buffer, pooled=1)
+        container.singleton(Owner)
+
+        with container.scope("request"):
+            owner = container.resolve_sync(Owner)
+
+        with container.scope("request"):
+            assert container.resolve_sync(self.Buffer) is not owner.buffer
+        assert owner.buffer.resets == 0
+
+    @pytest.mark.asyncio
+    async def test_async_checkout(self):
+        """Test concurrent async checkouts never share an instance."""
+
+        async def make_buffer() -> TestPooledComponents.Buffer:
+            await asyncio.sleep(0)
+            return TestPooledComponents.Buffer()
+
+        container = Container()
+        container.register("buffer", make_buffer, pooled=4)
+
+        async def use():
+            async with container.checkout("buffer") as buffer:
+                await asyncio.sleep(0.01)
+                return buffer
+
+        buffers = await asyncio.gather(*(use() for _ in range(3)))
+
+        assert len({id(buffer) for buffer in buffers}) == 3
+        stats = container.pool_stats()["buffer"]
+        assert stats["idle"] == 3
+        assert stats["in_use"] == 0
+
+    def test_invalid_pool_size(self):
+        """Test that a non-positive pool size is a configuration error."""
+        container = Container()
+        container.register(self.Buffer, pooled=-1)
+
+        with pytest.raises(ConfigurationError, match="pooled"):
+            container.resolve_sync(self.Buffer)
+
+
+@pytest.mark.unit
+class TestResolveMany:
+    """Test batch resolution of independent async components."""
+
+    @staticmethod
+    def slow_factory(label: str, calls: list):
+        async def factory():
+            calls.append(label)
+            await asyncio.sleep(0.05)
+            return label
+
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_independent_factories_run_concurrently(self):
+        """Test that three 50ms factories resolve in about 50ms, in key order."""
+        container = Container()
+        calls = []
+        for label in ("http", "db", "cache"):
+            container.register(label, self.slow_factory(label, calls))
+
+        start = asyncio.get_running_loop().time()
+        results = await container.resolve_many("http", "db", "cache")
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert results == ["http", "db", "cache"]
+        assert elapsed < 0.12
+
+    @pytest.mark.asyncio
+    async def test_shared_singleton_created_once(self):
+        """Test that a singleton shared by concurrent requests is created once."""
+        created = []
+
+        async def make_database() -> Database:
+            created.append(1)
+            await asyncio.sleep(0.01)
+            return Database()
+
+        class Reader:
+            def __init__(self, db: Database):
+                self.db = db
+
+        class Writer:
+            def __init__(self, db: Database):
+                self.db = db
+
+        container = Container()
+        container.singleton(Database, make_database)
+        container.register(Reader)
+        container.register(Writer)
+
+        reader, writer = await container.resolve_many(Reader, Writer)
+
+        assert reader.db is writer.db
+        assert created == [1]
+
+    @pytest.mark.asyncio
+    async def test_scoped_components_shared_within_scope(self):
+        """Test that batch resolution uses the active scope activation."""
+        container = Container()
+        container.scoped(Logger, scope_name="request")
+
+        async with container.scope("request"):
+            first, second = await container.resolve_many(Logger, Logger)
+
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_concurrent_call_injection(self):
+        """Test that a concurrent container injects call parameters in parallel."""
+
+        class HTTPClient:
+            pass
+
+        class Cache:
+            pass
+
+        def slow(cls):
+            async def factory():
+                await asyncio.sleep(0.05)
+                return cls()
+
+            return factory
+
+        container = Container(concurrent=True)
+        container.register(HTTPClient, slow(HTTPClient))
+        container.register(Cache, slow(Cache))
+
+        async def handler(http: HTTPClient, cache: Cache):
+            return http, cache
+
+        start = asyncio.get_running_loop().time()
+        http, cache = await container.call_async(handler)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert isinstance(http, HTTPClient)
+        assert isinstance(cache, Cache)
+        assert elapsed < 0.09
+        assert container.child().concurrent
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates(self):
+        """Test that a failing factory fails the whole batch."""
+
+        async def broken():
+            raise ValueError("boom")
+
+        container = Container()
+        container.register("ok", self.slow_factory("ok", []))
+        container.register("broken", broken)
+
+        with pytest.raises(ValueError, match="boom"):
+            await container.resolve_many("ok", "broken")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
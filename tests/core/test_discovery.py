@@ -7,9 +7,16 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from whiskey import get_app
 from whiskey.core.container import Container
-from whiskey.core.discovery import ComponentDiscoverer, ContainerInspector, discover_components
-from whiskey.core.registry import Scope
+from whiskey.core.discovery import (
+    ComponentDiscoverer,
+    ContainerInspector,
+    discover_components,
+    scan_source,
+)
+from whiskey.core.errors import ResolutionError
+from whiskey.core.registry import ImportRef, Scope
 
 
 class TestComponentDiscoverer:
@@ -607,3 +614,178 @@ class TestDiscoverComponentsFunction:
             assert UnrelatedClass not in components
         finally:
             del sys.modules["test_pred_module"]
+
+
+STATIC_PACKAGE = {
+    "__init__.py": "",
+    "services.py": """
+def repository(cls):
+    return cls
+
+
+def component(**options):
+    return repository
+
+
+@repository
+class UserRepository:
+    pass
+
+@component(name="mailer", tags={"io"})
+class Mailer:
+    pass
+
+class Plain:
+    pass
+""",
+    "handlers/__init__.py": "",
+    "handlers/users.py": """
+from myapp.services import UserRepository, repository as singleton
+
+@singleton
+class UserHandler:
+    def __init__(self, repository: UserRepository):
+        self.repository = repository
+""",
+}
+
+
+@pytest.fixture
+def static_package(tmp_path, monkeypatch):
+    """A package on sys.path that is never imported by the test itself."""
+    name = f"static_pkg_{tmp_path.name}"
+    root = tmp_path / "src" / name
+    for relative, source in STATIC_PACKAGE.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source.replace("myapp.", f"{name}."))
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    yield name, root
+    for module_name in [m for m in sys.modules if m.startswith(name)]:
+        del sys.modules[module_name]
+
+
+class TestStaticDiscovery:
+    """Test AST-based discovery that defers imports to first resolution."""
+
+    def test_scan_source_reads_decorator_options(self):
+        """Test that literal decorator arguments are read without executing code."""
+        source = """
+@singleton
+class Database: ...
+
+@scoped("request", tags={"web"})
+class Session: ...
+
+@component(key=Database, condition=lambda: True)
+class Conditional: ...
+
+def helper(): ...
+"""
+        entries = {entry["qualname"]: entry for entry in scan_source(source, "app.models")}
+
+        assert entries["Database"]["scope"] == "singleton"
+        assert entries["Database"]["key"] == "Database"
+        assert entries["Session"]["metadata"] == {"scope_name": "request"}
+        assert entries["Session"]["tags"] == ["web"]
+        assert entries["Conditional"]["dynamic"] is True
+        assert "helper" not in entries
+
+    def test_components_imported_on_first_resolution(self, static_package, tmp_path):
+        """Test that modules are only imported once a component is resolved."""
+        name, _ = static_package
+        container = Container()
+        discoverer = ComponentDiscoverer(container)
+
+        registered = discoverer.discover_package_static(
+            name,
+            decorators={"repository": Scope.SINGLETON},
+            cache_dir=tmp_path / "cache",
+            processes=1,
+        )
+
+        assert registered == {"UserRepository", "mailer", "UserHandler"}
+        assert f"{name}.services" not in sys.modules
+        assert isinstance(container.registry.get("UserHandler").provider, ImportRef)
+        assert container.registry.get("mailer").tags == {"io"}
+
+        handler = container.resolve_sync("UserHandler")
+
+        assert f"{name}.handlers.users" in sys.modules
+        assert handler.repository is container.resolve_sync("UserRepository")
+        assert type(handler).__name__ == "UserHandler"
+
+    def test_manifest_reused_until_source_changes(self, static_package, tmp_path, monkeypatch):
+        """Test that unchanged files are served from the manifest."""
+        name, root = static_package
+        cache_dir = tmp_path / "cache"
+        ComponentDiscoverer(Container()).discover_package_static(name, cache_dir=cache_dir)
+        manifest = next(cache_dir.glob("whiskey_discovery_*.json"))
+        written = manifest.stat().st_mtime_ns
+
+        parsed = []
+        monkeypatch.setattr(
+            "whiskey.core.discovery.scan_source",
+            lambda source, module_name, decorators: parsed.append(module_name) or [],
+        )
+        ComponentDiscoverer(Container()).discover_package_static(name, cache_dir=cache_dir)
+        assert parsed == []
+        assert manifest.stat().st_mtime_ns == written
+
+        services = root / "services.py"
+        services.write_text(services.read_text() + "\n# edited\n")
+        ComponentDiscoverer(Container()).discover_package_static(name, cache_dir=cache_dir)
+        assert parsed == [f"{name}.services"]
+
+    def test_existing_registrations_kept(self, static_package, tmp_path):
+        """Test that explicit registrations take precedence over discovered ones."""
+        name, _ = static_package
+        container = Container()
+        container.register("mailer", object)
+
+        registered = ComponentDiscoverer(container).discover_package_static(
+            name, cache_dir=tmp_path / "cache"
+        )
+
+        assert "mailer" not in registered
+        assert container.registry.get("mailer").provider is object
+
+    def test_dynamic_decorator_arguments_registered(self, static_package, tmp_path):
+        """Test that classes with non-literal decorator arguments land in the container."""
+        name, root = static_package
+        (root / "dynamic.py").write_text(
+            f"""
+from whiskey import singleton
+from {name}.services import component
+
+ENABLED = True
+
+
+@singleton(condition=lambda: ENABLED)
+class Dyn:
+    pass
+
+
+@component(name=ENABLED and "custom")
+class Custom:
+    pass
+"""
+        )
+        container = Container()
+
+        try:
+            registered = ComponentDiscoverer(container).discover_package_static(
+                name, cache_dir=tmp_path / "cache", processes=1
+            )
+            module = sys.modules[f"{name}.dynamic"]
+
+            assert registered == {"mailer", "UserHandler", "Dyn", "Custom"}
+            dyn = container.resolve_sync(module.Dyn)
+            assert dyn is container.resolve_sync(module.Dyn)
+            assert isinstance(container.resolve_sync(module.Custom), module.Custom)
+
+            module.ENABLED = False
+            with pytest.raises(ResolutionError):
+                container.resolve_sync(module.Dyn)
+        finally:
+            get_app().container.registry.remove(sys.modules[f"{name}.dynamic"].Dyn)
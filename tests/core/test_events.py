@@ -0,0 +1,158 @@
+"""Tests for event dispatch, glob patterns and the background event queue."""
+
+import asyncio
+
+import pytest
+
+from whiskey import Whiskey
+from whiskey.core.events import EventDispatcher
+
+
+@pytest.mark.unit
+class TestEventDispatcher:
+    """Test handler compilation and dispatch."""
+
+    async def test_glob_patterns(self):
+        """Test that glob patterns match by name and the catch-all gets the event name."""
+        events = EventDispatcher()
+        received = []
+        events.add("user.*", lambda data: received.append(("user.*", data)))
+        events.add("*.failed", lambda data: received.append(("*.failed", data)))
+        events.add("*", lambda event, data: received.append(("*", event)))
+
+        await events.dispatch("user.created", 1)
+        await events.dispatch("job.failed", 2)
+        await events.dispatch("user", 3)
+
+        assert received == [
+            ("user.*", 1),
+            ("*", "user.created"),
+            ("*.failed", 2),
+            ("*", "job.failed"),
+            ("*", "user"),
+        ]
+
+    async def test_exact_handlers_run_first_in_registration_order(self):
+        """Test that exact handlers precede pattern handlers, each in registration order."""
+        events = EventDispatcher()
+        order = []
+        events.add("a.*", lambda: order.append("pattern"))
+        events.add("a.b", lambda: order.append("exact1"))
+
+        async def exact2():
+            order.append("exact2")
+
+        events.add("a.b", exact2)
+
+        await events.dispatch("a.b")
+
+        assert order == ["exact1", "exact2", "pattern"]
+
+    async def test_registration_invalidates_compiled_handlers(self):
+        """Test that handlers added after an event was compiled still receive it."""
+        events = EventDispatcher()
+        received = []
+        await events.dispatch("tick")
+        assert events.handlers("tick") == ()
+
+        events.add("t*", received.append)
+        await events.dispatch("tick", 1)
+
+        assert received == [1]
+
+    async def test_concurrent_dispatch(self):
+        """Test that concurrent mode awaits async handlers together."""
+        events = EventDispatcher(concurrent=True)
+        started = []
+
+        async def handler(n):
+            started.append(n)
+            await asyncio.sleep(0.05)
+
+        for _ in range(5):
+            events.add("slow", handler)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await events.dispatch("slow", 1)
+
+        assert started == [1] * 5
+        assert loop.time() - start < 0.2
+
+    def test_invalid_queue_size(self):
+        """Test that a non-positive queue size is rejected."""
+        with pytest.raises(ValueError):
+            EventDispatcher(queue_size=0)
+
+
+@pytest.mark.unit
+class TestBackgroundEvents:
+    """Test fire-and-forget events through Whiskey.post."""
+
+    async def test_post_dispatches_in_background(self):
+        """Test that posted events are delivered in order after post returns."""
+        app = Whiskey()
+        received = []
+
+        @app.on("metrics.*")
+        async def record(value):
+            received.append(value)
+
+        assert app.post("metrics.loss", 1)
+        assert app.post("metrics.loss", 2)
+        assert received == []
+
+        await app._events.drain()
+
+        assert received == [1, 2]
+        stats = app.event_stats()
+        assert stats["queued"] == 2
+        assert stats["dispatched"] == 2
+        assert stats["depth"] == 0
+
+    async def test_full_queue_drops_events(self):
+        """Test that a bounded queue drops events and counts them."""
+        app = Whiskey(event_queue_size=2)
+        received = []
+        app.on("tick", received.append)
+
+        results = [app.post("tick", n) for n in range(5)]
+        await app._events.drain()
+
+        assert results == [True, True, False, False, False]
+        assert received == [0, 1]
+        stats = app.event_stats()
+        assert stats["dropped"] == 3
+        assert stats["max_depth"] == 2
+        assert stats["maxsize"] == 2
+
+    async def test_handler_errors_are_emitted(self):
+        """Test that errors in background handlers reach the error handlers."""
+        app = Whiskey()
+        errors = []
+
+        @app.on_error
+        async def handle(error):
+            errors.append(error)
+
+        @app.on("boom")
+        def fail():
+            raise RuntimeError("boom")
+
+        app.post("boom")
+        await app._events.drain()
+
+        assert [str(error) for error in errors] == ["boom"]
+        assert app.event_stats()["failed"] == 1
+
+    async def test_shutdown_drains_queue(self):
+        """Test that shutdown delivers events still waiting in the queue."""
+        app = Whiskey()
+        received = []
+        app.on("late", received.append)
+
+        await app.startup()
+        app.post("late", 1)
+        await app.shutdown()
+
+        assert received == [1]
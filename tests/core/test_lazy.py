@@ -7,7 +7,7 @@ import pytest
 
 from whiskey.core.container import Container, _current_container
 from whiskey.core.errors import ResolutionError
-from whiskey.core.lazy import Lazy, LazyDescriptor, lazy_inject
+from whiskey.core.lazy import AsyncLazy, Lazy, LazyDescriptor, lazy_inject
 
 
 class TestLazy:
@@ -339,6 +339,142 @@ class TestLazyEdgeCases:
         assert not lazy.is_resolved
 
 
+class TestAsyncLazy:
+    """Test the awaitable AsyncLazy wrapper."""
+
+    async def test_await_resolves_async_factory(self):
+        """Test that awaiting resolves through async factories."""
+
+        class Client:
+            def __init__(self, url):
+                self.url = url
+
+        async def create_client() -> Client:
+            await asyncio.sleep(0)
+            return Client("https://example.com")
+
+        container = Container()
+        container.register(Client, create_client)
+        lazy = AsyncLazy(Client, container=container)
+
+        assert not lazy.is_resolved
+        client = await lazy
+
+        assert client.url == "https://example.com"
+        assert lazy.is_resolved
+        assert lazy.value is client
+        assert lazy.url == "https://example.com"
+        assert await lazy is client
+
+    async def test_concurrent_awaiters_share_resolution(self):
+        """Test that concurrent awaiters trigger a single resolution."""
+        calls = []
+
+        class Heavy:
+            pass
+
+        async def create_heavy() -> Heavy:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return Heavy()
+
+        container = Container()
+        container.register(Heavy, create_heavy)
+        lazy = AsyncLazy(Heavy, container=container)
+
+        async def use():
+            return await lazy
+
+        results = await asyncio.gather(*(use() for _ in range(10)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_failed_resolution_retried(self):
+        """Test that every awaiter sees the error and the next await retries."""
+        attempts = []
+
+        class Flaky:
+            pass
+
+        async def create_flaky() -> Flaky:
+            attempts.append(1)
+            await asyncio.sleep(0)
+            if len(attempts) == 1:
+                raise ConnectionError("unavailable")
+            return Flaky()
+
+        container = Container()
+        container.register(Flaky, create_flaky)
+        lazy = AsyncLazy(Flaky, container=container)
+
+        async def use():
+            return await lazy
+
+        results = await asyncio.gather(use(), use(), return_exceptions=True)
+        assert len(attempts) == 1
+        assert all(isinstance(result, (ResolutionError, ConnectionError)) for result in results)
+
+        assert isinstance(await lazy, Flaky)
+        assert len(attempts) == 2
+
+    async def test_cancelled_awaiter_does_not_cancel_others(self):
+        """Test that cancelling one awaiter leaves the shared resolution running."""
+
+        class Slow:
+            pass
+
+        async def create_slow() -> Slow:
+            await asyncio.sleep(0.01)
+            return Slow()
+
+        container = Container()
+        container.register(Slow, create_slow)
+        lazy = AsyncLazy(Slow, container=container)
+
+        async def use():
+            return await lazy
+
+        first = asyncio.ensure_future(use())
+        second = asyncio.ensure_future(use())
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert isinstance(await second, Slow)
+        assert first.cancelled()
+
+    async def test_value_before_await_in_async_context(self):
+        """Test that .value still refuses to resolve inside an event loop."""
+
+        class MyService:
+            pass
+
+        container = Container()
+        container.register(MyService, MyService())
+        lazy = AsyncLazy(MyService, container=container)
+
+        with pytest.raises(RuntimeError, match="Use AsyncLazy and 'await' it"):
+            _ = lazy.value
+
+    async def test_awaitable_descriptor(self):
+        """Test that LazyDescriptor(awaitable=True) yields AsyncLazy instances."""
+
+        class Database:
+            pass
+
+        class MyService:
+            db: LazyDescriptor[Database] = LazyDescriptor(Database, awaitable=True)
+
+            def __init__(self):
+                self.container = Container()
+                self.container.singleton(Database)
+
+        service = MyService()
+
+        assert isinstance(service.db, AsyncLazy)
+        assert await service.db is await service.container.resolve_async(Database)
+
+
 class TestLazyDescriptor:
     """Test the LazyDescriptor class."""
 
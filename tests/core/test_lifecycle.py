@@ -0,0 +1,307 @@
+"""Tests for dependency-graph-aware component startup and shutdown."""
+
+import asyncio
+import time
+
+import pytest
+
+from whiskey.core.application import Whiskey
+from whiskey.core.container import Container
+from whiskey.core.lifecycle import (
+    StartupReport,
+    build_dependency_graph,
+    dispose_singletons,
+    start_components,
+    topological_levels,
+)
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config):
+        self.config = config
+        self.initialized = False
+
+    async def initialize(self):
+        await asyncio.sleep(0.05)
+        self.initialized = True
+
+
+class Cache:
+    def __init__(self, config: Config):
+        self.config = config
+        self.initialized = False
+
+    async def initialize(self):
+        await asyncio.sleep(0.05)
+        self.initialized = True
+
+
+class UserService:
+    def __init__(self, db: Database, cache: Cache):
+        self.db = db
+        self.cache = cache
+        self.dependencies_ready = None
+
+    async def initialize(self):
+        self.dependencies_ready = self.db.initialized and self.cache.initialized
+
+
+def make_container() -> Container:
+    container = Container()
+    container.singleton(Config)
+    container.singleton(Database)
+    container.singleton(Cache)
+    container.singleton(UserService)
+    return container
+
+
+@pytest.mark.unit
+class TestDependencyLevels:
+    """Test graph construction and topological grouping."""
+
+    def test_build_dependency_graph(self):
+        """Test that edges point from components to registered dependencies."""
+        container = make_container()
+
+        graph = build_dependency_graph(container, container.registry.list_all())
+
+        assert graph == {
+            "Config": set(),
+            "Database": {"Config"},
+            "Cache": {"Config"},
+            "UserService": {"Database", "Cache"},
+        }
+
+    def test_topological_levels(self):
+        """Test that independent components share a level."""
+        levels = topological_levels({"a": set(), "b": {"a"}, "c": {"a"}, "d": {"b", "c"}})
+
+        assert [sorted(level) for level in levels] == [["a"], ["b", "c"], ["d"]]
+
+    def test_cycle_goes_to_final_level(self):
+        """Test that cyclic components are left for resolution to report."""
+        levels = topological_levels({"a": set(), "b": {"c"}, "c": {"b"}})
+
+        assert levels[0] == ["a"]
+        assert sorted(levels[-1]) == ["b", "c"]
+
+
+@pytest.mark.unit
+class TestStartComponents:
+    """Test concurrent startup."""
+
+    @pytest.mark.asyncio
+    async def test_independent_components_start_concurrently(self):
+        """Test that same-level initialize() hooks overlap."""
+        container = make_container()
+
+        start = time.perf_counter()
+        report = await start_components(container)
+        elapsed = time.perf_counter() - start
+
+        service = await container.resolve(UserService)
+        assert service.dependencies_ready is True
+        # Database and Cache each sleep 50ms; serial startup would take 100ms+
+        assert elapsed < 0.095
+        assert [sorted(level) for level in report.levels] == [
+            ["Config"],
+            ["Cache", "Database"],
+            ["UserService"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """Test that max_concurrency serializes a level."""
+        container = make_container()
+
+        start = time.perf_counter()
+        await start_components(container, max_concurrency=1)
+
+        assert time.perf_counter() - start >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_component_timeout(self):
+        """Test that a slow initialize() fails startup with a clear error."""
+
+        class Slow:
+            async def initialize(self):
+                await asyncio.sleep(1)
+
+        container = Container()
+        container.singleton(Slow)
+
+        with pytest.raises(asyncio.TimeoutError, match="Slow"):
+            await start_components(container, timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_critical_path(self):
+        """Test that the report names the slowest dependency chain."""
+        container = make_container()
+
+        report = await start_components(container)
+
+        assert report.critical_path[0] == "Config"
+        assert report.critical_path[-1] == "UserService"
+        assert report.critical_path[1] in ("Database", "Cache")
+        assert report.critical_path_time <= report.total_time
+        assert "Critical path" in report.format()
+
+    @pytest.mark.asyncio
+    async def test_each_component_compiled_once(self):
+        """Test that startup and disposal reuse one plan per component."""
+        container = make_container()
+        resolver = container.resolver
+        compiled = []
+        compile_plan = resolver.compile_plan
+
+        def counting_compile(descriptor, **kwargs):
+            compiled.append(descriptor.key)
+            return compile_plan(descriptor, **kwargs)
+
+        resolver.compile_plan = counting_compile
+
+        await start_components(container)
+        await dispose_singletons(container)
+
+        assert sorted(compiled) == ["Cache", "Config", "Database", "UserService"]
+
+
+@pytest.mark.unit
+class TestWhiskeyStartup:
+    """Test Whiskey.startup integration."""
+
+    @pytest.mark.asyncio
+    async def test_startup_records_report(self):
+        """Test that startup stores its StartupReport on the app."""
+        app = Whiskey(startup_concurrency=4, startup_timeout=1.0)
+        app.singleton(Config)
+        app.singleton(Database)
+
+        await app.startup()
+
+        assert isinstance(app.startup_report, StartupReport)
+        assert (await app.container.resolve(Database)).initialized
+
+
+class DisposalLog:
+    """Per-test record of constructed and disposed Tracked components."""
+
+    def __init__(self):
+        self.constructed: list[str] = []
+        self.disposed: list[str] = []
+
+
+class Tracked:
+    """Base for components that record their disposal order."""
+
+    def __init__(self, log: DisposalLog):
+        self.log = log
+        log.constructed.append(type(self).__name__)
+
+    async def dispose(self):
+        await asyncio.sleep(0.05)
+        self.log.disposed.append(type(self).__name__)
+
+
+class Connection(Tracked):
+    pass
+
+
+class Repository(Tracked):
+    def __init__(self, connection: Connection, log: DisposalLog):
+        super().__init__(log)
+        self.connection = connection
+
+
+class Mailer(Tracked):
+    def __init__(self, connection: Connection, log: DisposalLog):
+        super().__init__(log)
+        self.connection = connection
+
+
+class NeverUsed(Tracked):
+    pass
+
+
+@pytest.mark.unit
+class TestDisposeSingletons:
+    """Test reverse-dependency disposal."""
+
+    def setup_method(self):
+        self.log = DisposalLog()
+
+    def make_container(self) -> Container:
+        container = Container()
+        container.register(DisposalLog, self.log)
+        container.singleton(Connection)
+        container.singleton(Repository)
+        container.singleton(Mailer)
+        container.singleton(NeverUsed)
+        return container
+
+    @pytest.mark.asyncio
+    async def test_dependents_disposed_first_and_concurrently(self):
+        """Test that dependents go first and independent ones overlap."""
+        container = self.make_container()
+        await container.resolve(Repository)
+        await container.resolve(Mailer)
+
+        start = time.perf_counter()
+        report = await dispose_singletons(container)
+        elapsed = time.perf_counter() - start
+
+        assert self.log.disposed[-1] == "Connection"
+        assert sorted(self.log.disposed[:2]) == ["Mailer", "Repository"]
+        # Two levels of 50ms each; serial disposal would take 150ms+
+        assert elapsed < 0.14
+        assert report.errors == {}
+
+    @pytest.mark.asyncio
+    async def test_uncreated_singletons_not_constructed(self):
+        """Test that disposal never constructs instances."""
+        container = self.make_container()
+        await container.resolve(Connection)
+
+        await dispose_singletons(container)
+
+        assert self.log.constructed == ["Connection"]
+        assert self.log.disposed == ["Connection"]
+        assert container.resolver.scope_resolver.created_singletons() == []
+
+    @pytest.mark.asyncio
+    async def test_errors_and_timeouts_collected(self):
+        """Test that failing and slow dispose() calls don't stop shutdown."""
+
+        class Failing:
+            def dispose(self):
+                raise RuntimeError("dispose failed")
+
+        class Slow:
+            async def dispose(self):
+                await asyncio.sleep(1)
+
+        container = self.make_container()
+        container.singleton(Failing)
+        container.singleton(Slow)
+        await container.resolve(Failing)
+        await container.resolve(Slow)
+        await container.resolve(Connection)
+
+        report = await container.clear_singletons_async(timeout=0.1)
+
+        assert isinstance(report.errors["Failing"], RuntimeError)
+        assert isinstance(report.errors["Slow"], asyncio.TimeoutError)
+        assert self.log.disposed == ["Connection"]
+
+    def test_clear_singletons_sync(self):
+        """Test synchronous disposal outside an event loop."""
+        container = self.make_container()
+        container.resolve_sync(Repository)
+
+        container.clear_singletons()
+
+        assert self.log.disposed == ["Repository", "Connection"]
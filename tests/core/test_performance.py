@@ -9,17 +9,23 @@ from collections import Counter
 
 import pytest
 
+from whiskey.core.container import Container
+from whiskey.core.errors import ResolutionError
 from whiskey.core.performance import (
+    LatencyHistogram,
+    LRUCache,
     PerformanceMetrics,
     PerformanceMonitor,
     ResolutionMetrics,
     ResolutionTimer,
     WeakValueCache,
+    get_cache_stats,
     get_current_metrics,
     is_performance_monitoring_enabled,
     monitor_resolution,
     monitor_type_analysis,
     record_error,
+    set_cache_size,
 )
 
 
@@ -409,6 +415,41 @@ class TestPerformanceMetrics:
         assert any("20.0% error rate" in rec for rec in recommendations)
 
 
+class TestLatencyHistogram:
+    """Test LatencyHistogram class."""
+
+    def test_empty_histogram(self):
+        """Test percentiles of an empty histogram."""
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.mean == 0.0
+        assert histogram.percentiles() == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles."""
+        histogram = LatencyHistogram()
+        for i in range(1, 101):
+            histogram.record(i / 1000)
+
+        assert histogram.count == 100
+        assert histogram.min == 0.001
+        assert histogram.max == 0.1
+        assert histogram.percentiles() == {"p50": 0.05, "p95": 0.095, "p99": 0.099}
+
+    def test_bounded_samples(self):
+        """Test that percentiles use the most recent window only."""
+        histogram = LatencyHistogram(max_samples=10)
+        for _ in range(100):
+            histogram.record(1.0)
+        for _ in range(10):
+            histogram.record(0.001)
+
+        assert histogram.count == 110
+        assert histogram.max == 1.0
+        assert histogram.percentile(99) == 0.001
+
+
 class TestPerformanceMonitor:
     """Test PerformanceMonitor context manager."""
 
@@ -893,6 +934,121 @@ class TestWeakValueCache:
         assert cache.get("key") is obj2
 
 
+class TestLRUCache:
+    """Test the bounded LRU cache primitive."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that reads refresh recency and the oldest entry is evicted."""
+        cache = LRUCache("test.lru", 2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache.get("a") == 1
+
+        cache["c"] = 3
+
+        assert "b" not in cache
+        assert list(cache) == ["a", "c"]
+        assert cache.evictions == 1
+
+    def test_counters(self):
+        """Test hit, miss and eviction counting."""
+        cache = LRUCache("test.counters", 1)
+        cache["a"] = 1
+        cache.get("a")
+        cache.get("missing")
+        with pytest.raises(KeyError):
+            cache["missing"]
+        cache["b"] = 2
+
+        assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 1, "size": 1, "maxsize": 1}
+        assert cache.hit_rate == pytest.approx(100 / 3)
+
+    def test_weak_keys(self):
+        """Test that weak-keyed entries vanish with their key."""
+        import gc
+
+        class Key:
+            pass
+
+        cache = LRUCache("test.weak", weak_keys=True)
+        key = Key()
+        cache[key] = "value"
+        cache[("strong", 1)] = "tuple keys are held strongly"
+
+        assert cache[key] == "value"
+        del key
+        gc.collect()
+
+        assert len(cache) == 1
+        assert list(cache) == [("strong", 1)]
+
+    def test_set_cache_size(self):
+        """Test resizing live caches and configuring new ones by name."""
+        cache = LRUCache("test.resize", 10)
+        for i in range(10):
+            cache[i] = i
+
+        try:
+            set_cache_size("test.resize", 4)
+
+            assert len(cache) == 4
+            assert list(cache) == [6, 7, 8, 9]
+            assert LRUCache("test.resize", 10).maxsize == 4
+        finally:
+            set_cache_size("test.resize", None)
+
+    def test_unbounded_cache(self):
+        """Test that a cache created with maxsize=None never evicts."""
+        cache = LRUCache("test.unbounded", None)
+        for i in range(5000):
+            cache[i] = i
+
+        assert len(cache) == 5000
+        assert cache.evictions == 0
+        assert cache.stats()["maxsize"] == 0
+
+    def test_stats_aggregated_by_name(self):
+        """Test that caches sharing a name report together."""
+        first = LRUCache("test.shared")
+        second = LRUCache("test.shared")
+        first.get("x")
+        second.get("y")
+
+        assert get_cache_stats()["test.shared"]["misses"] == 2
+
+    def test_monitor_reports_cache_activity(self):
+        """Test that PerformanceMonitor records cache counter changes."""
+        cache = LRUCache("test.monitored", 1)
+        cache.get("before")
+
+        with PerformanceMonitor() as metrics:
+            cache["a"] = 1
+            cache["b"] = 2
+            cache.get("b")
+
+        assert metrics.cache_stats["test.monitored"] == {
+            "hits": 1,
+            "misses": 0,
+            "evictions": 1,
+            "size": 1,
+            "maxsize": 1,
+        }
+        assert "test.monitored: 1/0/1" in metrics.generate_report()
+
+    def test_analyzer_uses_bounded_caches(self):
+        """Test that core analysis caches are LRU caches reporting under their names."""
+        container = Container()
+
+        def handler(value: int):
+            pass
+
+        with PerformanceMonitor() as metrics:
+            container.resolver.type_resolver.analyze_callable(handler)
+            container.resolver.type_resolver.analyze_callable(handler)
+
+        assert metrics.cache_stats["analyzer.callables"]["hits"] >= 1
+
+
 class TestPerformanceIntegration:
     """Test integration scenarios for performance monitoring."""
 
@@ -946,6 +1102,66 @@ class TestPerformanceIntegration:
             assert "Total Resolutions: 4" in report
             assert "service_a: 2 (50.0%)" in report
 
+    def test_container_resolution_is_recorded(self):
+        """Test that real container resolutions are recorded."""
+
+        class Database:
+            pass
+
+        class Service:
+            def __init__(self, db: Database):
+                self.db = db
+
+        container = Container()
+        container.singleton(Database)
+        container.register(Service)
+
+        with PerformanceMonitor() as metrics:
+            container.resolve_sync(Database)  # miss
+            container.resolve_sync(Database)  # hit
+            container.resolve_sync(Service)  # transient, miss
+
+            with pytest.raises(ResolutionError):
+                container.resolve_sync("missing")
+
+        assert metrics.resolution_count == 4
+        assert metrics.cache_hits == 1
+        assert metrics.cache_misses == 3
+        assert metrics.resolution_errors == 1
+        assert metrics.resolution_latency["Database"].count == 2
+        # Database constructed once (for the singleton), Service once
+        assert metrics.factory_latency["Database"].count == 1
+        assert metrics.factory_latency["Service"].count == 1
+        assert metrics.type_analysis_time > 0
+        assert "Resolution Latency (p50/p95/p99):" in metrics.generate_report()
+
+    @pytest.mark.asyncio
+    async def test_async_resolution_is_recorded(self):
+        """Test that async resolutions and async factories are recorded."""
+        container = Container()
+
+        async def create_value() -> str:
+            return "value"
+
+        container.register("value", create_value)
+
+        with PerformanceMonitor() as metrics:
+            assert await container.resolve_async("value") == "value"
+
+        assert metrics.resolution_count == 1
+        assert metrics.factory_latency["value"].count == 1
+
+    def test_no_recording_without_monitor(self):
+        """Test that nothing is recorded when monitoring is disabled."""
+        container = Container()
+        container.register("value", lambda: "value")
+
+        with PerformanceMonitor(enabled=False) as metrics:
+            container.resolve_sync("value")
+
+        assert metrics.resolution_count == 0
+        assert get_current_metrics() is None
+
     def test_context_variable_isolation(self):
         """Test that context variables properly isolate metrics."""
 
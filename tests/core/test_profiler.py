@@ -0,0 +1,200 @@
+"""Tests for the resolution profiler and the ``whiskey profile`` command."""
+
+import asyncio
+import json
+import sys
+import time
+
+import pytest
+
+from whiskey.cli import load_app, main
+from whiskey.core.application import Whiskey
+from whiskey.core.container import Container
+from whiskey.core.profiler import Profiler, profile_span
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config):
+        time.sleep(0.02)
+        self.config = config
+
+    async def initialize(self):
+        await asyncio.sleep(0.01)
+
+
+class Service:
+    def __init__(self, db: Database, config: Config):
+        self.db = db
+
+
+def make_container() -> Container:
+    container = Container()
+    container.register(Config)
+    container.register(Database)
+    container.register(Service)
+    return container
+
+
+@pytest.mark.unit
+class TestProfiler:
+    """Test span recording and attribution."""
+
+    def test_spans_follow_dependency_tree(self):
+        """Test that dependency creations nest under the component that needed them."""
+        container = make_container()
+
+        with Profiler() as profiler:
+            container.resolve_sync(Service)
+
+        paths = {span.path for span in profiler.spans}
+        assert ("Service",) in paths
+        assert ("Service", "Database") in paths
+        assert ("Service", "Database", "Config") in paths
+        assert ("Service", "Config") in paths
+
+    def test_self_time_excludes_children(self):
+        """Test that slow constructors are blamed on themselves, not their dependents."""
+        container = make_container()
+
+        with Profiler() as profiler:
+            container.resolve_sync(Service)
+
+        totals = profiler.totals()
+        assert totals["Database"]["self"] >= 0.02
+        assert totals["Service"]["self"] < 0.02
+        assert totals["Service"]["total"] >= totals["Database"]["total"]
+        assert profiler.slowest(1)[0][0] == "Database"
+
+    def test_inactive_outside_context(self):
+        """Test that nothing is recorded after the profiler stops."""
+        container = make_container()
+        profiler = Profiler()
+        with profiler:
+            pass
+
+        container.resolve_sync(Service)
+
+        assert profiler.spans == []
+        with profile_span("manual") as span:
+            assert span is None
+
+    def test_window_and_max_spans(self):
+        """Test that recording stops at the window deadline and span limit."""
+        container = make_container()
+
+        with Profiler(max_spans=2) as limited:
+            container.resolve_sync(Service)
+        with Profiler(window=0.0) as expired:
+            container.resolve_sync(Service)
+
+        assert len(limited.spans) == 2
+        assert expired.spans == []
+
+    def test_trace_allocations(self):
+        """Test that allocations are attributed when tracemalloc is enabled."""
+
+        class Buffer:
+            def __init__(self):
+                self.data = bytearray(1_000_000)
+
+        container = Container()
+        container.singleton(Buffer)
+
+        with Profiler(trace_allocations=True) as profiler:
+            container.resolve_sync(Buffer)
+
+        assert profiler.totals()["Buffer"]["memory"] >= 1_000_000
+        assert "KiB" in profiler.format()
+
+    @pytest.mark.asyncio
+    async def test_startup_profile_and_exports(self, tmp_path):
+        """Test profiling Whiskey.startup, including initialize() hooks and exports."""
+        app = Whiskey(container=make_container())
+
+        async with Profiler() as profiler:
+            await app.startup()
+        await app.shutdown()
+
+        names = {span.name for span in profiler.spans}
+        assert {"Config", "Database", "Database.initialize", "Service"} <= names
+
+        folded = tmp_path / "startup.folded"
+        profiler.write_flamegraph(folded)
+        stacks = dict(line.rsplit(" ", 1) for line in folded.read_text().splitlines())
+        assert int(stacks["Database"]) >= 20_000
+
+        trace = tmp_path / "startup.json"
+        profiler.write_chrome_trace(trace)
+        events = json.loads(trace.read_text())["traceEvents"]
+        assert {event["ph"] for event in events} == {"X"}
+        assert len(events) == len(profiler.spans)
+
+    @pytest.mark.asyncio
+    async def test_async_factories_profiled(self):
+        """Test that async factory creations record spans too."""
+
+        async def make_config() -> Config:
+            await asyncio.sleep(0.01)
+            return Config()
+
+        container = Container()
+        container.register(Config, make_config)
+        container.register(Database)
+
+        async with Profiler() as profiler:
+            await container.resolve_async(Database)
+
+        assert {span.path for span in profiler.spans} == {("Database",), ("Database", "Config")}
+
+
+@pytest.mark.unit
+class TestProfileCommand:
+    """Test the ``whiskey profile`` command."""
+
+    @pytest.fixture
+    def app_module(self, tmp_path, monkeypatch):
+        module = tmp_path / "profiled_app.py"
+        module.write_text(
+            "from whiskey import Container\n"
+            "class Config:\n"
+            "    pass\n"
+            "container = Container()\n"
+            "container.singleton(Config)\n"
+            "def create_app():\n"
+            "    return container\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        yield "profiled_app"
+        sys.modules.pop("profiled_app", None)
+
+    def test_load_app(self, app_module):
+        """Test that Containers and factories are loaded as Whiskey applications."""
+        assert isinstance(load_app(f"{app_module}:container"), Whiskey)
+        assert isinstance(load_app(f"{app_module}:create_app"), Whiskey)
+        with pytest.raises(ValueError):
+            load_app(f"{app_module}:Config")
+
+    def test_profile_command_writes_reports(self, app_module, tmp_path, capsys):
+        """Test that the command prints a report and writes both export files."""
+        folded = tmp_path / "out.folded"
+        trace = tmp_path / "out.json"
+
+        code = main(
+            [
+                "profile",
+                f"{app_module}:container",
+                "--flamegraph",
+                str(folded),
+                "--trace",
+                str(trace),
+            ]
+        )
+
+        assert code == 0
+        assert "Config" in capsys.readouterr().out
+        assert folded.exists()
+        assert json.loads(trace.read_text())["traceEvents"]
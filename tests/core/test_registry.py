@@ -4,6 +4,9 @@ This module tests the service registration and metadata management system.
 """
 
 import os
+from abc import ABC, abstractmethod
+from collections.abc import Sized
+from typing import Protocol
 
 import pytest
 
@@ -37,6 +40,33 @@ async def async_test_factory() -> TestService:
     return TestService()
 
 
+class Repository(ABC):
+    @abstractmethod
+    def load(self, key: str): ...
+
+
+class SqlRepository(Repository):
+    def load(self, key: str):
+        return key
+
+
+class MemoryRepository(Repository):
+    def load(self, key: str):
+        return key
+
+
+class Closeable(Protocol):
+    def close(self) -> None: ...
+
+
+class Connection:
+    def close(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+
 class TestComponentDescriptor:
     """Test the ComponentDescriptor class."""
 
@@ -568,6 +598,71 @@ class TestComponentRegistry:
         assert not registry.has("env_based")
 
 
+class TestInterfaceIndex:
+    """Test lookups by base class, ABC and Protocol."""
+
+    @pytest.fixture
+    def registry(self):
+        return ComponentRegistry()
+
+    def test_get_all_includes_subclasses(self, registry):
+        """Test that components are found through their base classes."""
+        registry.register("sql", SqlRepository)
+        registry.register("memory", MemoryRepository)
+        registry.register("cache", CacheService)
+
+        assert [d.key for d in registry.get_all(Repository)] == ["sql", "memory"]
+        assert [d.key for d in registry.get_all(SqlRepository)] == ["sql"]
+        # find_by_type still matches the exact type only
+        assert registry.find_by_type(Repository) == []
+
+    def test_get_all_structural(self, registry):
+        """Test Protocols and virtual ABC subclasses without inheritance."""
+        registry.register("service", TestService)
+        registry.register("connection", Connection)
+
+        assert [d.key for d in registry.get_all(Closeable)] == ["connection"]
+        assert [d.key for d in registry.get_all(Sized)] == ["connection"]
+
+    def test_index_updates_incrementally(self, registry):
+        """Test that register, override and remove keep the index current."""
+        registry.get_all(Closeable)  # Build the lazy Protocol index first
+        registry.register("connection", Connection)
+        registry.register("sql", SqlRepository)
+
+        assert [d.key for d in registry.get_all(Closeable)] == ["connection"]
+
+        registry.register("sql", TestService, allow_override=True)
+        registry.remove("connection")
+
+        assert registry.get_all(Closeable) == []
+        assert registry.get_all(Repository) == []
+
+    def test_late_abc_registration(self, registry):
+        """Test that ABC.register() after a lookup is reflected by the next one."""
+
+        class Store(ABC):
+            pass
+
+        class DictStore:
+            pass
+
+        registry.register("store", DictStore)
+        assert registry.get_all(Store) == []
+        version = registry.interface_version(Store)
+
+        Store.register(DictStore)
+
+        assert [d.key for d in registry.get_all(Store)] == ["store"]
+        assert registry.interface_version(Store) > version
+
+    def test_get_all_respects_conditions(self, registry):
+        """Test that inactive components are not returned."""
+        registry.register("sql", SqlRepository, condition=lambda: False)
+
+        assert registry.get_all(Repository) == []
+
+
 class TestScope:
     """Test the Scope enum."""
 
@@ -56,6 +56,27 @@ class CircularB:
         self.a = a
 
 
+class CycleA:
+    """First class of a three-class cycle."""
+
+    def __init__(self, b: "CycleB"):
+        self.b = b
+
+
+class CycleB:
+    """Second class of a three-class cycle."""
+
+    def __init__(self, c: "CycleC"):
+        self.c = c
+
+
+class CycleC:
+    """Third class of a three-class cycle."""
+
+    def __init__(self, a: CycleA):
+        self.a = a
+
+
 async def async_factory() -> Database:
     """Async factory function."""
     await asyncio.sleep(0.001)
@@ -309,7 +330,7 @@ class TestScopeResolver:
         assert instance is not None
 
         # Clear scope
-        resolver.clear_scope("request")
+        resolver.clear_scope("request", active_scopes)
 
         # New resolution creates new instance
         instance2 = resolver.resolve_scoped("db", "request", factory, active_scopes)
@@ -496,5 +517,139 @@ class TestUnifiedResolver:
         assert result == context
 
 
+class TestResolutionPlans:
+    """Test compiled resolution plans."""
+
+    def test_plan_is_cached(self):
+        """Test that repeated lookups reuse the compiled plan."""
+        registry = ComponentRegistry()
+        registry.register(Database, Database)
+        registry.register(Service, Service)
+
+        resolver = create_resolver(registry)
+        plan = resolver.get_plan(Service)
+
+        assert resolver.get_plan(Service) is plan
+        assert [dep[0] for dep in plan.dependencies] == ["db", "cache"]
+        assert isinstance(resolver.resolve(Service), Service)
+
+    def test_plan_shared_across_keys(self):
+        """Test that a class key and its string key share one compiled plan."""
+        registry = ComponentRegistry()
+        registry.register(Database, Database)
+
+        resolver = create_resolver(registry)
+        calls = []
+        compile_plan = resolver.compile_plan
+
+        def counting_compile(descriptor, **kwargs):
+            calls.append(descriptor.key)
+            return compile_plan(descriptor, **kwargs)
+
+        resolver.compile_plan = counting_compile
+
+        assert resolver.get_plan("Database") is resolver.get_plan(Database)
+        assert calls == ["Database"]
+
+    def test_plan_invalidated_on_register(self):
+        """Test that registry changes invalidate compiled plans."""
+        registry = ComponentRegistry()
+        registry.register(Database, Database)
+        registry.register(Service, Service)
+
+        resolver = create_resolver(registry)
+        assert resolver.resolve(Service).cache is None
+
+        registry.register(Cache, Cache)
+
+        assert isinstance(resolver.resolve(Service).cache, Cache)
+
+    def test_plan_invalidated_on_remove(self):
+        """Test that removed components are no longer resolvable."""
+        registry = ComponentRegistry()
+        registry.register("test", lambda: "value")
+
+        resolver = create_resolver(registry)
+        assert resolver.resolve("test") == "value"
+
+        registry.remove("test")
+
+        with pytest.raises(ResolutionError):
+            resolver.resolve("test")
+
+    def test_dependency_condition_rechecked(self):
+        """Test that a bound dependency's dynamic condition is re-checked on each resolve."""
+        enabled = {"database": True}
+        registry = ComponentRegistry()
+        registry.register(Database, Database, condition=lambda: enabled["database"])
+        registry.register(Service, Service)
+
+        resolver = create_resolver(registry)
+        assert isinstance(resolver.resolve(Service).db, Database)
+
+        enabled["database"] = False
+
+        with pytest.raises(ResolutionError):
+            resolver.resolve(Service)
+
+
+@pytest.mark.unit
+class TestCycleDetection:
+    """Test static cycle validation and task-local cycle tracking."""
+
+    def test_cycle_reports_full_path(self):
+        """Test that a cycle is reported with every component on it."""
+        registry = ComponentRegistry()
+        registry.register(CycleA, CycleA)
+        registry.register(CycleB, CycleB)
+        registry.register(CycleC, CycleC)
+
+        resolver = create_resolver(registry)
+
+        with pytest.raises(CircularDependencyError) as exc_info:
+            resolver._resolve_sync(CycleB)
+
+        assert exc_info.value.cycle == [CycleB, CycleC, CycleA]
+        assert "CycleB → CycleC → CycleA → CycleB" in str(exc_info.value)
+
+    def test_validated_plans_are_not_tracked(self):
+        """Test that plans proven acyclic resolve without runtime tracking."""
+        registry = ComponentRegistry()
+        registry.register(Database, Database)
+        registry.register(Service, Service)
+
+        resolver = create_resolver(registry)
+        resolver._resolve_sync(Database)
+        plan = resolver.get_plan(Database)
+
+        assert plan.cycle_checked
+        assert not plan.track_cycles
+        # Optional dependencies are not validated statically
+        assert resolver.get_plan(Service).track_cycles
+
+    def test_factory_cycle_detected_at_runtime(self):
+        """Test that a factory resolving its own key fails as a cycle."""
+        registry = ComponentRegistry()
+        resolver = create_resolver(registry)
+
+        def make_database() -> Database:
+            return resolver._resolve_sync(Database)
+
+        registry.register(Database, make_database)
+
+        with pytest.raises(CircularDependencyError):
+            resolver._resolve_sync(Database)
+
+    async def test_interleaved_tasks_are_not_cycles(self):
+        """Test that concurrent tasks creating the same component do not collide."""
+        registry = ComponentRegistry()
+        registry.register(Database, async_factory)
+
+        resolver = create_resolver(registry)
+        instances = await asyncio.gather(*(resolver._resolve_async(Database) for _ in range(5)))
+
+        assert all(isinstance(instance, Database) for instance in instances)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
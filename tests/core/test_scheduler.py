@@ -0,0 +1,197 @@
+"""Tests for the periodic task scheduler."""
+
+import asyncio
+
+import pytest
+
+from whiskey import Whiskey
+from whiskey.core.scheduler import ScheduledTask, TaskScheduler
+
+
+@pytest.mark.unit
+class TestTaskScheduler:
+    """Test scheduling modes, overrun policies and metrics."""
+
+    async def test_fixed_rate_does_not_drift(self):
+        """Test that fixed-rate runs stay on the start + n * interval grid."""
+        loop = asyncio.get_running_loop()
+        scheduler = TaskScheduler()
+        starts = []
+
+        async def work():
+            starts.append(loop.time())
+            await asyncio.sleep(0.03)
+
+        scheduler.add(work, 0.05)
+        scheduler.start()
+        await asyncio.sleep(0.33)
+        await scheduler.stop()
+
+        offsets = [start - starts[0] for start in starts]
+        assert len(starts) >= 6
+        # Serial sleep-after-run would put run 6 at 6 * 0.08s
+        assert offsets[5] == pytest.approx(0.25, abs=0.03)
+
+    async def test_fixed_delay_waits_after_each_run(self):
+        """Test that fixed-delay runs start an interval after the previous finished."""
+        loop = asyncio.get_running_loop()
+        scheduler = TaskScheduler()
+        starts = []
+
+        async def work():
+            starts.append(loop.time())
+            await asyncio.sleep(0.03)
+
+        scheduler.add(work, 0.05, mode="fixed_delay")
+        scheduler.start()
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert gaps
+        assert all(gap >= 0.075 for gap in gaps)
+
+    async def test_overrun_skip_and_queue(self):
+        """Test that overrunning runs are skipped or queued by policy."""
+        scheduler = TaskScheduler()
+
+        async def slow():
+            await asyncio.sleep(0.09)
+
+        skipping = scheduler.add(slow, 0.02, name="skip")
+        queueing = scheduler.add(slow, 0.02, name="queue", overrun="queue", max_pending=20)
+        scheduler.start()
+        await asyncio.sleep(0.25)
+        await scheduler.stop()
+
+        stats = scheduler.stats()
+        assert skipping.skipped > 0
+        assert stats["skip"]["runs"] == 2
+        assert queueing.skipped == 0
+        assert stats["queue"]["max_lateness"] > 0.05
+        assert stats["queue"]["pending"] == 0  # Cleared by stop()
+
+    async def test_queue_is_capped(self):
+        """Test that at most max_pending overrun runs wait under the queue policy."""
+        scheduler = TaskScheduler()
+
+        async def slow():
+            await asyncio.sleep(0.1)
+
+        task = scheduler.add(slow, 0.01, overrun="queue", max_pending=2)
+        scheduler.start()
+        await asyncio.sleep(0.05)
+
+        assert len(task.pending) == 2
+        assert task.skipped > 0
+        await scheduler.stop()
+
+    async def test_failures_are_reported_and_schedule_continues(self):
+        """Test that a failing run is counted, reported and does not stop the task."""
+        errors = []
+
+        async def on_error(error):
+            errors.append(error)
+
+        scheduler = TaskScheduler(on_error=on_error)
+
+        def fail():
+            raise RuntimeError("tick failed")
+
+        task = scheduler.add(fail, 0.02)
+        scheduler.start()
+        await asyncio.sleep(0.07)
+        await scheduler.stop()
+
+        assert task.runs >= 3
+        assert task.failures == task.runs
+        assert len(errors) == task.runs
+
+    async def test_jitter_delays_runs(self):
+        """Test that jitter delays runs without exceeding its bound."""
+        scheduler = TaskScheduler()
+        task = scheduler.add(lambda: None, 0.05, jitter=0.02)
+        scheduler.start()
+        await asyncio.sleep(0.01)
+
+        assert task.runs == 0 or task.last_lateness < 0.02
+        await scheduler.stop()
+
+    def test_invalid_options(self):
+        """Test that invalid task options are rejected at registration."""
+        with pytest.raises(ValueError):
+            ScheduledTask(lambda: None, 0)
+        with pytest.raises(ValueError):
+            ScheduledTask(lambda: None, 1, mode="cron")
+        with pytest.raises(ValueError):
+            ScheduledTask(lambda: None, 1, overrun="block")
+        with pytest.raises(ValueError):
+            ScheduledTask(lambda: None, 1, jitter=-1)
+        with pytest.raises(ValueError):
+            ScheduledTask(lambda: None, 1, max_pending=0)
+
+
+@pytest.mark.unit
+class TestAppTasks:
+    """Test periodic tasks registered with @app.task."""
+
+    async def test_tasks_run_between_startup_and_shutdown(self):
+        """Test that tasks run while the app is up and stop at shutdown."""
+        app = Whiskey()
+        runs = []
+
+        @app.task(interval=0.02, name="ticker")
+        async def tick():
+            runs.append(1)
+
+        await app.startup()
+        await asyncio.sleep(0.07)
+        await app.shutdown()
+        count = len(runs)
+        await asyncio.sleep(0.05)
+
+        assert count >= 3
+        assert len(runs) == count
+        assert app.task_stats()["ticker"]["runs"] == count
+
+    async def test_task_parameters_are_injected(self):
+        """Test that task parameters are resolved from the container on each run."""
+        app = Whiskey()
+        received = []
+
+        class Cache:
+            pass
+
+        app.container.singleton(Cache)
+
+        @app.task(interval=0.02, jitter=0.005)
+        async def refresh(cache: Cache):
+            received.append(cache)
+
+        await app.startup()
+        await asyncio.sleep(0.05)
+        await app.shutdown()
+
+        stats = app.task_stats()["refresh"]
+        assert stats["runs"] >= 2
+        assert stats["failures"] == 0
+        assert all(isinstance(cache, Cache) for cache in received)
+
+    async def test_task_errors_are_emitted(self):
+        """Test that task errors reach the application's error handlers."""
+        app = Whiskey()
+        errors = []
+
+        @app.on_error
+        async def handle(error):
+            errors.append(error)
+
+        @app.task(interval=0.05)
+        async def broken():
+            raise ValueError("broken")
+
+        await app.startup()
+        await asyncio.sleep(0.02)
+        await app.shutdown()
+
+        assert [str(error) for error in errors] == ["broken"]
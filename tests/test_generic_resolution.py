@@ -258,6 +258,47 @@ class TestGenericTypeResolver:
         assert T in bindings
         assert bindings[T] == User
 
+    def test_discovery_memoized_until_origin_changes(self):
+        """Test that discovered implementations are memoized per parameterized type."""
+        from whiskey.core.registry import ComponentRegistry
+
+        registry = ComponentRegistry()
+        registry.register(UserRepository, UserRepository)
+        resolver = GenericTypeResolver(registry)
+        calls = []
+        discover = resolver._discover_implementation
+
+        def counting_discover(generic_type):
+            calls.append(generic_type)
+            return discover(generic_type)
+
+        resolver._discover_implementation = counting_discover
+
+        assert resolver.resolve_generic(Repository[User]) is UserRepository
+        assert resolver.resolve_generic(Repository[User]) is UserRepository
+        assert resolver.resolve_generic(Repository[Product]) is None
+        assert resolver.resolve_generic(Repository[Product]) is None
+        assert len(calls) == 2
+
+        # Unrelated registrations keep the memo
+        registry.register(User, User)
+        resolver.resolve_generic(Repository[Product])
+        assert len(calls) == 2
+
+        # A new implementation of the origin invalidates it
+        registry.register(ProductRepository, ProductRepository)
+        assert resolver.resolve_generic(Repository[Product]) is ProductRepository
+        assert len(calls) == 3
+
+    def test_register_concrete_invalidates_memo(self):
+        """Test that explicit mappings take effect after a memoized miss."""
+        resolver = GenericTypeResolver()
+        assert resolver.resolve_generic(Repository[Order]) is None
+
+        resolver.register_concrete(Repository[Order], UserRepository)
+
+        assert resolver.resolve_generic(Repository[Order]) is UserRepository
+
 
 @pytest.mark.unit
 class TestTypeParameterBinder:
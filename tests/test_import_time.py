@@ -0,0 +1,75 @@
+"""Test that importing whiskey stays cheap.
+
+Public names are exported lazily, so ``import whiskey`` must not pull in the
+container, resolver or asyncio machinery. The budget is checked with
+``python -X importtime`` in a fresh interpreter, counting only time spent in
+whiskey's own modules so that slow stdlib imports on CI don't cause flakes.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import whiskey
+
+# Self time of whiskey modules during `import whiskey`, in microseconds
+IMPORT_BUDGET_US = 20_000
+
+SRC_DIR = str(Path(whiskey.__file__).resolve().parents[1])
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": SRC_DIR}
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def whiskey_import_time() -> int:
+    """Microseconds spent in whiskey's own modules while importing whiskey."""
+    stderr = run_python("import whiskey", "-X", "importtime").stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        if name.strip().startswith("whiskey") and self_us.strip().isdigit():
+            total += int(self_us)
+    return total
+
+
+@pytest.mark.slow
+class TestImportTime:
+    """Test the cost of importing the top-level package."""
+
+    def test_import_within_budget(self):
+        """Test that `import whiskey` stays within its import-time budget."""
+        best = min(whiskey_import_time() for _ in range(3))
+        assert best < IMPORT_BUDGET_US, f"import whiskey took {best}us of whiskey code"
+
+    def test_import_defers_core_modules(self):
+        """Test that heavy modules load only when an export is first used."""
+        output = run_python(
+            "import sys, whiskey\n"
+            "print(sorted(m for m in ('asyncio', 'whiskey.core.container') if m in sys.modules))\n"
+            "whiskey.Container\n"
+            "print('whiskey.core.container' in sys.modules)\n"
+        ).stdout.split()
+
+        assert output == ["[]", "True"]
+
+    def test_lazy_exports_resolve(self):
+        """Test that every exported name is reachable and listed by dir()."""
+        for name in whiskey.__all__:
+            assert getattr(whiskey, name) is not None
+            assert name in dir(whiskey)
+
+        with pytest.raises(AttributeError):
+            whiskey.NotAnExport  # noqa: B018
@@ -191,6 +191,41 @@ class TestResolutionCaching:
         # But second should be faster due to cached injection plan
         assert second_time < first_time
 
+    def test_call_plan_compiled_once(self):
+        """Test that Container.call reuses a compiled plan instead of re-inspecting."""
+        container = Container()
+        container.singleton(SimpleService)
+
+        def handler(request_id: int, simple: SimpleService):
+            return request_id, simple
+
+        first = container.resolver.get_injection_plan(handler)
+        for i in range(10):
+            assert container.call_sync(handler, i)[0] == i
+        assert container.resolver.get_injection_plan(handler) is first
+
+        # Registry changes recompile the plan
+        container.singleton(ComplexService)
+        assert container.resolver.get_injection_plan(handler) is not first
+
+    def test_call_plans_do_not_keep_functions_alive(self):
+        """Test that cached analysis and plans are released with the function."""
+        import gc
+        import weakref
+
+        container = Container()
+        container.singleton(SimpleService)
+
+        def handler(simple: SimpleService):
+            return simple
+
+        container.call_sync(handler)
+        handler_ref = weakref.ref(handler)
+        del handler
+        gc.collect()
+
+        assert handler_ref() is None
+
     def test_concurrent_resolution_performance(self):
         """Test resolution performance under concurrent access."""
         container = Container()
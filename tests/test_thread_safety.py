@@ -184,6 +184,59 @@ class TestSingletonThreadSafety:
             f"Expected 1 instance, created {DatabaseConnection._instance_count}"
         )
 
+    @pytest.mark.asyncio
+    async def test_concurrent_async_factory_single_flight(self):
+        """Test that concurrent awaiters share one async factory invocation."""
+        container = Container()
+        calls = 0
+
+        async def create_connection() -> DatabaseConnection:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return object.__new__(DatabaseConnection)
+
+        container.singleton("connection", create_connection)
+
+        results = await asyncio.gather(
+            *[container.resolve_async("connection") for _ in range(10)]
+        )
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_async_singleton_factory_error_not_cached(self):
+        """Test that a failed async creation is retried by the next resolution."""
+        container = Container()
+        attempts = 0
+
+        async def flaky() -> object:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("boom")
+            return object()
+
+        container.singleton("flaky", flaky)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await container.resolve_async("flaky")
+
+        instance = await container.resolve_async("flaky")
+        assert instance is await container.resolve_async("flaky")
+        assert attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_singleton_offload_on_request(self):
+        """Test that sync singletons only use the executor when asked to."""
+        container = Container()
+        container.singleton("inline", lambda: threading.get_ident())
+        container.singleton("offloaded", lambda: threading.get_ident(), offload=True)
+
+        assert await container.resolve_async("inline") == threading.get_ident()
+        assert await container.resolve_async("offloaded") != threading.get_ident()
+
     def test_singleton_stress_test(self):
         """Stress test singleton creation under high concurrency."""
         DatabaseConnection.reset_counter()
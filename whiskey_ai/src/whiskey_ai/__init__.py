@@ -3,58 +3,99 @@
 import contextlib
 from typing import TYPE_CHECKING
 
-from .agents import (
-    Agent,
-    AnalysisAgent,
-    CodingAgent,
-    ConversationMemory,
-    LLMAgent,
-    ResearchAgent,
-)
-from .conversation import (
-    ChatSession,
-    Conversation,
-    ConversationManager,
-)
-from .extension import (
-    # Managers
-    AgentManager,
-    # OpenAI-compatible types
-    ChatCompletion,
-    ChatCompletionChunk,
-    Choice,
-    Delta,
-    Embedding,
-    EmbeddingResponse,
-    Function,
-    FunctionCall,
-    LLMClient,
-    Message,
-    ModelManager,
-    ResponseFormat,
-    StreamChoice,
-    Tool,
-    ToolCall,
-    ToolManager,
-    Usage,
-    # Extension
-    ai_extension,
-)
-from .providers import (
-    AnthropicClient,
-    MockLLMClient,
-    OpenAIClient,
-)
-from .tools import (
-    ToolExecutor,
-    calculate,
-    get_current_time,
-    web_search,
+from whiskey.core.exports import lazy_exports
+
+# Agents, provider clients and tools load on first access
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".agents": (
+            "Agent",
+            "AnalysisAgent",
+            "CodingAgent",
+            "ConversationMemory",
+            "LLMAgent",
+            "ResearchAgent",
+        ),
+        ".conversation": ("ChatSession", "Conversation", "ConversationManager"),
+        ".extension": (
+            "AgentManager",
+            "ChatCompletion",
+            "ChatCompletionChunk",
+            "Choice",
+            "Delta",
+            "Embedding",
+            "EmbeddingResponse",
+            "Function",
+            "FunctionCall",
+            "LLMClient",
+            "Message",
+            "ModelManager",
+            "ResponseFormat",
+            "StreamChoice",
+            "Tool",
+            "ToolCall",
+            "ToolManager",
+            "Usage",
+            "ai_extension",
+        ),
+        ".providers": ("AnthropicClient", "MockLLMClient", "OpenAIClient"),
+        ".tools": ("ToolExecutor", "calculate", "get_current_time", "web_search"),
+    },
 )
 
 if TYPE_CHECKING:
     from whiskey import Whiskey  # noqa: F401
 
+    from .agents import (
+        Agent,
+        AnalysisAgent,
+        CodingAgent,
+        ConversationMemory,
+        LLMAgent,
+        ResearchAgent,
+    )
+    from .conversation import (
+        ChatSession,
+        Conversation,
+        ConversationManager,
+    )
+    from .extension import (
+        # Managers
+        AgentManager,
+        # OpenAI-compatible types
+        ChatCompletion,
+        ChatCompletionChunk,
+        Choice,
+        Delta,
+        Embedding,
+        EmbeddingResponse,
+        Function,
+        FunctionCall,
+        LLMClient,
+        Message,
+        ModelManager,
+        ResponseFormat,
+        StreamChoice,
+        Tool,
+        ToolCall,
+        ToolManager,
+        Usage,
+        # Extension
+        ai_extension,
+    )
+    from .providers import (
+        AnthropicClient,
+        MockLLMClient,
+        OpenAIClient,
+    )
+    from .tools import (
+        ToolExecutor,
+        calculate,
+        get_current_time,
+        web_search,
+    )
+
 
 __all__ = [
     # Agents
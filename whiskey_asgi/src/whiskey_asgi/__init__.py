@@ -1,6 +1,19 @@
 """Whiskey ASGI extension - ASGI web framework integration."""
 
-from .extension import Request, WebSocket, asgi_extension
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# Imported on first access; see whiskey.core.exports
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".extension": ("Request", "WebSocket", "asgi_extension"),
+    },
+)
+
+if TYPE_CHECKING:
+    from .extension import Request, WebSocket, asgi_extension
 
 __all__ = [
     "Request",
@@ -4,26 +4,57 @@ Provides secure, flexible authentication and authorization capabilities
 for Whiskey applications with seamless DI integration.
 """
 
-from whiskey_auth.core import (
-    AuthenticationError,
-    AuthorizationError,
-    AuthProvider,
-    CurrentUser,
-    Permission,
-    Role,
-    User,
-)
-from whiskey_auth.decorators import requires_auth, requires_permission, requires_role
-from whiskey_auth.extension import auth_extension
-from whiskey_auth.password import PasswordHasher
-from whiskey_auth.testing import (
-    AuthTestClient,
-    AuthTestContainer,
-    MockAuthProvider,
-    TestUser,
-    create_test_user,
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# Lazy so that argon2, PyJWT and the pytest helpers load only when used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "whiskey_auth.core": (
+            "AuthenticationError",
+            "AuthorizationError",
+            "AuthProvider",
+            "CurrentUser",
+            "Permission",
+            "Role",
+            "User",
+        ),
+        "whiskey_auth.decorators": ("requires_auth", "requires_permission", "requires_role"),
+        "whiskey_auth.extension": ("auth_extension",),
+        "whiskey_auth.password": ("PasswordHasher",),
+        "whiskey_auth.testing": (
+            "AuthTestClient",
+            "AuthTestContainer",
+            "MockAuthProvider",
+            "TestUser",
+            "create_test_user",
+        ),
+    },
 )
 
+if TYPE_CHECKING:
+    from whiskey_auth.core import (
+        AuthenticationError,
+        AuthorizationError,
+        AuthProvider,
+        CurrentUser,
+        Permission,
+        Role,
+        User,
+    )
+    from whiskey_auth.decorators import requires_auth, requires_permission, requires_role
+    from whiskey_auth.extension import auth_extension
+    from whiskey_auth.password import PasswordHasher
+    from whiskey_auth.testing import (
+        AuthTestClient,
+        AuthTestContainer,
+        MockAuthProvider,
+        TestUser,
+        create_test_user,
+    )
+
 __all__ = [
     "AuthProvider",
     "AuthTestClient",
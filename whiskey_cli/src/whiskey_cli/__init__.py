@@ -1,6 +1,19 @@
 """Whiskey CLI extension - Natural CLI creation with IoC."""
 
-from .extension import cli_extension
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# click is imported with the extension module, on first access
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".extension": ("cli_extension",),
+    },
+)
+
+if TYPE_CHECKING:
+    from .extension import cli_extension
 
 __all__ = [
     "cli_extension",
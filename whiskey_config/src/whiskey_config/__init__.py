@@ -1,9 +1,25 @@
 """Whiskey configuration management extension."""
 
-from .extension import config_extension
-from .manager import ConfigurationManager
-from .providers import Setting
-from .schema import ConfigurationError
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# Imported on first access; see whiskey.core.exports
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".extension": ("config_extension",),
+        ".manager": ("ConfigurationManager",),
+        ".providers": ("Setting",),
+        ".schema": ("ConfigurationError",),
+    },
+)
+
+if TYPE_CHECKING:
+    from .extension import config_extension
+    from .manager import ConfigurationManager
+    from .providers import Setting
+    from .schema import ConfigurationError
 
 __all__ = [
     "ConfigurationError",
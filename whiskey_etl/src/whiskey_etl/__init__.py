@@ -1,59 +1,136 @@
 """Whiskey ETL - Declarative data pipeline extension for Whiskey DI framework."""
 
-from whiskey_etl.db_sink import BulkUpdateSink, DatabaseSink, SQLExecuteSink, TableSink, UpsertSink
-from whiskey_etl.db_source import DatabaseSource, QuerySource, SQLFileSource, TableSource
-from whiskey_etl.extension import etl_extension
-from whiskey_etl.object_store_sink import AzureBlobSink, GCSSink, ObjectStoreSink, S3Sink
-from whiskey_etl.object_store_source import (
-    AzureBlobSource,
-    GCSSource,
-    ObjectStoreSource,
-    S3Source,
-    csv_processor,
-    json_processor,
-    jsonl_processor,
-)
-from whiskey_etl.pipeline import Pipeline, PipelineResult, PipelineState
-from whiskey_etl.sinks import DataSink
-from whiskey_etl.sources import DataSource
-from whiskey_etl.sql_transform import (
-    AggregateTransform,
-    JoinTransform,
-    LookupTransform,
-    SQLTransform,
-    ValidateTransform,
-    create_aggregate_transform,
-    create_join_transform,
-    create_lookup_transform,
-    create_sql_transform,
-    create_validate_transform,
-)
-from whiskey_etl.validation import (
-    ChoiceValidator,
-    CompositeValidator,
-    CustomValidator,
-    DateValidator,
-    EmailValidator,
-    LengthValidator,
-    PatternValidator,
-    RangeValidator,
-    RecordValidator,
-    RequiredValidator,
-    TypeValidator,
-    UniqueValidator,
-    ValidationBuilder,
-    ValidationMode,
-    ValidationResult,
-    Validator,
-    create_validation_transform,
-    validation_transform,
-)
-from whiskey_etl.validation_reporting import (
-    ValidationQuarantine,
-    ValidationReport,
-    ValidationReporter,
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# Sources, sinks and transforms load on first access, with their backends
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "whiskey_etl.db_sink": (
+            "BulkUpdateSink",
+            "DatabaseSink",
+            "SQLExecuteSink",
+            "TableSink",
+            "UpsertSink",
+        ),
+        "whiskey_etl.db_source": ("DatabaseSource", "QuerySource", "SQLFileSource", "TableSource"),
+        "whiskey_etl.extension": ("etl_extension",),
+        "whiskey_etl.object_store_sink": ("AzureBlobSink", "GCSSink", "ObjectStoreSink", "S3Sink"),
+        "whiskey_etl.object_store_source": (
+            "AzureBlobSource",
+            "GCSSource",
+            "ObjectStoreSource",
+            "S3Source",
+            "csv_processor",
+            "json_processor",
+            "jsonl_processor",
+        ),
+        "whiskey_etl.pipeline": ("Pipeline", "PipelineResult", "PipelineState"),
+        "whiskey_etl.sinks": ("DataSink",),
+        "whiskey_etl.sources": ("DataSource",),
+        "whiskey_etl.sql_transform": (
+            "AggregateTransform",
+            "JoinTransform",
+            "LookupTransform",
+            "SQLTransform",
+            "ValidateTransform",
+            "create_aggregate_transform",
+            "create_join_transform",
+            "create_lookup_transform",
+            "create_sql_transform",
+            "create_validate_transform",
+        ),
+        "whiskey_etl.validation": (
+            "ChoiceValidator",
+            "CompositeValidator",
+            "CustomValidator",
+            "DateValidator",
+            "EmailValidator",
+            "LengthValidator",
+            "PatternValidator",
+            "RangeValidator",
+            "RecordValidator",
+            "RequiredValidator",
+            "TypeValidator",
+            "UniqueValidator",
+            "ValidationBuilder",
+            "ValidationMode",
+            "ValidationResult",
+            "Validator",
+            "create_validation_transform",
+            "validation_transform",
+        ),
+        "whiskey_etl.validation_reporting": (
+            "ValidationQuarantine",
+            "ValidationReport",
+            "ValidationReporter",
+        ),
+    },
 )
 
+if TYPE_CHECKING:
+    from whiskey_etl.db_sink import (
+        BulkUpdateSink,
+        DatabaseSink,
+        SQLExecuteSink,
+        TableSink,
+        UpsertSink,
+    )
+    from whiskey_etl.db_source import DatabaseSource, QuerySource, SQLFileSource, TableSource
+    from whiskey_etl.extension import etl_extension
+    from whiskey_etl.object_store_sink import AzureBlobSink, GCSSink, ObjectStoreSink, S3Sink
+    from whiskey_etl.object_store_source import (
+        AzureBlobSource,
+        GCSSource,
+        ObjectStoreSource,
+        S3Source,
+        csv_processor,
+        json_processor,
+        jsonl_processor,
+    )
+    from whiskey_etl.pipeline import Pipeline, PipelineResult, PipelineState
+    from whiskey_etl.sinks import DataSink
+    from whiskey_etl.sources import DataSource
+    from whiskey_etl.sql_transform import (
+        AggregateTransform,
+        JoinTransform,
+        LookupTransform,
+        SQLTransform,
+        ValidateTransform,
+        create_aggregate_transform,
+        create_join_transform,
+        create_lookup_transform,
+        create_sql_transform,
+        create_validate_transform,
+    )
+    from whiskey_etl.validation import (
+        ChoiceValidator,
+        CompositeValidator,
+        CustomValidator,
+        DateValidator,
+        EmailValidator,
+        LengthValidator,
+        PatternValidator,
+        RangeValidator,
+        RecordValidator,
+        RequiredValidator,
+        TypeValidator,
+        UniqueValidator,
+        ValidationBuilder,
+        ValidationMode,
+        ValidationResult,
+        Validator,
+        create_validation_transform,
+        validation_transform,
+    )
+    from whiskey_etl.validation_reporting import (
+        ValidationQuarantine,
+        ValidationReport,
+        ValidationReporter,
+    )
+
 __version__ = "0.1.0"
 __all__ = [
     "etl_extension",
@@ -75,16 +75,37 @@ See Also:
     - HTTPClient: Protocol for client implementations
 """
 
-from .extension import http_extension
-from .types import (
-    CircuitBreakerConfig,
-    HTTPClient,
-    HTTPClientConfig,
-    RequestInterceptor,
-    ResponseInterceptor,
-    RetryConfig,
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# httpx is imported with the extension module, on first access
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".extension": ("http_extension",),
+        ".types": (
+            "CircuitBreakerConfig",
+            "HTTPClient",
+            "HTTPClientConfig",
+            "RequestInterceptor",
+            "ResponseInterceptor",
+            "RetryConfig",
+        ),
+    },
 )
 
+if TYPE_CHECKING:
+    from .extension import http_extension
+    from .types import (
+        CircuitBreakerConfig,
+        HTTPClient,
+        HTTPClientConfig,
+        RequestInterceptor,
+        ResponseInterceptor,
+        RetryConfig,
+    )
+
 __all__ = [
     "CircuitBreakerConfig",
     "HTTPClient",
@@ -8,13 +8,32 @@ This extension provides:
 - Job monitoring and metrics
 """
 
-from .extension import configure_jobs, jobs_extension
-from .job import Job, JobResult, JobStatus
-from .manager import JobManager
-from .queue import JobQueue, PriorityQueue
-from .scheduler import JobScheduler
-from .types import JobPriority
-from .worker import JobWorker
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# Imported on first access; see whiskey.core.exports
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".extension": ("configure_jobs", "jobs_extension"),
+        ".job": ("Job", "JobResult", "JobStatus"),
+        ".manager": ("JobManager",),
+        ".queue": ("JobQueue", "PriorityQueue"),
+        ".scheduler": ("JobScheduler",),
+        ".types": ("JobPriority",),
+        ".worker": ("JobWorker",),
+    },
+)
+
+if TYPE_CHECKING:
+    from .extension import configure_jobs, jobs_extension
+    from .job import Job, JobResult, JobStatus
+    from .manager import JobManager
+    from .queue import JobQueue, PriorityQueue
+    from .scheduler import JobScheduler
+    from .types import JobPriority
+    from .worker import JobWorker
 
 __all__ = [
     "jobs_extension",
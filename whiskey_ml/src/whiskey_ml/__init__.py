@@ -1,18 +1,41 @@
 """Whiskey ML - Declarative machine learning extension for Whiskey framework."""
 
-from whiskey_ml.core.dataset import DataLoader, Dataset, DatasetConfig
-from whiskey_ml.core.metrics import Metric, MetricCollection, MetricResult
-from whiskey_ml.core.model import Model, ModelConfig, ModelOutput
-from whiskey_ml.core.pipeline import MLPipeline, PipelineConfig, PipelineState
+from typing import TYPE_CHECKING
 
-# ML scopes are managed using Whiskey's built-in scope system
-# Use app.container.scope("scope_name") context managers
-from whiskey_ml.core.trainer import Trainer, TrainerConfig, TrainingResult
-from whiskey_ml.extension import ml_extension
-from whiskey_ml.integrations.base import MLContext
+from whiskey.core.exports import lazy_exports
 
-# Optional visualization imports
-try:
+# numpy and the training stack load on first access to these names
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "whiskey_ml.core.dataset": ("DataLoader", "Dataset", "DatasetConfig"),
+        "whiskey_ml.core.metrics": ("Metric", "MetricCollection", "MetricResult"),
+        "whiskey_ml.core.model": ("Model", "ModelConfig", "ModelOutput"),
+        "whiskey_ml.core.pipeline": ("MLPipeline", "PipelineConfig", "PipelineState"),
+        "whiskey_ml.core.trainer": ("Trainer", "TrainerConfig", "TrainingResult"),
+        "whiskey_ml.extension": ("ml_extension",),
+        "whiskey_ml.integrations.base": ("MLContext",),
+        "whiskey_ml.visualization": (
+            "ConsoleMetricsHandler",
+            "MetricsTracker",
+            "ProgressTracker",
+            "RichProgressHandler",
+            "TensorBoardHandler",
+        ),
+    },
+)
+
+if TYPE_CHECKING:
+    from whiskey_ml.core.dataset import DataLoader, Dataset, DatasetConfig
+    from whiskey_ml.core.metrics import Metric, MetricCollection, MetricResult
+    from whiskey_ml.core.model import Model, ModelConfig, ModelOutput
+    from whiskey_ml.core.pipeline import MLPipeline, PipelineConfig, PipelineState
+
+    # ML scopes are managed using Whiskey's built-in scope system
+    # Use app.container.scope("scope_name") context managers
+    from whiskey_ml.core.trainer import Trainer, TrainerConfig, TrainingResult
+    from whiskey_ml.extension import ml_extension
+    from whiskey_ml.integrations.base import MLContext
     from whiskey_ml.visualization import (
         ConsoleMetricsHandler,
         MetricsTracker,
@@ -21,10 +44,6 @@ try:
         TensorBoardHandler,
     )
 
-    _has_visualization = True
-except ImportError:
-    _has_visualization = False
-
 __version__ = "0.1.0"
 
 __all__ = [
@@ -47,18 +66,12 @@ __all__ = [
     "Metric",
     "MetricCollection",
     "MetricResult",
+    # Visualization
+    "MetricsTracker",
+    "ConsoleMetricsHandler",
+    "ProgressTracker",
+    "RichProgressHandler",
+    "TensorBoardHandler",
     # Note: ML scopes use Whiskey's built-in scope system
     # Use app.container.scope("experiment"), app.container.scope("training"), etc.
 ]
-
-# Add visualization exports if available
-if _has_visualization:
-    __all__.extend(
-        [
-            "MetricsTracker",
-            "ConsoleMetricsHandler",
-            "ProgressTracker",
-            "RichProgressHandler",
-            "TensorBoardHandler",
-        ]
-    )
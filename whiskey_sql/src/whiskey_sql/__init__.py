@@ -1,14 +1,35 @@
 """Whiskey SQL Extension - Pure SQL templating for Whiskey applications."""
 
-from whiskey_sql.core import SQL, Database, transaction
-from whiskey_sql.exceptions import (
-    DatabaseConnectionError,
-    DatabaseError,
-    QueryError,
-    TransactionError,
+from typing import TYPE_CHECKING
+
+from whiskey.core.exports import lazy_exports
+
+# Database backends load on first access to the names that need them
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "whiskey_sql.core": ("SQL", "Database", "transaction"),
+        "whiskey_sql.exceptions": (
+            "DatabaseConnectionError",
+            "DatabaseError",
+            "QueryError",
+            "TransactionError",
+        ),
+        "whiskey_sql.extension": ("sql_extension",),
+        "whiskey_sql.types": ("ResultType", "Row"),
+    },
 )
-from whiskey_sql.extension import sql_extension
-from whiskey_sql.types import ResultType, Row
+
+if TYPE_CHECKING:
+    from whiskey_sql.core import SQL, Database, transaction
+    from whiskey_sql.exceptions import (
+        DatabaseConnectionError,
+        DatabaseError,
+        QueryError,
+        TransactionError,
+    )
+    from whiskey_sql.extension import sql_extension
+    from whiskey_sql.types import ResultType, Row
 
 __version__ = "0.1.0"
 